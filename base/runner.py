@@ -30,6 +30,8 @@ class Runner:
 # concurrent.futures is new in Python 3.2.
 from concurrent.futures import ThreadPoolExecutor, Future
 
+from dltb.base import mark_runner_thread
+
 class AsyncRunner(Runner):
     """Base class for asynchronous runner objects.
 
@@ -61,7 +63,8 @@ class AsyncRunner(Runner):
         self._submitted = 0
         self._completed = 0
         self._executor = ThreadPoolExecutor(max_workers=4,
-                                            thread_name_prefix='runner')
+                                            thread_name_prefix='runner',
+                                            initializer=mark_runner_thread)
 
     def runTask(self, fn, *args, **kwargs) -> None:
         """Schedule the execution of a function.
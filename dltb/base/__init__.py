@@ -10,8 +10,37 @@ from .observer import Observable
 from .prepare import Preparable
 
 
-_executor: ThreadPoolExecutor = \
-    ThreadPoolExecutor(max_workers=4, thread_name_prefix='runner')
+# The executor used by the `@run` decorator. It is created on
+# first use, so that no threads are started unless needed.
+_executor: ThreadPoolExecutor = None
+_executor_lock = threading.Lock()
+
+# Thread local data, used to mark the threads of the executor
+_thread_local = threading.local()
+
+
+def mark_runner_thread() -> None:
+    """Mark the current thread as runner thread.  Functions decorated
+    by `@run` will not start another thread when called from a
+    runner thread.  Intended as `initializer` for a
+    :py:class:`ThreadPoolExecutor`.
+    """
+    _thread_local.runner = True
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the executor used to run functions in the background,
+    creating it if necessary.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = \
+                    ThreadPoolExecutor(max_workers=4,
+                                       thread_name_prefix='runner',
+                                       initializer=mark_runner_thread)
+    return _executor
 
 
 def get_default_run(run: bool = None) -> bool:
@@ -21,13 +50,12 @@ def get_default_run(run: bool = None) -> bool:
 
     # We usually do not want to spawn a new thread when
     # already executing some thread.
-    current_thread = threading.currentThread()
-    if current_thread.getName().startswith('runner'):
+    if getattr(_thread_local, 'runner', False):
         return False
 
     # Finally, if the current thread is the event loop of some
     # graphical user interface, we choose to run in the background
-    return getattr(current_thread, 'GUI_event_loop', False)
+    return getattr(threading.current_thread(), 'GUI_event_loop', False)
 
 
 def run(function):
@@ -39,7 +67,7 @@ def run(function):
 
     def wrapper(self, *args, run: bool = False, **kwargs):
         if get_default_run(run):
-            _executor.submit(function, self, *args, **kwargs)
+            _get_executor().submit(function, self, *args, **kwargs)
         else:
             function(self, *args, **kwargs)
 
@@ -92,11 +92,9 @@ class BusyObservable(FailableObservable, method='busy_changed',
         """
         if message != self._busy:
             LOG.debug("busy: new message: '%s' -> '%s'", self._busy, message)
-            change = self.Change('busy_changed')
-            if (self._busy is None) != (message is None):
-                change.add('state_changed')
+            state_changed = (self._busy is None) != (message is None)
             self._busy = message
-            self.notify_observers(change)
+            self.change('busy_changed', state_changed=state_changed)
 
     def busy_start(self, message: str):
         """Start some business.
@@ -87,6 +87,11 @@ class DataDict(Data):
     the same size). Whether a data attribute is batch or global has to
     be specified when the attribute is added to the data object.
 
+    Batch attributes are stored attribute-wise, that is as one
+    collection holding the values for all batch items.  Where possible
+    (e.g., for the data array or for numerical labels), this
+    collection should be a numpy array with the batch axis first.
+
 
     Attributes
     ----------
@@ -185,7 +190,10 @@ class DataDict(Data):
                                  f"to batch attribute '{attr}' "
                                  f"of length {len(self)}")
         super().__setattr__(attr, val)
-        self.notify_observers(self.Change('data_changed'), attribute=attr)
+        if self._observers:
+            # only construct a Change object if someone is listening
+            self.notify_observers(self.Change('data_changed'),
+                                  attribute=attr)
 
     @property
     def is_batch(self) -> bool:
@@ -232,6 +240,24 @@ class DataDict(Data):
                 value = [value] * len(self)
             setattr(self, name, value)
 
+    def add_attributes(self, **attributes) -> None:
+        """Add multiple global (non-batch) attributes with values to
+        this :py:class:`Data` in one step.  This is equivalent to
+        calling :py:meth:`add_attribute` for each of them, but avoids
+        the per attribute overhead.
+
+        Parameters
+        ----------
+        attributes:
+            The names and values of the new attributes.
+        """
+        self._attributes.update(dict.fromkeys(attributes, False))
+        self.__dict__.update(attributes)
+        if self._observers:
+            for name in attributes:
+                self.notify_observers(self.Change('data_changed'),
+                                      attribute=name)
+
     def attributes(self, batch: bool = None) -> Iterable[str]:
         """A view on the attributes of this :py:class:`Data`.
 
@@ -310,15 +336,18 @@ class BatchDataItem(Data):
         return hasattr(self._data, 'array') and self.array is not None
 
     def __getattr__(self, attr) -> Any:
-        if attr.startswith('_'):
+        if attr[0] == '_':
             raise AttributeError(f"BatchDataItem has no attribute '{attr}'")
         if self._data.is_batch_attribute(attr):
             return getattr(self._data, attr)[self._index]
         return getattr(self._data, attr)
 
     def __setattr__(self, attr, val) -> None:
-        if attr.startswith('_'):
-            super().__setattr__(attr, val)
+        if attr[0] == '_':
+            # private attributes are set when creating the item
+            # (which happens for every item of a batch), so take the
+            # shortest path, skipping the checks of the superclasses
+            object.__setattr__(self, attr, val)
         elif self._data.is_batch_attribute(attr):
             getattr(self._data, attr)[self._index] = val
         else:
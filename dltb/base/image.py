@@ -20,10 +20,13 @@ Relation to other `image` modules in the Deep Learning ToolBox:
 """
 
 # standard imports
-from typing import Union, List, Tuple, Dict, Any
+from typing import Union, List, Tuple, Dict, Any, Iterable
 from abc import abstractmethod, ABC
 from collections import namedtuple
+from collections.abc import Sized
 from enum import Enum
+from functools import lru_cache
+import os
 import threading
 import logging
 import time
@@ -70,6 +73,42 @@ Imagelike = Union[np.ndarray, str]
 Size = namedtuple('Size', ['width', 'height'])
 
 
+# The module `dltb.util.image` (providing imread, imwrite, etc.)
+# imports this module, so it can not be imported at module level here.
+# It is imported on first use and then kept in this variable.
+_util_image = None
+
+# Value ranges assumed for float images to be displayed: values in the
+# unit range (as also assumed by matplotlib) or byte values (0 to 255).
+_FLOAT_RANGE_UNIT = (0., 1.)
+_FLOAT_RANGE_BYTE = (0., 255.)
+
+
+def _get_util_image():
+    """Get the :py:mod:`dltb.util.image` module.
+    """
+    global _util_image
+    if _util_image is None:
+        # pylint: disable=import-outside-toplevel
+        from ..util import image as util_image
+        _util_image = util_image
+    return _util_image
+
+
+@lru_cache(maxsize=16)
+def _imread_cached(filename: str, mtime: int, size: int) -> np.ndarray:
+    """Read an image file, caching the result.  Modification time and
+    size of the file are part of the cache key, so that changed
+    files are read again.  The image is returned as read-only array,
+    as it is shared by all callers (who should copy it).
+    """
+    # pylint: disable=unused-argument
+    LOG.debug("Loading image '%s' using imread.", filename)
+    image = _get_util_image().imread(filename)
+    image.setflags(write=False)
+    return image
+
+
 class Colorspace(Enum):
     """Enumeration of potential colorspace for representing images.
     """
@@ -78,38 +117,83 @@ class Colorspace(Enum):
     HSV = 3
 
 
+def _rgb_to_hsv(rgb: np.ndarray) -> np.ndarray:
+    """Convert an RGB image into the HSV colorspace.
+
+    Arguments
+    ---------
+    rgb:
+        The RGB image, either of integer type (values from 0 to 255)
+        or of float type (values from 0.0 to 1.0).  An alpha channel
+        (RGBA) is ignored.
+
+    Result
+    ------
+    hsv:
+        The HSV image of type `float32`, with all channels (hue,
+        saturation, and value) ranging from 0.0 to 1.0.
+    """
+    rgb = rgb[..., :3]
+    hsv = np.empty(rgb.shape, dtype=np.float32)
+    red, green, blue = (rgb[..., channel].astype(np.float32)
+                        for channel in range(3))
+    if np.issubdtype(rgb.dtype, np.integer):
+        for channel in (red, green, blue):
+            channel /= 255.
+    # operate in place on the output channels to avoid temporaries
+    hue, saturation, value = (hsv[..., channel] for channel in range(3))
+    np.maximum(red, green, out=value)
+    np.maximum(value, blue, out=value)
+    delta = np.minimum(red, green)
+    np.minimum(delta, blue, out=delta)
+    np.subtract(value, delta, out=delta)
+    saturation[...] = 0.
+    np.divide(delta, value, out=saturation, where=value > 0)
+    chroma = delta > 0
+    hue[...] = 0.
+    # the maximal channel determines the sector of the hue
+    is_red = chroma & (value == red)
+    is_green = chroma & (value == green) & ~is_red
+    is_blue = chroma & ~is_red & ~is_green
+    hue[is_red] = (green[is_red] - blue[is_red]) / delta[is_red]
+    hue[is_green] = 2. + (blue[is_green] - red[is_green]) / delta[is_green]
+    hue[is_blue] = 4. + (red[is_blue] - green[is_blue]) / delta[is_blue]
+    hue /= 6.
+    hue %= 1.
+    return hsv
+
+
 class Format:
     # pylint: disable=too-few-public-methods
     """Data structure for representing image format. This includes
     the datatype of the image, colorspace, and min and max values.
     It may also include an image size.
-    """
-    dtype = np.uint8
-    colorspace = Colorspace.RGB
-    _min_value = None
-    _max_value = None
-
-    size: Size = None
 
-    @property
-    def min_value(self) -> Union[int, float]:
-        """The minimal possible pixel value in an image.
-        """
-        if self._min_value is not None:
-            return self._min_value
-        if issubclass(self.dtype, (int, np.integer)):
-            return 0
-        return 0.0
+    Attributes
+    ----------
+    min_value: Union[int, float]
+        The minimal possible pixel value in an image.
+    max_value: Union[int, float]
+        The maximal possible pixel value in an image.
 
-    @property
-    def max_value(self) -> Union[int, float]:
-        """The minimal possible pixel value in an image.
-        """
-        if self._max_value is not None:
-            return self._max_value
-        if issubclass(self.dtype, (int, np.integer)):
-            return 255
-        return 1.0
+    If not given explicitly, min and max values are determined from
+    the datatype when the :py:class:`Format` is created.
+    """
+    __slots__ = ('dtype', 'colorspace', 'size', 'min_value', 'max_value')
+
+    def __init__(self, dtype=np.uint8, colorspace: Colorspace = Colorspace.RGB,
+                 size: Size = None, min_value: Union[int, float] = None,
+                 max_value: Union[int, float] = None) -> None:
+        self.dtype = dtype
+        self.colorspace = colorspace
+        self.size = size
+        integer = np.issubdtype(dtype, np.integer)
+        if min_value is None:
+            min_value = 0 if integer else 0.0
+        if max_value is None:
+            max_value = 255 if integer else 1.0
+        self.min_value = min_value
+        self.max_value = max_value
 
 
 class Image(DataDict):
@@ -127,6 +211,9 @@ class Image(DataDict):
         ]
     }
 
+    # converters to array, resolved for concrete types (filled on demand)
+    _array_converters: Dict[type, Any] = {}
+
     @classmethod
     def add_converter(cls, source: type, converter,
                       target: str = 'image') -> None:
@@ -148,11 +235,67 @@ class Image(DataDict):
         # FIXME[todo]: make this more flexible, use introspection,
         # get rid off the copy parameter, deal with other arguments
         cls.converters[target].append((source, converter))
+        Image._array_converters.clear()
+
+    # functions converting an RGB(A) array into another colorspace
+    _colorspace_converters: Dict[Colorspace, Any] = {}
+
+    @classmethod
+    def add_colorspace_converter(cls, colorspace: Colorspace,
+                                 converter) -> None:
+        """Register a function for converting RGB images into
+        another colorspace, replacing the builtin numpy conversion
+        used by :py:meth:`as_array`.
+
+        Arguments
+        ---------
+        colorspace:
+            The target colorspace of the converter.
+        converter:
+            A function taking an RGB(A) array and returning a new,
+            contiguous array in the target colorspace, or `None`
+            if it can not handle that array (in which case the
+            builtin conversion is used).
+        """
+        cls._colorspace_converters[colorspace] = converter
+
+    @classmethod
+    def _array_converter(cls, source: type):
+        """Get the converter to array for a given type. The converter
+        is looked up in :py:attr:`converters` (first match) and then
+        remembered for that type.
+
+        Result
+        ------
+        converter:
+            The converter or `None` if there is no converter for
+            that type.
+        """
+        try:
+            return cls._array_converters[source]
+        except KeyError:
+            pass
+        for source_class, converter in cls.converters['array']:
+            if issubclass(source, source_class):
+                break
+        else:
+            converter = None
+        cls._array_converters[source] = converter
+        return converter
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the cache of images read from files by
+        :py:meth:`as_array`.
+        """
+        _imread_cached.cache_clear()
 
     @classmethod
     def as_array(cls, image: Imagelike, copy: bool = False,
                  dtype=None,  # FIXME[todo]: not implemented yet
-                 colorspace: Colorspace = None) -> np.ndarray:
+                 colorspace: Colorspace = None,
+                 contiguous: bool = False,
+                 normalize_from: Tuple[float, float] = None) -> np.ndarray:
         """Get image-like object as numpy array. This may
         act as the identity function in case `image` is already
         an array, or it may extract the relevant property, or
@@ -171,22 +314,43 @@ class Image(DataDict):
             The colorspace in which the pixels in the resulting
             array are encoded.  If no colorspace is given, or
             if the colorspace of the input image Image is unknown,
-            no color conversion is performed.
+            no color conversion is performed.  `Colorspace.BGR`
+            reverses the channel order of an RGB image (as expected
+            by OpenCV and Caffe-style models).  `Colorspace.HSV`
+            results in float values from 0.0 to 1.0.
+        contiguous: bool
+            A flag indicating that the result should be a C-contiguous
+            array (not a view with arbitrary strides).  If data have
+            to be copied anyhow, the copy will be contiguous.
+        normalize_from: Tuple[float, float]
+            The value range `(min, max)` of a float image.  If given
+            and an integer `dtype` is requested, float values are
+            linearly mapped from that range onto the range of the
+            integer type (values outside are clipped), instead of
+            just casting them.
         """
-        for source_class, converter in cls.converters['array']:
-            if isinstance(image, source_class):
-                LOG.debug("Using image converter for type %s (copy=%s)",
-                          type(image), copy)
-                image, copy = converter(image, copy)
-                break
+        if (isinstance(image, np.ndarray) and not copy and
+                colorspace is None and
+                (dtype is None or dtype == image.dtype) and
+                (not contiguous or image.flags.c_contiguous)):
+            return image  # nothing to do
+
+        converter = cls._array_converter(type(image))
+        if converter is not None:
+            LOG.debug("Using image converter for type %s (copy=%s)",
+                      type(image), copy)
+            image, copy = converter(image, copy)
         else:
-            if isinstance(image, str):
-                # FIXME[hack]: local imports to avoid circular module
-                # dependencies ...
-                # pylint: disable=import-outside-toplevel
-                from dltb.util.image import imread
+            if isinstance(image, str) and os.path.isfile(image):
+                # hand out a copy of the cached image, as callers
+                # expect a fresh (writable) array from a filename
+                stat = os.stat(image)
+                image = _imread_cached(image, stat.st_mtime_ns,
+                                       stat.st_size).copy()
+                copy = False
+            elif isinstance(image, str):
                 LOG.debug("Loading image '%s' using imread.", image)
-                image, copy = imread(image), False
+                image, copy = _get_util_image().imread(image), False
             else:
                 raise NotImplementedError(f"Conversion of "
                                           f"{type(image).__module__}"
@@ -195,26 +359,133 @@ class Image(DataDict):
         LOG.debug("Obtained image of shape %s, dtype=%s.",
                   image.shape, image.dtype)
 
-        if colorspace == Colorspace.RGB:
-            if len(image.shape) == 2:  # grayscale image
-                rgb = np.empty(image.shape + (3,), dtype=image.dtype)
-                rgb[:, :, :] = image[:, :, np.newaxis]
-                image = rgb
-                copy = False
-            elif len(image.shape) == 3 and image.shape[2] == 4:  # RGBD
+        if (colorspace in (Colorspace.RGB, Colorspace.BGR, Colorspace.HSV) and
+                len(image.shape) == 2):  # grayscale image
+            # A read-only view repeating the grayscale plane. If a copy
+            # or another dtype is requested, the view is materialized
+            # below in a single pass.
+            image = np.broadcast_to(image[:, :, np.newaxis],
+                                    image.shape + (3,))
+        elif colorspace == Colorspace.RGB:
+            if len(image.shape) == 3 and image.shape[2] == 4:  # RGBD
                 image = image[:, :, :3]
+        elif (colorspace == Colorspace.BGR and len(image.shape) == 3 and
+              image.shape[2] >= 3):
+            # Images are RGB(A) by convention - reverse the color
+            # channels (dropping alpha).  Write the result in one pass
+            # into a contiguous array (combined with a dtype
+            # conversion), instead of returning a strided view
+            # (which libraries like OpenCV can not process correctly).
+            converter = cls._colorspace_converters.get(colorspace)
+            result = None if converter is None else converter(image)
+            if result is None:
+                result = np.ascontiguousarray(image[:, :, 2::-1],
+                                              dtype=dtype or image.dtype)
+            image = result
+            copy = False
+
+        if colorspace == Colorspace.HSV and len(image.shape) == 3:
+            # HSV values are float (ranging from 0.0 to 1.0)
+            image = image[:, :, :3]  # drop alpha (RGBA)
+            converter = cls._colorspace_converters.get(colorspace)
+            result = None if converter is None else converter(image)
+            image = _rgb_to_hsv(image) if result is None else result
+            copy = False
+
+        if (normalize_from is not None and dtype is not None and
+                np.issubdtype(image.dtype, np.floating) and
+                np.issubdtype(dtype, np.integer)):
+            # scale and clip in a single float32 buffer, which is
+            # then narrowed to the integer type
+            min_value, max_value = normalize_from
+            info = np.iinfo(dtype)
+            scaled = np.subtract(image, min_value, dtype=np.float32)
+            scale = (info.max - info.min) / (max_value - min_value)
+            if scale != 1:
+                scaled *= scale
+            if info.min != 0:
+                scaled += info.min
+            np.clip(scaled, info.min, info.max, out=scaled)
+            image = scaled.astype(dtype)
+            copy = False
 
         if dtype is not None and dtype != image.dtype:
-            image = image.astype(dtype)  # /256.
+            image = image.astype(dtype, order='C' if contiguous else 'K')
             copy = False
 
         if copy:
             image = image.copy()
+        elif contiguous:
+            image = np.ascontiguousarray(image)
 
         LOG.debug("Returning image of shape %s, dtype=%s.",
                   image.shape, image.dtype)
         return image
 
+    @classmethod
+    def as_batch(cls, images: Iterable[Imagelike], dtype=None,
+                 colorspace: Colorspace = None,
+                 shape: Tuple[int, ...] = None) -> np.ndarray:
+        """Get a sequence of image-like objects (of same size) as one
+        numpy array, with the batch axis first.
+
+        The batch array is allocated once and each image is written
+        into it in a single pass (including a dtype conversion), as
+        opposed to first converting each image into an array of its
+        own and then stacking these arrays.
+
+        Arguments
+        ---------
+        images:
+            The images to put into the batch. All images must have
+            the same shape (after colorspace conversion). Iterables
+            without a length (like generators) are first collected
+            into a list.
+        dtype:
+            Numpy datatype of the batch array.  If `None`, the datatype
+            of the first image is used.
+        colorspace: Colorspace
+            The colorspace in which the pixels in the batch array are
+            encoded (see :py:meth:`as_array`).
+        shape:
+            The shape of a single image in the batch. If `None`, the
+            shape of the first image is used.
+
+        Result
+        ------
+        batch:
+            The batch array. For an empty sequence of images, this
+            is an empty batch of the given `shape`.
+
+        Raises
+        ------
+        ValueError:
+            The sequence of images is empty and no `shape` was given,
+            or an image does not have the shape of the batch.
+        """
+        if not isinstance(images, Sized):
+            images = list(images)
+        if len(images) == 0:
+            if shape is None:
+                raise ValueError("Cannot determine the shape of "
+                                 "an empty batch of images.")
+            return np.empty((0,) + tuple(shape), dtype=dtype)
+
+        batch = None
+        for index, image in enumerate(images):
+            array = cls.as_array(image, colorspace=colorspace)
+            if batch is None:
+                if shape is None:
+                    shape = array.shape
+                batch = np.empty((len(images),) + tuple(shape),
+                                 dtype=dtype or array.dtype)
+            if array.shape != batch.shape[1:]:
+                raise ValueError(f"Image {index} of shape {array.shape} "
+                                 f"does not fit into a batch of shape "
+                                 f"{batch.shape}.")
+            np.copyto(batch[index], array, casting='unsafe')
+        return batch
+
     @staticmethod
     def as_data(image: Imagelike, copy: bool = False) -> 'Data':
         """Get image-like objec as :py:class:`Data` object.
@@ -229,9 +500,28 @@ class Image(DataDict):
 
     def __init__(self, image: Imagelike = None, array: np.ndarray = None,
                  copy: bool = False, **kwargs) -> None:
-        if image is not None:
+        lazy = isinstance(image, str) and array is None
+        if image is not None and not lazy:
             array = self.as_array(image, copy=copy)
         super().__init__(array=array, **kwargs)
+        if lazy:
+            # Only remember the filename: the image is loaded upon
+            # first access of the `array` attribute (see __getattr__).
+            super().__setattr__('_filename', image)
+            object.__delattr__(self, 'array')
+
+    def __getattr__(self, attr: str) -> Any:
+        """Load the image data on first access, if this
+        :py:class:`Image` was created from a filename.
+        """
+        filename = self.__dict__.get('_filename')
+        if attr != 'array' or filename is None:
+            raise AttributeError(f"{type(self).__name__} has "
+                                 f"no attribute '{attr}'")
+        LOG.debug("Lazy loading image array from '%s'.", filename)
+        array = self.as_array(filename)
+        object.__setattr__(self, 'array', array)
+        return array
 
 
 class ImageAdapter(ABC):
@@ -593,19 +883,62 @@ class ImageResizer:
         return self.resize(image, size=size, **kwargs)
 
     @staticmethod
-    def crop(image: Imagelike, size: Size, **_kwargs) -> np.ndarray:
+    def crop(image: Imagelike, size: Size, fill_value=0,
+             **_kwargs) -> np.ndarray:
         """Crop an :py:class:`Image` to a given size.
 
         If now position is provided, a center crop will be performed.
+        If the crop box lies inside the image, the result is a view
+        on the original array.  If the requested size exceeds the
+        image size, the result is a new array, in which the area
+        outside of the image is filled with `fill_value`.
         """
-        # FIXME[todo]: deal with sizes extending the original size
         # FIXME[todo]: allow center/random/position crop
         image = Image.as_array(image)
-        old_size = image.shape[:2]
-        center = old_size[0]//2, old_size[1]//2
-        point1 = center[0] - size[0]//2, center[1] - size[1]//2
-        point2 = point1[0] + size[0], point1[1] + size[1]
-        return image[point1[0]:point2[0], point1[1]:point2[1]]
+        return ImageResizer._crop_array(image, size, axis=0,
+                                        fill_value=fill_value)
+
+    @staticmethod
+    def crop_batch(images: np.ndarray, size: Size, fill_value=0,
+                   **_kwargs) -> np.ndarray:
+        """Crop a batch of images (of same size) to a given size.
+        The crop box is computed once for the whole batch and the
+        result is a view on the original array (if the box lies
+        inside the images).
+        """
+        return ImageResizer._crop_array(images, size, axis=1,
+                                        fill_value=fill_value)
+
+    @staticmethod
+    def _crop_array(array: np.ndarray, size: Size, axis: int,
+                    fill_value=0) -> np.ndarray:
+        """Center crop of an array, where `axis` is the vertical axis
+        (the horizontal axis following next).
+        """
+        old_size = array.shape[axis:axis+2]
+        if old_size[0] == size[0] and old_size[1] == size[1]:
+            return array  # nothing to crop
+        top = old_size[0]//2 - size[0]//2
+        left = old_size[1]//2 - size[1]//2
+        leading = (slice(None),) * axis
+        if (top >= 0 and left >= 0 and top + size[0] <= old_size[0] and
+                left + size[1] <= old_size[1]):
+            # crop box inside the image: return a view
+            return array[leading + (slice(top, top + size[0]),
+                                    slice(left, left + size[1]))]
+
+        # crop box exceeds the image: only copy the overlapping region
+        # into an output array filled with the fill value
+        shape = array.shape[:axis] + tuple(size[:2]) + array.shape[axis+2:]
+        result = np.full(shape, fill_value, dtype=array.dtype)
+        source, target = leading, leading
+        for offset, old, new in ((top, old_size[0], size[0]),
+                                 (left, old_size[1], size[1])):
+            start, stop = max(offset, 0), min(offset + new, old)
+            source += (slice(start, stop),)
+            target += (slice(start - offset, stop - offset),)
+        np.copyto(result[target], array[source])
+        return result
 
 
 class ImageOperator:
@@ -624,9 +957,8 @@ class ImageOperator:
         """Transform a source file into a target file.
         """
         # FIXME[concept]: this requires the util.image module!
-        # pylint: disable=import-outside-toplevel
-        from ..util.image import imread, imwrite
-        imwrite(target, self(imread(source)))
+        util_image = _get_util_image()
+        util_image.imwrite(target, self(util_image.imread(source)))
 
     def transform_data(self, image: Image,
                        target: str, source: str = None) -> None:
@@ -779,6 +1111,10 @@ class ImageDisplay(ImageIO, ImageGenerator.Observer):
         # by the method `present`
         self._presentation: threading.Thread = None
 
+        # _wake: an Event waking up the dummy event loop, set when
+        # a new image is shown or the display is closed
+        self._wake = threading.Event()
+
     @property
     def blocking(self) -> bool:
         """Blocking behaviour of this image :py:class:`Display`.  `True` means
@@ -874,12 +1210,23 @@ class ImageDisplay(ImageIO, ImageGenerator.Observer):
             self.open()
 
         # show the image
-        array = Image.as_array(image, dtype=np.uint8)
+        # float images are expected to have values either in the unit
+        # range (0.0 to 1.0) or in the byte range (0 to 255), guessed
+        # from the maximal value (as in qtgui.widgets.image.imageToQImage)
+        # - out of range values are clipped.
+        array = Image.as_array(image)
+        value_range = None
+        if np.issubdtype(array.dtype, np.floating):
+            value_range = (_FLOAT_RANGE_UNIT if array.max() < 2 else
+                           _FLOAT_RANGE_BYTE)
+        array = Image.as_array(array, dtype=np.uint8, contiguous=True,
+                               normalize_from=value_range)
         LOG.debug("Showing image of shape %s, close=%s, timout=%s, "
                   "event loop=%s, presentation=%s",
                   array.shape, close, timeout, self.event_loop_is_running(),
                   self._presentation is not None)
         self._show(array, **kwargs)
+        self._wake.set()
 
         # run the event loop
         if blocking is True:
@@ -951,6 +1298,7 @@ class ImageDisplay(ImageIO, ImageGenerator.Observer):
         if self._opened:
             self._opened = False
             self._close()
+        self._wake.set()
 
         presentation = self._presentation
         if presentation is not None:
@@ -1028,16 +1376,25 @@ class ImageDisplay(ImageIO, ImageGenerator.Observer):
 
     def _dummy_event_loop(self, timeout: float = None) -> None:
         # pylint: disable=broad-except
+        # Events are processed at least every `interval` seconds, and
+        # immediately when woken up (by showing a new image or closing
+        # the display).
         interval = 0.1
 
-        start = time.time()
+        end = None if timeout is None else time.monotonic() + timeout
         try:
             print("ImageDisplay: start dummy event loop. "
                   f"closed={self.closed}")
-            while (not self.closed and
-                   (timeout is None or time.time() < start + timeout)):
+            while not self.closed:
                 self._process_events()
-                time.sleep(interval)
+                if end is None:
+                    wait = interval
+                else:
+                    wait = min(interval, end - time.monotonic())
+                    if wait <= 0:
+                        break
+                self._wake.wait(wait)
+                self._wake.clear()
         except BaseException as exception:
             LOG.error("Unhandled exception in event loop")
             handle_exception(exception)
@@ -1060,9 +1417,12 @@ class ImageDisplay(ImageIO, ImageGenerator.Observer):
         In other words: this function is intended to realize a non-blocking
         image display with responsive image window.
 
-        FIXME[todo]: check how this behaves under heavy load (GPU computation)
-        and if in case of problems, resorting to a QThread would improve
-        the situation.
+        The background thread spends its idle time in
+        :py:meth:`threading.Event.wait`, which releases the GIL, so
+        computations in the main thread are only interrupted for the
+        actual event processing.  Resorting to a QThread running its
+        own `QEventLoop` is not an option, as Qt requires events of
+        the widgets to be processed in the thread owning them.
         """
         if self.event_loop_is_running():
             raise RuntimeError("Only one event loop is allowed.")
@@ -1120,6 +1480,9 @@ class Location:
     also allows for alternative ways to describe a location.
 
     """
+    # Locations are created in large numbers (e.g., one per detection),
+    # hence we use slots to avoid a per-instance `__dict__`.
+    __slots__ = ()
 
     def __init__(self, points) -> None:
         pass
@@ -1162,6 +1525,7 @@ class PointsBasedLocation:
         An array of shape (n, 2), providing n points in form of (x, y)
         coordinates.
     """
+    __slots__ = ('_points', )
 
     def __init__(self, points: np.ndarray) -> None:
         super().__init__()
@@ -1222,6 +1586,7 @@ class PointsBasedLocation:
 class Landmarks(PointsBasedLocation):
     """Landmarks are an ordered list of points.
     """
+    __slots__ = ()
 
     def __len__(self) -> int:
         return 0 if self._points is None else len(self._points)
@@ -1231,6 +1596,7 @@ class BoundingBox(PointsBasedLocation):
     # pylint: disable=invalid-name
     """A bounding box describes a rectangular arae in an image.
     """
+    __slots__ = ()
 
     def __init__(self, x1=None, y1=None, x2=None, y2=None,
                  x=None, y=None, width=None, height=None) -> None:
@@ -1411,10 +1777,12 @@ class Region:
         return point in self._location
 
     def __getattr__(self, name: str):
-        if name in self._attributes:
-            return self._attributes[name]
+        # self._attributes may not be set yet (e.g., when copying)
+        attributes = self.__dict__.get('_attributes', {})
+        if name in attributes:
+            return attributes[name]
         raise AttributeError(f"Region has no attribute '{name}'. Valid "
-                             f"attributes are: {self._attributes.keys()}")
+                             f"attributes are: {attributes.keys()}")
 
     def __len__(self) -> str:
         return len(self._attributes)
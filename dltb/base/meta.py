@@ -8,13 +8,25 @@ import os
 import numpy as np
 
 # toolbox imports
-from .image import Region
+from .image import Region, BoundingBox
 
 
 class Metadata:
     """Metadata for a datum from a Datasource.
+
+    Attributes
+    ----------
+    _regions: List[Region]
+        The regions registered with this :py:class:`Metadata` object.
+    _boxes: np.ndarray
+        If all regions are located by a :py:class:`BoundingBox`, the
+        coordinates of these boxes may be consolidated in one array
+        of shape (N, 2, 2), the points of each :py:class:`BoundingBox`
+        then being a view into this array.  This allows to operate
+        on all boxes at once.  `None` if no such array exists (yet).
     """
     _regions = None
+    _boxes = None
 
     def __init__(self, description: str = None, label: str = None,
                  **attributes) -> None:
@@ -24,6 +36,14 @@ class Metadata:
             self._label = label
         self.__dict__.update(attributes)
 
+    def __getstate__(self):
+        # The consolidated boxes array is neither copied nor pickled:
+        # the points of the copied bounding boxes would not be views
+        # into it.  It will be recreated on demand.
+        state = self.__dict__.copy()
+        state.pop('_boxes', None)
+        return state
+
     def add_region(self, position, **attributes):
         """Add a spatial region with attributes to this
         :py:class:`Metadata` object.
@@ -31,6 +51,15 @@ class Metadata:
         if self._regions is None:
             self._regions = []
         self._regions.append(Region(position, **attributes))
+        self._boxes = None
+
+    def select_regions(self, indices) -> None:
+        """Only keep the regions with the given indices (in the
+        given order).
+        """
+        if self._regions is not None:
+            self._regions = [self._regions[index] for index in indices]
+            self._boxes = None
 
     def has_regions(self):
         """Check if there are regions registered with this
@@ -57,6 +86,29 @@ class Metadata:
         """
         return self._regions
 
+    @property
+    def boxes(self) -> np.ndarray:
+        """The bounding boxes of the regions of this :py:class:`Metadata`
+        object as an array of shape (N, 4), each row holding the
+        coordinates `(x1, y1, x2, y2)` of a box.  The array is a view,
+        that is changes are reflected in the regions' bounding boxes
+        (and vice versa).  `None` if there are regions not located by
+        a :py:class:`BoundingBox`.
+        """
+        if self._boxes is None:
+            if not self._regions:  # no regions or empty list
+                return np.empty((0, 4))
+            locations = [region.location for region in self._regions]
+            if not all(isinstance(location, BoundingBox)
+                       for location in locations):
+                return None
+            self._boxes = \
+                np.stack([location.points for location in locations])
+            for index, location in enumerate(locations):
+                # pylint: disable=protected-access
+                location._points = self._boxes[index]
+        return self._boxes.reshape(-1, 4)
+
     def scale(self, factor) -> None:
         """Scale all positions of this metadata by a given factor.
 
@@ -69,7 +121,10 @@ class Metadata:
             scaling factor.
 
         """
-        if self.has_regions():
+        if self._regions:
+            if self.boxes is not None:
+                self._boxes *= factor  # scale all boxes at once
+                return
             for region in self.regions:
                 region.scale(factor)
 
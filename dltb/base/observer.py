@@ -8,6 +8,7 @@ This module contains definitions for observer functionality
 
 # standard imports
 from typing import Callable, Iterator, Tuple, Type
+from contextlib import contextmanager
 import threading
 import logging
 
@@ -372,7 +373,23 @@ class Observable(object):
     # Change context
     #
 
-    # FIXME[todo]: provide a context handler
+    @contextmanager
+    def batch_changes(self):
+        """A context manager collecting all changes reported within
+        the context (via :py:meth:`change`).  The observers will be
+        notified only once, when the (outermost) context is left,
+        receiving the union of all changes.
+        """
+        self._begin_change()
+        try:
+            yield self._thread_local.change
+        finally:
+            result = self._end_change()
+            if result is not None:
+                # not in the main thread: there is no runner to pass
+                # the changes to, so notify the observers directly
+                # (as :py:meth:`change` would have done)
+                self.notify_observers(result[1])
 
     def _begin_change(self):
         data = self._thread_local
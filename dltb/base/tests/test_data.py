@@ -16,3 +16,11 @@ class TestDataClass(TestCase):
         data = Data()
         self.assertTrue(isinstance(data, Data))
         self.assertTrue(isinstance(data, DataDict))
+
+    def test_add_attributes(self):
+        data = Data(batch=3)
+        data.add_attributes(label=5, name='test')
+        self.assertTrue(data.has_attribute('label'))
+        self.assertFalse(data.is_batch_attribute('label'))
+        self.assertEqual(data.label, 5)
+        self.assertEqual(data[1].name, 'test')
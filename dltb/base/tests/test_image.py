@@ -0,0 +1,222 @@
+# standard imports
+from unittest import TestCase
+import colorsys
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from dltb.base.image import Image, ImageResizer, Colorspace
+
+
+class ImageTest(TestCase):
+    """Tests for the :py:mod:`dltb.base.image` module.
+    """
+
+    def setUp(self) -> None:
+        self._gray = np.arange(12, dtype=np.uint8).reshape(3, 4)
+
+    def test_gray_to_rgb(self) -> None:
+        rgb = Image.as_array(self._gray, colorspace=Colorspace.RGB)
+        self.assertEqual(rgb.shape, (3, 4, 3))
+        for channel in range(3):
+            self.assertTrue(np.array_equal(rgb[:, :, channel], self._gray))
+
+    def test_gray_to_rgb_copy(self) -> None:
+        rgb = Image.as_array(self._gray, colorspace=Colorspace.RGB,
+                             copy=True)
+        self.assertEqual(rgb.shape, (3, 4, 3))
+        self.assertTrue(rgb.flags.writeable)
+        rgb[0, 0, 0] = 100
+        self.assertEqual(rgb[0, 0, 1], self._gray[0, 0])
+        self.assertEqual(self._gray[0, 0], 0)
+
+    def test_rgba_to_rgb_dtype(self) -> None:
+        rgba = np.arange(48, dtype=np.uint8).reshape(3, 4, 4)
+        rgb = Image.as_array(rgba, colorspace=Colorspace.RGB,
+                             dtype=np.float32)
+        self.assertEqual(rgb.shape, (3, 4, 3))
+        self.assertEqual(rgb.dtype, np.float32)
+        self.assertTrue(rgb.flags.c_contiguous)
+        self.assertTrue(np.array_equal(rgb, rgba[:, :, :3]))
+
+    def test_array_no_copy(self) -> None:
+        self.assertIs(Image.as_array(self._gray), self._gray)
+        self.assertIs(Image.as_array(self._gray, dtype=np.uint8), self._gray)
+        self.assertIsNot(Image.as_array(self._gray, copy=True), self._gray)
+
+    def test_file_cache(self) -> None:
+        image_file = 'images/elephant.jpg'
+        Image.clear_cache()
+        try:
+            first = Image.as_array(image_file)
+        except ImportError:
+            self.skipTest("No ImageReader available.")
+        second = Image.as_array(image_file)
+        self.assertIsNot(first, second)
+        self.assertTrue(second.flags.writeable)
+        self.assertTrue(np.array_equal(first, second))
+
+    def test_add_converter(self) -> None:
+        class Wrapper:
+            def __init__(self, array):
+                self.array = array
+
+        class SubWrapper(Wrapper):
+            pass
+
+        # restore the class-wide converter registry after the test
+        converters = {key: list(value)
+                      for key, value in Image.converters.items()}
+
+        def restore_converters() -> None:
+            Image.converters.clear()
+            Image.converters.update(converters)
+            Image._array_converters.clear()
+        self.addCleanup(restore_converters)
+
+        with self.assertRaises(NotImplementedError):
+            Image.as_array(SubWrapper(self._gray))
+        Image.add_converter(Wrapper, lambda image, copy: (image.array, copy),
+                            target='array')
+        self.assertIs(Image.as_array(SubWrapper(self._gray)), self._gray)
+
+    def test_rgb_to_bgr(self) -> None:
+        rgba = np.arange(48, dtype=np.uint8).reshape(3, 4, 4)
+        bgr = Image.as_array(rgba, colorspace=Colorspace.BGR,
+                             dtype=np.float32)
+        self.assertEqual(bgr.shape, (3, 4, 3))
+        self.assertEqual(bgr.dtype, np.float32)
+        self.assertTrue(bgr.flags.c_contiguous)
+        self.assertTrue(np.array_equal(bgr, rgba[:, :, 2::-1]))
+        bgr = Image.as_array(self._gray, colorspace=Colorspace.BGR)
+        self.assertEqual(bgr.shape, (3, 4, 3))
+
+    def test_lazy_data(self) -> None:
+        data = Image.as_data('images/elephant.jpg')
+        self.assertEqual(data.url, 'images/elephant.jpg')
+        self.assertNotIn('array', vars(data))
+        try:
+            array = data.array
+        except ImportError:
+            self.skipTest("No ImageReader available.")
+        self.assertIs(data.array, array)
+
+    def test_gray_to_rgb_dtype(self) -> None:
+        rgb = Image.as_array(self._gray, colorspace=Colorspace.RGB,
+                             dtype=np.float32, copy=True)
+        self.assertEqual(rgb.shape, (3, 4, 3))
+        self.assertEqual(rgb.dtype, np.float32)
+        self.assertTrue(rgb.flags.writeable and rgb.flags.c_contiguous)
+
+    def test_crop(self) -> None:
+        image = np.arange(5*6*3).reshape(5, 6, 3)
+        cropped = ImageResizer.crop(image, (3, 2))
+        self.assertEqual(cropped.shape, (3, 2, 3))
+        self.assertTrue(np.array_equal(cropped, image[1:4, 2:4]))
+        self.assertIs(ImageResizer.crop(image, (5, 6)), image)
+        batch = np.stack([image, image + 1])
+        cropped = ImageResizer.crop_batch(batch, (3, 2))
+        self.assertEqual(cropped.shape, (2, 3, 2, 3))
+        self.assertTrue(np.array_equal(cropped[1], image[1:4, 2:4] + 1))
+
+    def test_crop_exceeding(self) -> None:
+        image = np.arange(2 * 3, dtype=np.uint8).reshape(2, 3) + 1
+        cropped = ImageResizer.crop(image, (4, 2), fill_value=9)
+        self.assertEqual(cropped.tolist(), [[9, 9], [1, 2], [4, 5], [9, 9]])
+        cropped = ImageResizer.crop(image, (1, 5))
+        self.assertEqual(cropped.tolist(), [[0, 4, 5, 6, 0]])
+        batch = np.stack((image, image + 1))
+        cropped = ImageResizer.crop_batch(batch, (3, 3))
+        self.assertEqual(cropped.shape, (2, 3, 3))
+        self.assertEqual(cropped[1].tolist(),
+                         [[2, 3, 4], [5, 6, 7], [0, 0, 0]])
+
+    def test_contiguous(self) -> None:
+        image = np.arange(4*6*3, dtype=np.uint8).reshape(4, 6, 3)[:, ::2]
+        self.assertFalse(image.flags.c_contiguous)
+        self.assertIs(Image.as_array(image), image)
+        array = Image.as_array(image, contiguous=True)
+        self.assertTrue(array.flags.c_contiguous)
+        self.assertTrue(np.array_equal(array, image))
+        array = Image.as_array(self._gray, colorspace=Colorspace.RGB,
+                               contiguous=True)
+        self.assertTrue(array.flags.c_contiguous)
+
+    def test_as_batch(self) -> None:
+        images = [self._gray, self._gray + 1, self._gray + 2]
+        batch = Image.as_batch(images, dtype=np.float32,
+                               colorspace=Colorspace.RGB)
+        self.assertEqual(batch.shape, (3, 3, 4, 3))
+        self.assertEqual(batch.dtype, np.float32)
+        self.assertTrue(np.array_equal(batch[2, :, :, 1], self._gray + 2))
+
+    def test_as_batch_iterator(self) -> None:
+        images = (self._gray + i for i in range(3))
+        batch = Image.as_batch(images)
+        self.assertEqual(batch.shape, (3, 3, 4))
+        self.assertTrue(np.array_equal(batch[1], self._gray + 1))
+
+    def test_as_batch_shape(self) -> None:
+        batch = Image.as_batch([self._gray], shape=(3, 4))
+        self.assertEqual(batch.shape, (1, 3, 4))
+        with self.assertRaises(ValueError):
+            Image.as_batch([self._gray], shape=(4, 3))
+        with self.assertRaises(ValueError):
+            Image.as_batch([self._gray, self._gray[:2]])
+
+    def test_as_batch_empty(self) -> None:
+        batch = Image.as_batch([], dtype=np.uint8, shape=(3, 4))
+        self.assertEqual(batch.shape, (0, 3, 4))
+        self.assertEqual(batch.dtype, np.uint8)
+        with self.assertRaises(ValueError):
+            Image.as_batch(iter([]))
+
+    def test_rgb_to_hsv(self) -> None:
+        rgb = np.random.randint(256, size=(5, 7, 3), dtype=np.uint8)
+        rgb[0, 0] = (10, 10, 10)  # gray (no hue)
+        rgb[0, 1] = (0, 0, 0)  # black (no saturation)
+        hsv = Image.as_array(rgb, colorspace=Colorspace.HSV)
+        self.assertEqual(hsv.shape, rgb.shape)
+        for pixel, result in zip(rgb.reshape(-1, 3) / 255.,
+                                 hsv.reshape(-1, 3)):
+            expected = colorsys.rgb_to_hsv(*pixel)
+            self.assertTrue(np.allclose(result, expected, atol=1e-5),
+                            f"{pixel}: {result} != {expected}")
+
+    def test_rgba_to_hsv(self) -> None:
+        rgba = np.full((2, 2, 4), 200, dtype=np.uint8)
+        rgba[..., 3] = 17
+        hsv = Image.as_array(rgba, colorspace=Colorspace.HSV)
+        self.assertEqual(hsv.shape, (2, 2, 3))
+        expected = Image.as_array(rgba[..., :3], colorspace=Colorspace.HSV)
+        self.assertTrue(np.array_equal(hsv, expected))
+
+    def test_as_array_normalize_from(self) -> None:
+        image = np.array([[-0.5, 0.0, 0.25], [0.5, 1.0, 1.5]],
+                         dtype=np.float32)
+        array = Image.as_array(image, dtype=np.uint8,
+                               normalize_from=(0.0, 1.0))
+        self.assertEqual(array.dtype, np.uint8)
+        self.assertEqual(array.tolist(), [[0, 0, 63], [127, 255, 255]])
+
+        # integer images are not affected
+        image = np.arange(6, dtype=np.uint8).reshape(2, 3)
+        array = Image.as_array(image, dtype=np.uint8,
+                               normalize_from=(0.0, 1.0))
+        self.assertIs(array, image)
+
+    def test_colorspace_converter(self) -> None:
+        rgb = np.arange(2 * 3 * 3, dtype=np.uint8).reshape(2, 3, 3)
+        converters = dict(Image._colorspace_converters)
+        try:
+            Image.add_colorspace_converter(Colorspace.BGR, lambda _: None)
+            bgr = Image.as_array(rgb, colorspace=Colorspace.BGR)
+            self.assertTrue(np.array_equal(bgr, rgb[:, :, 2::-1]))
+            Image.add_colorspace_converter(Colorspace.BGR,
+                                           lambda array: array + 1)
+            bgr = Image.as_array(rgb, colorspace=Colorspace.BGR)
+            self.assertTrue(np.array_equal(bgr, rgb + 1))
+        finally:
+            Image._colorspace_converters.clear()
+            Image._colorspace_converters.update(converters)
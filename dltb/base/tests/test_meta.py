@@ -0,0 +1,61 @@
+"""Tests for the :py:class:`Metadata` class.
+"""
+
+# standard imports
+from unittest import TestCase
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from dltb.base.meta import Metadata
+from dltb.base.image import BoundingBox, Landmarks
+
+
+class TestMetadata(TestCase):
+    """Tests for the :py:class:`Metadata` class.
+    """
+
+    def setUp(self):
+        self.metadata = Metadata()
+        self.metadata.add_region(BoundingBox(x1=1, y1=2, x2=5, y2=6))
+        self.metadata.add_region(BoundingBox(x1=10, y1=20, x2=30, y2=40))
+
+    def test_boxes(self):
+        """The boxes array should reflect the bounding boxes.
+        """
+        boxes = self.metadata.boxes
+        self.assertTrue(np.array_equal(boxes, [[1, 2, 5, 6],
+                                               [10, 20, 30, 40]]))
+        self.metadata.regions[1].location.x2 = 35
+        self.assertEqual(self.metadata.boxes[1, 2], 35)
+
+    def test_scale(self):
+        """Scaling should apply to all bounding boxes.
+        """
+        self.metadata.scale((2., .5))
+        location = self.metadata.regions[0].location
+        self.assertEqual((location.x1, location.y1, location.x2, location.y2),
+                         (2., 1., 10., 3.))
+        self.metadata.add_region(BoundingBox(x1=0, y1=0, x2=4, y2=4))
+        self.metadata.scale(.5)
+        self.assertTrue(np.array_equal(self.metadata.boxes,
+                                       [[1, .5, 5, 1.5], [10, 5, 30, 10],
+                                        [0, 0, 2, 2]]))
+
+    def test_no_boxes(self):
+        """Without bounding boxes, there is no boxes array.
+        """
+        self.metadata.add_region(Landmarks(np.asarray([[1., 1.]])))
+        self.assertIsNone(self.metadata.boxes)
+        self.metadata.scale(2.)
+        self.assertEqual(self.metadata.regions[0].location.x2, 10.)
+
+    def test_empty_regions(self):
+        """An empty list of regions results in an empty boxes array
+        and scaling does nothing.
+        """
+        self.metadata.select_regions([])
+        self.assertEqual(self.metadata.boxes.shape, (0, 4))
+        self.metadata.scale(2.)
+        self.assertEqual(Metadata(regions=[]).boxes.shape, (0, 4))
@@ -0,0 +1,55 @@
+"""Tests for the :py:class:`Observable` class.
+"""
+
+# standard imports
+from unittest import TestCase
+
+# toolbox imports
+from dltb.base.observer import Observable
+
+
+class MockObservable(Observable, method='mock_changed',
+                     changes={'a_changed', 'b_changed'}):
+    """An :py:class:`Observable` reporting two types of changes.
+    """
+
+
+class MockObserver(MockObservable.Observer):
+    """An observer recording all notifications.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.notifications = []
+
+    def mock_changed(self, observable, change) -> None:
+        self.notifications.append(set(change))
+
+
+class TestObservable(TestCase):
+    """Tests for the :py:class:`Observable` class.
+    """
+
+    def setUp(self):
+        self.observable = MockObservable()
+        self.observer = MockObserver()
+        self.observer.observe(self.observable, MockObservable.Change.all())
+
+    def test_change(self):
+        """Changes outside a change context are reported immediately.
+        """
+        self.observable.change('a_changed')
+        self.observable.change('b_changed')
+        self.assertEqual(self.observer.notifications,
+                         [{'a_changed'}, {'b_changed'}])
+
+    def test_batch_changes(self):
+        """Changes within a batch context are reported once.
+        """
+        with self.observable.batch_changes():
+            self.observable.change('a_changed')
+            self.observable.change('b_changed')
+            self.observable.change('a_changed')
+            self.assertEqual(self.observer.notifications, [])
+        self.assertEqual(self.observer.notifications,
+                         [{'a_changed', 'b_changed'}])
@@ -283,11 +283,18 @@ class Webcam(Reader):
     _lock: threading.Lock
         A lock to avoid race conditions due to simultanous access to
         the webcam.
+    _buffer_size: int
+        The number of frames buffered by the video driver. `None`
+        if unknown, in which case a platform specific guess is used.
+        Backends that are able to control the buffer should set this
+        value.
     """
 
     # maximal acceptable delay due to buffering
     maximal_buffering_delay: float = 0.1
 
+    _buffer_size: int = None
+
     def __init__(self, device: int, **kwargs) -> None:
         LOG.info("Acqiring Webcam (%d) for %s.", device, type(self))
         self._lock = None
@@ -306,6 +313,17 @@ class Webcam(Reader):
     def device(self) -> int:
         return self._device
 
+    @property
+    def buffer_size(self) -> int:
+        """The number of frames buffered by the video driver.  If larger
+        than 1, frames read from the webcam may be outdated.
+        """
+        if self._buffer_size is not None:
+            return self._buffer_size
+        # under linux, the av-based linux capture code is using
+        # an internal fifo buffer (5 frames, iirc)
+        return 5 if sys.platform == 'linux' else 1
+
     def read_frame(self, clear_buffer: bool = None) -> np.ndarray:
         """The default (and only) mode of getting data from the webcam
         is reading the next frame.
@@ -327,23 +345,52 @@ class Webcam(Reader):
             if clear_buffer:
                 self._clear_buffer()
             frame = self._read_frame()
-            self._last_read = time.time()
+            self._last_read_timestamp = time.time()
         LOG.debug("Captured frame of shape %s, dtype=%s with shape %s",
                   frame.shape, frame.dtype, self)
         return frame
 
+    def grab_frame(self) -> None:
+        """Grab the next frame from the webcam, without providing it.
+        The frame can later be obtained by :py:meth:`retrieve_frame`.
+        Grabbing frames allows to keep up with the webcam while only
+        spending the effort of decoding on frames that are actually
+        used.
+        """
+        with self._lock:
+            self._grab_frame()
+            self._last_read_timestamp = time.time()
+
+    def retrieve_frame(self) -> np.ndarray:
+        """Retrieve the frame last grabbed by :py:meth:`grab_frame`.
+        """
+        with self._lock:
+            return self._retrieve_frame()
+
     def _clear_buffer(self) -> None:
         """Clear the webcam buffer.
         """
-        # Hack: under linux, the av-based linux capture code is using
-        # an internal fifo buffer (5 frames, iirc),  you cannot clean (or
-        # say, flush) it.
-        #
-        # Hence we will skip some frames to really get the current image.
-        if sys.platform == 'linux':
-            ignore = 4
-            for _ in range(ignore):
-                self._read_frame()
+        # Hack: if the driver is using an internal fifo buffer, that
+        # cannot be cleaned (or say, flushed), we will skip some frames
+        # to really get the current image.
+        for _ in range(self.buffer_size - 1):
+            self._grab_frame()
+
+    def _grab_frame(self) -> None:
+        """Grab the next frame.  The default implementation simply
+        reads the frame.  Subclasses which are able to grab a frame
+        without decoding it should overwrite this method (and
+        :py:meth:`_retrieve_frame`).
+        """
+        self._grabbed_frame = self._read_frame()
+
+    def _retrieve_frame(self) -> np.ndarray:
+        """Retrieve the last grabbed frame.
+        """
+        frame = getattr(self, '_grabbed_frame', None)
+        if frame is None:
+            raise RuntimeError("No frame was grabbed from the webcam.")
+        return frame
 
 
 class Writer(Preparable):
@@ -1,13 +1,9 @@
 """A :py:class:`Datasource` providing data from an array.
 """
 
-# FIXME[todo]: add the option to work with numpy memmap
-#  np.memmap(filename, dtype='float32', mode='w+',
-#            shape=(samples,) + network[layer].output_shape[1:])
-#
-# Notice: the filen referred to by filename has to by an
-# (uncompressed) `.npy` file. There is not way to use compressed `.npz`
-# files.
+# Notice: the array may also be a numpy memmap (see
+# :py:class:`dltb.datasource.file.DataFile`). Data are then only read
+# from disk when accessed, and indexing provides views on the file.
 
 
 # third party imports
@@ -212,7 +208,7 @@ class LabeledArray(DataArray, Labeled):
             description = super()._get_description(index=index, **kwargs)
             if not short:
                 if self.labels_prepared:
-                    description += " with label {self._labels[index]}"
+                    description += f" with label {self._labels[index]}"
                 else:
                     description += ", no label available"
         else:
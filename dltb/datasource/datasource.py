@@ -87,7 +87,7 @@ Worker classes
 from typing import Union, Tuple, Iterator, Any, Dict, Callable, AbstractSet
 from abc import abstractmethod, ABC
 import time
-import random
+from random import seed as random_seed
 import logging
 import threading
 import collections.abc
@@ -102,11 +102,26 @@ from ..base.sound import Sound
 from ..base.register import RegisterClass
 from ..base.fail import FailableObservable
 from ..base import Preparable
-from ..util.image import imread
 
 # logging
 LOG = logging.getLogger(__name__)
 
+_imread: Callable[[str], np.ndarray] = None
+
+
+def imread(filename: str, **kwargs) -> np.ndarray:
+    """Read an image from a file.  The image utilities are only
+    imported when the first image is actually read, so that
+    datasources not dealing with image files do not have to pay
+    for that import.
+    """
+    global _imread
+    if _imread is None:
+        # pylint: disable=import-outside-toplevel
+        from ..util.image import imread as util_imread
+        _imread = util_imread
+    return _imread(filename, **kwargs)
+
 
 class Datasource(Preparable, FailableObservable, # ABC,
                  method='datasource_changed',
@@ -200,6 +215,7 @@ class Datasource(Preparable, FailableObservable, # ABC,
         self._description = (self.__class__.__name__ if description is None
                              else description)
         self._data = None
+        self._batch_buffer = None
 
     @property
     def name(self):
@@ -221,9 +237,9 @@ class Datasource(Preparable, FailableObservable, # ABC,
             Either `None` for getting a single (non-batch) data object,
             or a positive integer specifying the batch size.
         """
+        # the 'datasource' attribute is already set by the constructor
         data = self._data_class(datasource=self, batch=batch)
         LOG.debug("Datasource[%s].get_data(%s)", self, kwargs)
-        data.add_attribute('datasource', self)
         data.add_attribute('datasource_argument')
         data.add_attribute('datasource_value')
         self._get_meta(data, **kwargs)
@@ -266,8 +282,10 @@ class Datasource(Preparable, FailableObservable, # ABC,
             # initialize all batch attributes
             data.initialize_attributes(batch=True)
             # get data for each item of the batch
+            get_data = self._get_data
             for item in data:
-                self._get_data(item, **kwargs)
+                get_data(item, **kwargs)
+        self._stack_batch(data)
 
     @abstractmethod
     def _get_default(self, data: Data, **kwargs) -> None:
@@ -286,6 +304,63 @@ class Datasource(Preparable, FailableObservable, # ABC,
         while True:
             self.get_data(batch=size, **kwargs)
 
+    def prepare_batch(self, size: int, shape: Tuple[int, ...],
+                      dtype=np.float32) -> None:
+        """Preallocate a buffer for batches of data.  Once such a
+        buffer is available, the items of a batch will be stacked
+        into that buffer, instead of allocating a new array for
+        every batch.
+
+        The `array` of a batch :py:class:`Data` object will then be
+        a view on that buffer, meaning that it will be overwritten
+        by the next batch. Consumers that want to keep the data
+        beyond that point have to copy the array.
+
+        Arguments
+        ---------
+        size:
+            The maximal batch size.
+        shape:
+            The shape of a single data item.
+        dtype:
+            The data type of the buffer.
+        """
+        self._batch_buffer = np.empty((size,) + tuple(shape), dtype=dtype)
+
+    def _stack_batch(self, data: Data) -> None:
+        """Turn the batch attributes of a freshly filled batch into
+        contiguous arrays (one array per attribute, with the batch
+        axis first), as far as possible:
+
+        * the data `array` is stacked into a single array, using the
+          batch buffer (if one was prepared by :py:meth:`prepare_batch`
+          and the batch fits into it).
+        * batch attributes holding plain numbers (like indices or
+          numerical labels) are converted into numpy arrays.
+
+        Other attributes (e.g. holding arbitrary objects) are left
+        as lists.
+        """
+        for name in data.attributes(batch=True):
+            values = getattr(data, name, None)
+            if not isinstance(values, list) or not values:
+                continue  # not set, or already provided as array
+            if name == 'array':
+                shape = getattr(values[0], 'shape', None)
+                if shape is None or \
+                        any(getattr(value, 'shape', None) != shape
+                            for value in values):
+                    continue  # items of different size
+                buffer = self._batch_buffer
+                if (buffer is not None and len(values) <= len(buffer) and
+                        buffer.shape[1:] == shape):
+                    data.array = np.stack(values, out=buffer[:len(values)])
+                else:
+                    data.array = np.stack(values)
+            elif all(type(value) in (int, float) or
+                     isinstance(value, np.number) for value in values):
+                setattr(data, name, np.asarray(values))
+
     #
     # Description
     #
@@ -562,6 +637,9 @@ class Livesource(Datasource):
         If not set, this means that the loop is currently running,
         if set, this means that the loop is currently not running (or at
         least supposed to stop running soon).
+    _loop_interval: float
+        The expected interval (in seconds) between two retrievals of
+        data while looping.
     """
 
 
@@ -572,7 +650,7 @@ class Livesource(Datasource):
         ---------
         """
         super().__init__(**kwargs)
-        self._loop_interval = loop_interval  # not really used
+        self._loop_interval = loop_interval
 
         # An event manages a flag that can be set to true with the set()
         # method and reset to false with the clear() method.
@@ -599,10 +677,19 @@ class Livesource(Datasource):
         """
         return not self.loop_stop_event.is_set()
 
-    def start_loop(self):
+    def start_loop(self, frames_per_second: float = None):
         """Start an asynchronous loop cycle. This method will return
         immediately, running the loop cycle in a background thread.
+
+        Arguments
+        ---------
+        frames_per_second:
+            The rate at which data will be retrieved during the loop
+            (if known).  Subclasses may use this to choose an
+            appropriate loop logic.
         """
+        if frames_per_second:
+            self._loop_interval = 1. / frames_per_second
         if self.loop_stop_event.is_set():
             self.loop_stop_event.clear()
 
@@ -710,11 +797,21 @@ class Random(Loop):
     """An abstract base class for datasources that allow to get
     random datapoints and/or batches. Subclasses of this class should
     implement :py:meth:`_fetch_random()`.
+
+    Attributes
+    ----------
+    _rng: np.random.Generator
+        A random number generator owned by this :py:class:`Random`
+        datasource.  It allows to draw random numbers without
+        sharing state (and locks) with other users of the global
+        random number generators and to draw multiple random numbers
+        (e.g., for a batch) in a single call.
     """
 
     def __init__(self, random_generator: str = 'random', **kwargs) -> None:
         super().__init__(**kwargs)
         self._random_generator = random_generator
+        self._rng = np.random.default_rng()
 
     #
     # Public interface
@@ -742,7 +839,8 @@ class Random(Loop):
                 if self._random_generator == 'numpy':
                     np.random.seed(seed)
                 else:
-                    random.seed(seed)
+                    random_seed(seed)
+                self._rng = np.random.default_rng(seed)
         super()._get_meta(data, **kwargs)
 
     def _get_data(self, data: Data, random: bool = False, **kwargs) -> None:
@@ -836,8 +934,38 @@ class Indexed(Random, collections.abc.Sequence):
                 data.index = np.arange(index, index+len(data), dtype=np.int)
             else:
                 data.index = index
+            if not data:
+                # The access method is fixed for the whole batch: pass
+                # the index of each item explicitly, as otherwise
+                # the items would be obtained by `_get_default`.
+                data.initialize_attributes(batch=True)
+                self._get_batch_items(data, self._get_data, **kwargs)
+        elif data.datasource_argument == 'random' and not data:
+            # Draw the random indices for the whole batch at once
+            # (instead of invoking _get_random for every item).
+            kwargs.pop('random', None)
+            data.index = self._rng.integers(len(self), size=len(data))
+            data.initialize_attributes(batch=True)
+            self._get_batch_items(data, self._get_index, **kwargs)
         super()._get_batch(data, **kwargs)
 
+    def _get_batch_items(self, data: Data, get_item: Callable,
+                         **kwargs) -> None:
+        """Get the items of a batch, whose indices are already
+        stored in `data.index`.  Subclasses may overwrite this method
+        to get the items in parallel.
+
+        Arguments
+        ---------
+        data:
+            The batch :py:class:`Data` object.
+        get_item:
+            The function to be called for each item, receiving the
+            item as first and its index as keyword argument `index`.
+        """
+        for item, item_index in zip(data, data.index):
+            get_item(item, index=item_index, **kwargs)
+
     #
     # Data
     #
@@ -855,7 +983,7 @@ class Indexed(Random, collections.abc.Sequence):
         """Get a random element. In a :py:class:`Indexed` datasource
         we can simply choose a random index and get that index.
         """
-        index = random.randrange(len(self))
+        index = int(self._rng.integers(len(self)))
         self._get_index(data, index=index, **kwargs)
 
 
@@ -6,14 +6,12 @@ directory.
 # standard imports
 from typing import Union, Iterable
 import os
-import glob
-import random
 import logging
 
 # toolbox imports
 from dltb.base.data import Data
 from dltb.tool.classifier import ClassScheme
-from dltb.util import read_cache, write_cache, cache_path
+from dltb.util import read_cache_lines, write_cache_lines, cache_path
 from .files import DataFiles
 from .datasource import Imagesource
 
@@ -118,13 +116,14 @@ class DataDirectory(DataFiles):
         if filenames_cache is None:
             filenames_cache = \
                 type(self).__name__.lower() + '-' + self.key + '-filenames.p'
-        self._filenames = filenames_cache and read_cache(filenames_cache)
+        self._filenames = \
+            filenames_cache and read_cache_lines(filenames_cache)
         if self._filenames is None:
             LOG.info("DataDirectory: creating new cache file '%s' for "
                      "data directory '%s'",
                      cache_path(filenames_cache), self.directory)
             self._prepare_filenames()
-            write_cache(filenames_cache, self._filenames)
+            write_cache_lines(filenames_cache, self._filenames)
         else:
             LOG.debug("DataDirectory: read %d filenames from cache '%s' for "
                       "data directory '%s'", len(self._filenames),
@@ -150,18 +149,29 @@ class DataDirectory(DataFiles):
         directory. Subclasses may implement alternative methods to
         collect filenames.
         """
-        # self._filenames = \
-        #         [f for f in os.listdir(self._directory)
-        #          if os.path.isfile(os.path.join(self._directory, f))]
         suffixes = \
             (self.suffix, ) if isinstance(self.suffix, str) else self.suffix
+        endings = tuple('.' + suffix for suffix in suffixes)
+        any_suffix = '*' in suffixes
+
+        # Traverse the directory tree in a single pass.  The entries
+        # provided by os.scandir() know their type, so there is no
+        # need for an extra stat() call per entry (as required when
+        # using os.listdir() or glob.glob()).
         filenames = []
-        for suffix in suffixes:
-            pattern = os.path.join(self._directory, "**", f"*.{suffix}")
-            filenames.extend(glob.glob(pattern, recursive=True))
-        # we need relative filenames!
-        index = len(str(self._directory)) + 1
-        self._filenames = [filename[index:] for filename in filenames]
+        directories = ['']
+        while directories:
+            subdir = directories.pop()
+            with os.scandir(os.path.join(self._directory, subdir)) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue  # ignore hidden files (like glob)
+                    if entry.is_dir():
+                        directories.append(os.path.join(subdir, entry.name))
+                    elif (entry.name.endswith(endings) or
+                          (any_suffix and '.' in entry.name)):
+                        filenames.append(os.path.join(subdir, entry.name))
+        self._filenames = filenames
         LOG.info("DataDirectory: prepared %d filenames from directory '%s'.",
                  len(self._filenames), self._directory)
 
@@ -200,8 +210,9 @@ class DataDirectory(DataFiles):
         """
         # FIXME[todo]: currently there is no list of subdirectories
         #              (self._subdirs)
-        subdir = random.choice(self._subdirs)
-        name = random.choice(os.listdir(os.path.join(self.directory, subdir)))
+        subdir = self._subdirs[self._rng.integers(len(self._subdirs))]
+        names = os.listdir(os.path.join(self.directory, subdir))
+        name = names[self._rng.integers(len(names))]
         self._get_data_from_file(data, os.path.join(subdir, name))
 
 
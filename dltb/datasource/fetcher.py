@@ -10,6 +10,8 @@ observers will receive a `data_changed` notification.
 # standard imports
 from typing import Iterator
 import time
+import queue
+import threading
 import logging
 
 # toolbox imports
@@ -64,6 +66,10 @@ class Datafetcher(BusyObservable, Datasource.Observer,
     _frames_per_second: float
         The number of frames to be fetched per second
         when running the loop.
+    _loop_condition: threading.Condition
+        A condition guarding changes of the looping state.  The loop
+        waits on this condition between two fetches, allowing it to
+        wake up immediately when stopped.
     """
 
     def __init__(self, datasource: Datasource = None,
@@ -78,6 +84,7 @@ class Datafetcher(BusyObservable, Datasource.Observer,
         
         # Loop specific variables
         self._looping = False
+        self._loop_condition = threading.Condition()
         self._frames_per_second = frames_per_second
 
         self.datasource = datasource
@@ -245,7 +252,9 @@ class Datafetcher(BusyObservable, Datasource.Observer,
 
         if self.looping:
             LOG.info("Stopping datasource loop")
-            self._looping = False
+            with self._loop_condition:
+                self._looping = False
+                self._loop_condition.notify_all()
         else:
             LOG.info("Starting datasource loop")
             if frames_per_second is not None:
@@ -260,34 +269,50 @@ class Datafetcher(BusyObservable, Datasource.Observer,
         try:
             LOG.info("Loop: start loop")
             if isinstance(self._datasource, Livesource):
-                self._datasource.start_loop()
-            self._looping = True
+                self._datasource.start_loop(self._frames_per_second)
+            with self._loop_condition:
+                self._looping = True
             self.change('state_changed')
 
-            # Run the loop
-            start_time = time.time()
+            # Run the loop: we use a monotonic clock (not affected by
+            # adjustments of the system time) and schedule each fetch
+            # relative to the previous schedule (not to the end of the
+            # previous fetch), so that delays do not accumulate.
+            # Values that do not change during the loop are looked up
+            # only once.
+            monotonic = time.monotonic
+            live = isinstance(self._datasource, Livesource)
+            debug = LOG.isEnabledFor(logging.DEBUG)
+            start_time = monotonic()
+            next_time = start_time
             while self._looping:
 
                 # adapt the speed
                 interval = 1. / self._frames_per_second
 
                 # fetch a data item
-                last_time = time.time()
-                LOG.debug("Loop: %s at %.4f",
-                          self._datasource, last_time - start_time)
-                self.fetch()
+                if debug:
+                    LOG.debug("Loop: %s at %.4f",
+                              self._datasource, monotonic() - start_time)
+                with self.batch_changes():
+                    # one notification per frame (instead of separate
+                    # busy and data notifications)
+                    self.fetch()
 
                 # now wait before fetching the next input
-                sleep_time = last_time + interval - time.time()
+                next_time += interval
+                sleep_time = next_time - monotonic()
                 if sleep_time < 0:
-                    LOG.debug("Loop: late for %.4fs", -sleep_time)
-                elif isinstance(self._datasource, Livesource):
-                    self._datasource.loop_stop_event.wait(timeout=sleep_time)
-                else:
-                    time.sleep(sleep_time)
-
-                if (isinstance(self._datasource, Livesource) and
-                        not self._datasource.looping):
+                    if debug:
+                        LOG.debug("Loop: late for %.4fs", -sleep_time)
+                    next_time -= sleep_time  # do not try to catch up
+                elif sleep_time > 0.001:
+                    with self._loop_condition:
+                        if self._loop_condition.wait_for(
+                                lambda: not self._looping, sleep_time):
+                            break  # the loop was stopped while waiting
+
+                if live and not self._datasource.looping:
                     self._looping = False
         finally:
             self._looping = False
@@ -353,11 +378,11 @@ class Datafetcher(BusyObservable, Datasource.Observer,
         we can simply increase the index by one.
         """
         self._assert_indexable()
+        length = len(self._datasource)
         current_index = self.index
-        if current_index == len(self) and not cycle:
+        if current_index == length - 1 and not cycle:
             raise ValueError("Cannot fetch after the last data object.")
-        next_index = (current_index + 1) if current_index < len(self) else 0
-        self.fetch(index=next_index, **kwargs)
+        self.fetch(index=(current_index + 1) % length, **kwargs)
 
     def fetch_prev(self, cycle: bool = True, **kwargs) -> None:
         """Fetch the previous entry. In a :py:class:`Indexed` datasource
@@ -367,8 +392,8 @@ class Datafetcher(BusyObservable, Datasource.Observer,
         current_index = self.index
         if current_index == 0 and not cycle:
             raise ValueError("Cannot fetch before the first data object.")
-        next_index = (current_index - 1) if current_index > 0 else len(self)
-        self.fetch(index=next_index, **kwargs)
+        self.fetch(index=(current_index - 1) % len(self._datasource),
+                   **kwargs)
 
     def fetch_first(self, **kwargs) -> None:
         """Fetch the first entry of this :py:class:`Indexed` datasource.
@@ -382,7 +407,7 @@ class Datafetcher(BusyObservable, Datasource.Observer,
         This is equivalent to fetching the element with index `len(self)-1`.
         """
         self._assert_indexable()
-        self.fetch(index=len(self)-1, **kwargs)
+        self.fetch(index=len(self._datasource)-1, **kwargs)
 
     #
     # Iterable interface
@@ -392,19 +417,103 @@ class Datafetcher(BusyObservable, Datasource.Observer,
         return self
 
     def __next__(self) -> Data:
-        if self._data is None:
+        data = self._next_data(self._data)
+        self._data = data
+        if data is None:
+            raise StopIteration()
+        return data
+
+    def _next_data(self, data: Data) -> Data:
+        """Get the data following the given data from the datasource.
+        This will not change the state of this :py:class:`Datafetcher`.
+
+        Arguments
+        ---------
+        data:
+            The current data. If `None`, the first data (batch) is
+            provided.
+
+        Result
+        ------
+        next_data:
+            The next data (batch) or `None` if the end of the datasource
+            was reached.
+        """
+        if data is None:
             index = 0
-        elif self._data.is_batch:
-            index = self._data[0].index + len(self._data)
+        elif data.is_batch:
+            index = data[0].index + len(data)
         else:
-            index = self._data.index + 1
+            index = data.index + 1
+
+        if index >= len(self._datasource):
+            return None
+        batch = (self._batch_size and
+                 min(len(self._datasource) - index, self._batch_size))
+        return self._datasource.get_data(index=index, batch=batch)
+
+    def prefetched(self, prefetch: int = 2) -> Iterator[Data]:
+        """Iterate over the datasource, like iterating over this
+        :py:class:`Datafetcher`, but with the next data being fetched
+        in a background thread while the current data are processed.
+
+        The background thread does not change the state of this
+        :py:class:`Datafetcher` (this is done when data are yielded).
+        If the datasource has a batch buffer (see
+        :py:meth:`Datasource.prepare_batch`), batches would be fetched
+        into memory still in use by the consumer, hence no data are
+        fetched in advance in that case.
 
-        if index < len(self._datasource):
-            batch = (self._batch_size and
-                     min(len(self._datasource) - index, self._batch_size))
-            self._data = \
-                self._datasource.get_data(index=index, batch=batch)
-        else:
-            self._data = None
-            raise StopIteration()
-        return self._data
+        Arguments
+        ---------
+        prefetch:
+            The maximal number of data objects fetched in advance.
+        """
+        if getattr(self._datasource, '_batch_buffer', None) is not None:
+            LOG.info("Datafetcher: not prefetching from %s, "
+                     "as it uses a batch buffer.", self._datasource)
+            yield from self
+            return
+
+        data_queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        end = object()  # sentinel marking the end of the iteration
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    data_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def producer(data: Data) -> None:
+            try:
+                while True:
+                    data = self._next_data(data)
+                    if data is None:
+                        break
+                    if not put(data):
+                        return
+            except BaseException as error:  # pylint: disable=broad-except
+                put(error)  # re-raised by the consumer
+            else:
+                put(end)
+
+        thread = threading.Thread(target=producer, args=(self._data,),
+                                  name='prefetcher', daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = data_queue.get()
+                if item is end:
+                    self._data = None
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                self._data = item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
@@ -2,6 +2,7 @@
 """
 
 # standard imports
+from typing import Tuple
 import os
 
 # third party imports
@@ -14,22 +15,40 @@ from .array import DataArray
 class DataFile(DataArray):
     """Data source for reading from a file.
 
+    The file is memory mapped, that is data are only read from disk
+    when accessed. This allows to work with large datasets without
+    loading them into memory.  The file is either an (uncompressed)
+    `.npy` file, or a raw binary file, in which case data type and
+    shape of the data have to be provided.
+
     Attributes
     ----------
     filename: str
         The name of the file from which the data are read.
+    _dtype:
+        The data type of a raw data file (`None` for `.npy` files).
+    _shape: Tuple[int, ...]
+        The shape of a raw data file (`None` for `.npy` files).
     """
 
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, dtype=None,
+                 shape: Tuple[int, ...] = None, **kwargs):
         """Create a new data file.
 
         Parameters
         ----------
         filename: str
             Name of the file containing the data
+        dtype:
+            The data type for a raw data file.
+        shape:
+            The shape of the data in a raw data file, with the first
+            axis indexing the data points.
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self._filename = filename
+        self._dtype = dtype
+        self._shape = shape
 
     def __str__(self):
         return f'<DataFile "{self._filename}"'
@@ -58,5 +77,9 @@ class DataFile(DataArray):
     #
 
     def _prepare(self) -> None:
-        self._array = np.load(self.filename, mmap_mode='r')
+        if self._dtype is None:
+            self._array = np.load(self.filename, mmap_mode='r')
+        else:
+            self._array = np.memmap(self.filename, dtype=self._dtype,
+                                    mode='r', shape=self._shape)
         self._description = os.path.basename(self.filename)
@@ -2,15 +2,41 @@
 """
 
 # standard imports
-from typing import List
+from typing import List, Callable, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
+import threading
 from abc import abstractmethod
 
+# third party imports
+import numpy as np
+
 # toolbox imports
 from dltb.base.data import Data
 from .datasource import Datasource, Indexed
 
 
+# An executor for loading the files of a batch in parallel. This is
+# separate from the executor in `dltb.base`, as batches are often
+# requested from that executor and waiting there for other tasks of
+# the same executor may deadlock.  Created on first use.
+_loader: ThreadPoolExecutor = None
+_loader_lock = threading.Lock()
+
+
+def _get_loader() -> ThreadPoolExecutor:
+    """Get the executor for loading files, creating it if necessary.
+    """
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = ThreadPoolExecutor(max_workers=4,
+                                             thread_name_prefix='loader')
+    return _loader
+
+
 # FIXME[todo]: maybe combined with DataDirectory to profit from
 # common features, like prefetching, caching, etc.
 
@@ -25,20 +51,37 @@ class DataFiles(Indexed, Datasource):
     directory: str
         Base directory relative to which filnames are to be
         interpreted (unless fully qualified).
+    _filename_index: Dict[str, int]
+        Reverse lookup table mapping filenames to their index in
+        the filelist.  Created on demand.
+    _datapoints: OrderedDict
+        The most recently loaded datapoints (least recently used first),
+        mapping absolute filenames to datapoints.
     """
 
     def __init__(self, filenames: List[str] = None,
-                 directory: str = None, **kwargs) -> None:
+                 directory: str = None, datapoint_cache: int = 0,
+                 **kwargs) -> None:
         """Create a new DataFiles data source.
 
         Parameters
         ----------
         filename    :   list of str
                         Names of the files containing the data
+        datapoint_cache :   int
+                        Number of loaded datapoints to keep in memory,
+                        so that revisiting a file (e.g., when
+                        navigating back and forth) does not have to read
+                        and decode it again.  Cached datapoints are
+                        shared, hence arrays are made read-only.
         """
         super().__init__(**kwargs)
         self._directory = directory
         self._filenames = filenames
+        self._filename_index = None
+        self._datapoints = OrderedDict()
+        self._datapoints_max = datapoint_cache
+        self._datapoints_lock = threading.Lock()
 
     def __str__(self):
         return f'<DataFiles with "{self.prepared and len(self)} files>'
@@ -47,7 +90,7 @@ class DataFiles(Indexed, Datasource):
         """The length of a :py:class:`DataFiles` is the number
         of files in the filelist.
         """
-        return len(self._filenames) if self.prepared else 0
+        return 0 if self._filenames is None else len(self._filenames)
 
     @property
     def directory(self):
@@ -66,6 +109,61 @@ class DataFiles(Indexed, Datasource):
 
     def _set_directory(self, directory: str):
         self._directory = directory
+        with self._datapoints_lock:
+            self._datapoints.clear()
+
+    def _index_for_filename(self, filename: str) -> int:
+        """Look up the index of a file in the filelist.
+
+        The reverse lookup table is (re)built when the filelist
+        was replaced or has changed its length, so that repeated
+        lookups do not require to scan the filelist.
+
+        Raises
+        ------
+        ValueError:
+            If the filename is not in the filelist.
+        """
+        index = self._filename_index
+        if (index is None or index[0] is not self._filenames or
+                len(index[1]) != len(self._filenames)):
+            index = (self._filenames,
+                     {name: i for i, name in enumerate(self._filenames)})
+            self._filename_index = index
+        try:
+            return index[1][filename]
+        except KeyError:
+            raise ValueError(f"'{filename}' is not in the list "
+                             "of files") from None
+
+    def _load_datapoint(self, filename: str) -> Any:
+        """Load a datapoint from a file, using the datapoint cache
+        if enabled.
+
+        Arguments
+        ---------
+        filename: str
+            The absolute filename from which the data should be loaded.
+        """
+        if not self._datapoints_max:
+            return self.load_datapoint_from_file(filename)
+
+        with self._datapoints_lock:
+            datapoint = self._datapoints.get(filename)
+            if datapoint is not None:
+                self._datapoints.move_to_end(filename)
+                return datapoint
+
+        # load outside the lock, to allow for parallel loading of batches
+        datapoint = self.load_datapoint_from_file(filename)
+        if isinstance(datapoint, np.ndarray):
+            # the cached array is shared: prevent modification in place
+            datapoint.setflags(write=False)
+        with self._datapoints_lock:
+            self._datapoints[filename] = datapoint
+            while len(self._datapoints) > self._datapoints_max:
+                self._datapoints.popitem(last=False)
+        return datapoint
 
     #
     # Preparable
@@ -142,12 +240,10 @@ class DataFiles(Indexed, Datasource):
 
         """
         abs_filename = os.path.join(self.directory, filename)
-        setattr(data, self._loader_kind,
-                self.load_datapoint_from_file(abs_filename))
+        setattr(data, self._loader_kind, self._load_datapoint(abs_filename))
         data.filename = abs_filename
         if self._filenames is not None and not hasattr(data, 'index'):
-            # FIXME[todo]: This can be improved by reverse lookup table
-            data.index = self._filenames.index(filename)
+            data.index = self._index_for_filename(filename)
 
     def _get_index(self, data: Data, index: int, **kwargs) -> None:
         """Implementation of the :py:class:`Indexed` interface. Lookup
@@ -158,3 +254,19 @@ class DataFiles(Indexed, Datasource):
                              "no filename register was provided.")
         data.index = index
         self._get_data_from_file(data, self._filenames[index])
+
+    def _get_batch_items(self, data: Data, get_item: Callable,
+                         **kwargs) -> None:
+        """Load the files of a batch in parallel.  Reading and decoding
+        (e.g., of JPEG images) mostly happens outside the Python
+        interpreter, so that disk latency and decoding of several
+        files can overlap.
+        """
+        if len(data) < 2:
+            super()._get_batch_items(data, get_item, **kwargs)
+            return
+        loader = _get_loader()
+        futures = [loader.submit(get_item, item, index=item_index, **kwargs)
+                   for item, item_index in zip(data, data.index)]
+        for future in futures:
+            future.result()  # wait for completion and propagate errors
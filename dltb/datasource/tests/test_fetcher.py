@@ -1,4 +1,5 @@
 from unittest import TestCase
+import time
 
 import numpy as np
 
@@ -29,3 +30,57 @@ class TestFetcher(TestCase):
         values = [n for n in self.fetcher]
         self.assertEqual(len(values), 3)
         #self.assertEqual(values[0].array, 4)
+
+    def test_next_prev(self):
+        """Cycling through an indexed datasource wraps around at both ends.
+        """
+        self.fetcher.fetch_last()
+        self.assertEqual(self.fetcher.index, 3)
+        self.fetcher.fetch_next()
+        self.assertEqual(self.fetcher.index, 0)
+        self.fetcher.fetch_prev()
+        self.assertEqual(self.fetcher.index, 3)
+        self.assertRaises(ValueError, self.fetcher.fetch_next, cycle=False)
+
+    def test_random_batch(self):
+        """A random batch is filled from randomly drawn indices.
+        """
+        data = self.datasource.get_data(random=True, batch=6)
+        self.assertEqual(len(data.index), 6)
+        self.assertEqual(np.asarray(data.array).tolist(),
+                         (data.index + 3).tolist())
+        other = self.datasource.get_data(random=True, batch=6, seed=42)
+        again = self.datasource.get_data(random=True, batch=6, seed=42)
+        self.assertEqual(other.index.tolist(), again.index.tolist())
+
+    def test_prefetched(self):
+        """Prefetching yields the same data as plain iteration.
+        """
+        self.fetcher.reset()
+        values = [int(data.array) for data in self.fetcher.prefetched()]
+        self.assertEqual(values, [3, 4, 5, 6])
+        self.fetcher.reset()
+        for data in self.fetcher.prefetched(prefetch=1):
+            break  # stopping early must not block
+        self.assertEqual(data.array, 3)
+        self.assertIs(self.fetcher.data, data)
+
+    def test_prefetched_batch_buffer(self):
+        """No data are fetched in advance into a batch buffer, as
+        this would overwrite the batch still in use.
+        """
+        self.datasource.prepare_batch(2, (), dtype=np.int64)
+        fetcher = Datafetcher(self.datasource, batch_size=2)
+        fetcher.reset()
+        get_data = self.datasource.get_data
+        fetched = []
+
+        def counting_get_data(**kwargs):
+            fetched.append(kwargs['index'])
+            return get_data(**kwargs)
+
+        self.datasource.get_data = counting_get_data
+        for batch in fetcher.prefetched():
+            time.sleep(0.01)  # give a producer the chance to run ahead
+            self.assertEqual(fetched[-1], batch[0].index)
+        self.assertEqual(fetched, [0, 2])
@@ -0,0 +1,67 @@
+"""Tests for the :py:class:`DataFiles` datasource.
+"""
+
+# standard imports
+from unittest import TestCase
+import os
+import tempfile
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from ..directory import DataDirectory
+
+
+class CountingFiles(DataDirectory):
+    """:py:class:`DataFiles` (in a :py:class:`DataDirectory`) counting
+    the files actually loaded.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.set_loader(np.load, kind='array')
+        self.loaded = []
+
+    def load_datapoint_from_file(self, filename: str) -> np.ndarray:
+        self.loaded.append(filename)
+        return super().load_datapoint_from_file(filename)
+
+
+class TestDataFiles(TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.directory = self._tmpdir.name
+        self.filenames = []
+        for index in range(4):
+            filename = f'{index}.npy'
+            np.save(os.path.join(self.directory, filename),
+                    np.full((2, 2), index))
+            self.filenames.append(filename)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_index_for_filename(self):
+        datasource = CountingFiles(filenames=self.filenames,
+                                   directory=self.directory)
+        self.assertEqual(datasource._index_for_filename('2.npy'), 2)
+        datasource._filenames.append('4.npy')
+        self.assertEqual(datasource._index_for_filename('4.npy'), 4)
+        with self.assertRaises(ValueError):
+            datasource._index_for_filename('5.npy')
+
+    def test_datapoint_cache(self):
+        datasource = CountingFiles(filenames=self.filenames,
+                                   directory=self.directory,
+                                   datapoint_cache=2)
+        for index in (0, 1, 0, 2, 1):
+            data = datasource[index]
+            self.assertEqual(data.array[0, 0], index)
+        # 1 was evicted by 2, as 0 was used more recently
+        self.assertEqual(len(datasource.loaded), 4)
+
+        # cached datapoints are shared and hence can not be modified
+        with self.assertRaises(ValueError):
+            datasource[0].array[0, 0] = 42
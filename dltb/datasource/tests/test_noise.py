@@ -1,5 +1,7 @@
 from unittest import TestCase
 
+import numpy as np
+
 from ..noise import Noise
 
 
@@ -20,3 +22,15 @@ class TestNoise(TestCase):
     def test_shape2(self):
         data = self.datasource.get_random(shape=(5, 5))
         self.assertEqual(data.shape, (5, 5))
+
+    def test_batch_buffer(self):
+        self.datasource.prepare_batch(4, (10, 10))
+        data = self.datasource.get_data(batch=3)
+        self.assertIsInstance(data.array, np.ndarray)
+        self.assertEqual(data.array.shape, (3, 10, 10))
+        self.assertIs(data.array.base, self.datasource._batch_buffer)
+
+    def test_batch_stacked(self):
+        data = self.datasource.get_data(batch=2)
+        self.assertIsInstance(data.array, np.ndarray)
+        self.assertEqual(data.array.shape, (2, 10, 10))
@@ -34,6 +34,9 @@ class Video(Indexed, Imagesource, Livesource):
         The currently fetched frame.
         If the frame changes, Observers of this :py:class:`Video`
         will receive a `data_changed` notification.
+    _length:
+        The number of frames of the video (determined when preparing
+        the :py:class:`Video`, as querying the backend may be costly).
     """
 
     def __init__(self, filename: str, **kwargs):
@@ -43,6 +46,7 @@ class Video(Indexed, Imagesource, Livesource):
         self._filename = filename
         self._backend = None
         self._frame = None
+        self._length = None
         self._description = "Frames from the video \"{}\"".format(filename)
 
     def __str__(self):
@@ -64,6 +68,7 @@ class Video(Indexed, Imagesource, Livesource):
         super()._prepare()
         self._backend = Reader(filename=self._filename)
         self._loop_interval = 1. / self._backend.frames_per_second
+        self._length = len(self._backend)
 
     def _unprepare(self) -> None:
         """Unprepare this Datasource. This will free resources but
@@ -74,6 +79,7 @@ class Video(Indexed, Imagesource, Livesource):
             del self._backend
             self._backend = None
         self._frame = None
+        self._length = None
         super()._unprepare()
 
     #
@@ -180,9 +186,9 @@ class Video(Indexed, Imagesource, Livesource):
     def __len__(self) -> int:
         """The length of a video is the number of frames it is composed of.
         """
-        if not self.prepared:
+        if self._length is None:
             raise RuntimeError("Applying len() to unprepare Video object.")
-        return len(self._backend)
+        return self._length
 
 
 class Thumbcinema(Reader):
@@ -16,11 +16,13 @@ Examples
 
 """
 # standard imports
-import sys
 import time
 import threading
 import logging
 
+# third party imports
+import numpy as np
+
 # toolbox imports
 from ..base.video import Webcam
 from ..base.data import Data
@@ -41,6 +43,19 @@ class DataWebcam(Livesource, Imagesource):
 
     _device: int
         Device number of the webcam to use.
+
+    _camera_period: float
+        The interval between two frames of the webcam (`None` if
+        unknown).
+    _loop_thread: threading.Thread
+        A thread continuously grabbing frames from the webcam
+        (only used if the webcam driver buffers frames and the loop
+        does not keep pace with the webcam).
+    _loop_request: threading.Event
+        Set by the consumer to request a frame from the loop thread.
+    _loop_ready: threading.Event
+        Set by the loop thread once the requested frame has been
+        stored in `_loop_frame`.
     """
 
     def __init__(self, key: str = "Webcam", description: str = "<Webcam>",
@@ -55,8 +70,11 @@ class DataWebcam(Livesource, Imagesource):
         super().__init__(key=key, description=description, **kwargs)
         self._device = device
         self._backend = None
+        self._camera_period = None
         self._loop_thread = None
-        self._loop_data = None
+        self._loop_request = threading.Event()
+        self._loop_ready = threading.Event()
+        self._loop_frame = None
 
     def __str__(self) -> str:
         return "Webcam"
@@ -76,6 +94,8 @@ class DataWebcam(Livesource, Imagesource):
         """
         super()._prepare()
         self._backend = Webcam(device=self._device)
+        fps = self._backend.frames_per_second
+        self._camera_period = 1. / fps if fps else None
 
     def _unprepare(self) -> None:
         """Unprepare this Datasource. This will free resources but
@@ -113,20 +133,33 @@ class DataWebcam(Livesource, Imagesource):
             one should first empty the buffer before reading the data.
         """
         LOG.debug("Webcam._get_data(snapshot=%r)", snapshot)
-        data.array = (self._loop_data if self.looping else
-                      self._backend.read_frame(clear_buffer=snapshot))
+        frame = None
+        if self._loop_thread is not None:
+            frame = self._loop_snapshot()
+        if frame is None:
+            # a loop reading every frame keeps the buffer empty
+            frame = self._backend.read_frame(clear_buffer=snapshot and
+                                             not self.looping)
+        data.array = frame
         super()._get_snapshot(data, snapshot, **kwargs)
 
     #
     # Loop
     #
 
-    def start_loop(self):
+    def start_loop(self, frames_per_second: float = None):
         """Start an asynchronous loop cycle. This method will return
         immediately, running the loop cycle in a background thread.
+
+        If the video driver buffers frames, a background thread
+        grabbing frames is needed to obtain current frames. However,
+        if the loop reads (about) every frame of the webcam, the
+        buffer does not fill up and plain reads are sufficient.
         """
-        super().start_loop()
-        if sys.platform == 'linux':
+        super().start_loop(frames_per_second)
+        keeps_pace = (self._camera_period is not None and
+                      self._loop_interval <= 1.5 * self._camera_period)
+        if self._backend.buffer_size > 1 and not keeps_pace:
             self._loop_thread = threading.Thread(target=self._run_loop_linux)
             self._loop_thread.start()
             LOG.info("Webcam: loop thread started.")
@@ -135,28 +168,61 @@ class DataWebcam(Livesource, Imagesource):
         """Stop a currently running loop.
         """
         super().stop_loop()
-        if sys.platform == 'linux' and self._loop_thread is not None:
+        if self._loop_thread is not None:
             self._loop_thread.join()
             self._loop_thread = None
             LOG.info("Webcam: loop thread joined.")
 
     def _run_loop_linux(self) -> None:
-        """Under linux, the av-based linux capture code is using
-        an internal fifo (5 frames, iirc), and you cannot clean (or
-        say, flush) it.
-
-        Hence we will apply another loop logic: we read frames as
-        fast as possible and only report them at certain times.
+        """If the video driver is using an internal fifo (like the
+        av-based linux capture code, with 5 frames, iirc), and you
+        cannot clean (or say, flush) it, we will apply another loop
+        logic: we grab frames as fast as possible and only decode
+        and report them at certain times.
         """
         LOG.info("Webcam: employing linux loop")
+        # Keep the Python work between two frames minimal: the
+        # backend releases the GIL while waiting for the next frame,
+        # but everything else in this loop competes with other
+        # threads for the interpreter.
+        grab_frame = self._backend.grab_frame
+        stopped = self.loop_stop_event.is_set
+        requested = self._loop_request.is_set
         fetched = 0
-        start_time = time.time()
-        while not self.loop_stop_event.is_set():
-            self._loop_data = self._backend.read_frame(clear_buffer=False)
-            last_time = time.time()
+        start_time = time.monotonic()
+        while not stopped():
+            grab_frame()
             fetched += 1
-            LOG.debug("Webcam: fetched: %d, frames per second: %.1f",
-                      fetched, fetched/(last_time-start_time))
+            if requested():
+                # only decode frames that were actually requested
+                self._loop_request.clear()
+                self._loop_frame = self._backend.retrieve_frame()
+                self._loop_ready.set()
+        duration = time.monotonic() - start_time
+        LOG.info("Webcam: grabbed %d frames in %.1fs (%.1f fps)",
+                 fetched, duration, fetched / max(duration, 1e-6))
+
+    def _loop_snapshot(self, timeout: float = 1.) -> np.ndarray:
+        """Obtain a frame from the loop thread.  The frame is handed
+        over from the loop thread without accessing the webcam from
+        the calling thread, that is without competing with the loop
+        thread for the webcam.
+
+        Result
+        ------
+        frame:
+            The frame or `None` if the loop thread did not provide a
+            frame in time (e.g., because the loop was stopped).
+        """
+        self._loop_ready.clear()
+        self._loop_request.set()
+        if not self._loop_ready.wait(timeout=timeout):
+            self._loop_request.clear()
+            return None
+        # do not keep a reference to the frame: once the consumer has
+        # released it, the backend may reuse its memory for the next frame
+        frame, self._loop_frame = self._loop_frame, None
+        return frame
 
     #
     # information
@@ -2,7 +2,7 @@
 """
 
 # standard imports
-from typing import Tuple, Any, Union, List, Iterator, Iterable, Container
+from typing import Tuple, Any, Union, List, Dict, Iterator, Iterable, Container
 from collections import OrderedDict
 import functools
 import operator
@@ -188,6 +188,12 @@ class Network(Extendable, Preparable, method='network_changed',
     # FIXME[todo]: channel ordering is relevant when processing
     # actiations
 
+    # the data type expected as network input: quantized networks
+    # (taking uint8/int8 input) should set this in subclasses, so that
+    # preprocessing can keep data in that type instead of converting
+    # it to (normalized) float values.
+    _input_dtype: np.dtype = np.dtype(np.float32)
+
     def __init__(self, key: str = None, data_format: str = None,
                  **kwargs) -> None:
         """
@@ -219,6 +225,25 @@ class Network(Extendable, Preparable, method='network_changed',
     def data_format(self, axis: str) -> None:
         self._data_format = axis
 
+    @property
+    def layer_dict(self) -> Dict[str, 'Layer']:
+        """A dictionary mapping layer ids to the layers of this
+        :py:class:`Network` (in order).  The dictionary should not be
+        changed in place - to change the layers, assign a new dictionary.
+        """
+        return self._layer_dict
+
+    @layer_dict.setter
+    def layer_dict(self, layer_dict: Dict[str, 'Layer']) -> None:
+        self._layer_dict = layer_dict
+        self._layer_tuple_cache = None
+
+    @property
+    def input_dtype(self) -> np.dtype:
+        """The data type of the input of this :py:class:`Network`.
+        """
+        return self._input_dtype
+
     #
     # Sized interface
     #
@@ -247,8 +272,8 @@ class Network(Extendable, Preparable, method='network_changed',
         """
         if isinstance(key, str):
             return self.layer_dict[key]
-        elif isinstance[key, int]:
-            return list(self.layer_dict.items())[key]
+        elif isinstance(key, int):
+            return self._layer_tuple()[key]
         elif isinstance(key, Registrable):
             return self.layer_dict[key.key]
         raise KeyError(f"No layer for key '{key}' in network.")
@@ -298,16 +323,26 @@ class Network(Extendable, Preparable, method='network_changed',
         if isinstance(layer, str):
             return self.layer_dict[layer]
         if isinstance(layer, int):
-            return tuple(self.layer_dict.values())[layer]
+            return self._layer_tuple()[layer]
         raise TypeError("Network index argument layer has invalid type "
                         f"{type(layer)}, should by str or int")
 
+    def _layer_tuple(self) -> Tuple['Layer', ...]:
+        """The layers of this :py:class:`Network` as a tuple, allowing
+        for efficient access by index (layers are looked up by index
+        on each unit selection in the user interface).  The tuple is
+        created on first use after the :py:attr:`layer_dict` was set.
+        """
+        if self._layer_tuple_cache is None:
+            self._layer_tuple_cache = tuple(self._layer_dict.values())
+        return self._layer_tuple_cache
+
     # @busy("getting activations")
     def get_activations(self, inputs: np.ndarray,
                         layer_ids: Any = None,
                         data_format: str = None,
                         as_dict: bool = False) \
-            -> Union[np.ndarray, List[np.ndarray]]:
+            -> Union[np.ndarray, List[np.ndarray], Dict[str, np.ndarray]]:
         """Gives activations values of the loaded_network/model
         for given layers and an input sample.
 
@@ -329,12 +364,17 @@ class Network(Extendable, Preparable, method='network_changed',
             be back-transformed accordingly. If `None` (default), the
             method will try to automatically determine the data format
             of `inputs`.
+        as_dict:
+            If `True` and a list of layers was given, the activation
+            values are returned as a dictionary mapping layer_ids to
+            arrays, instead of a list.
 
         Returns
         -------
         activations:
             Depending on the `layers` argument, either a single
-            array or a list of arrays providing the activation values.
+            array or a list (or dictionary) of arrays providing the
+            activation values.
         """
         LOG.debug("Network[%s].get_activations: inputs[%s]: %s (%s, %s), "
                   "layers=%s", self.key, type(inputs).__name__,
@@ -352,22 +392,21 @@ class Network(Extendable, Preparable, method='network_changed',
                   getattr(internal, 'shape', '?'), self._internal_format,
                   getattr(internal, 'dtype', '?'))
         activations = self._get_activations(internal, layer_ids)
-        print(f"Network.get_activations: {type(activations)}, "
-              f"[0]: {type(activations[0])} {activations[0].shape}")
 
         # Transform the output to stick to the canocial interface.
-        activations = [self._transform_outputs(activation, data_format,
-                                               unbatch=batched,
-                                               internal=not internalized)
-                       for activation in activations]
+        def transform(activation: np.ndarray) -> np.ndarray:
+            return self._transform_outputs(activation, data_format,
+                                           unbatch=batched,
+                                           internal=not internalized)
+
         # If it was just asked for the activations of a single layer,
         # return just an array.
         if not is_list:
-            activations = activations[0]
-        elif as_dict:
-            activations = {layer_id: activation for layer_id, activation
-                           in zip(layer_ids, activations)}
-        return activations
+            return transform(activations[0])
+        if as_dict:
+            return {layer_id: transform(activation) for layer_id, activation
+                    in zip(layer_ids, activations)}
+        return [transform(activation) for activation in activations]
 
     def get_net_input(self, layer_ids: Any,
                       input_samples: np.ndarray,
@@ -1096,7 +1135,8 @@ class ImageNetwork(ImageExtension, ImageTool, base=Network):
                         layer_ids: Any = None,
                         data_format: str = None,
                         as_dict: bool = False
-                        ) -> Union[np.ndarray, List[np.ndarray]]:
+                        ) -> Union[np.ndarray, List[np.ndarray],
+                                   Dict[str, np.ndarray]]:
         """
         """
 
@@ -1121,23 +1161,19 @@ class ImageNetwork(ImageExtension, ImageTool, base=Network):
                   len(activations), self._internal_format)
 
         # Transform the output to stick to the canocial interface.
-        activations = [self._transform_outputs(activation, data_format,
-                                               unbatch=not batched,
-                                               internal=False)
-                       for activation in activations]
-
-        LOG.debug("ImageNetwork.getActivations: output activations=%s (%s/%s)",
-                  #activations[0].shape, data_format, self.data_format)
-                  len(activations), data_format, self.data_format)
+        def transform(activation: np.ndarray) -> np.ndarray:
+            return self._transform_outputs(activation, data_format,
+                                           unbatch=not batched,
+                                           internal=False)
 
         # If it was just asked for the activations of a single layer,
         # return just an array.
         if not is_list:
-            activations = activations[0]
-        elif as_dict:
-            activations = {layer_id: activation for layer_id, activation
-                           in zip(layer_ids, activations)}
-        return activations
+            return transform(activations[0])
+        if as_dict:
+            return {layer_id: transform(activation) for layer_id, activation
+                    in zip(layer_ids, activations)}
+        return [transform(activation) for activation in activations]
 
     #
     # Implementation of the Tool interface (not used yet)
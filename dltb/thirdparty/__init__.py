@@ -11,7 +11,7 @@ sound, video) using different libraries.
 """
 
 # standard imports
-from typing import Union, List, Iterator, Any
+from typing import Union, List, Iterator, Any, Dict, Tuple
 import sys
 import logging
 import importlib
@@ -41,7 +41,23 @@ _BASE_CLASSES = {
     'ImageGAN': _DLTB + '.tool.gan.ImageGAN',
 }
 
+# If a class is provided by multiple available third-party modules,
+# the module listed last is used (unless another one was already
+# imported).  Hence 'skimage' and 'pil' precede 'opencv', making
+# OpenCV the preferred ImageResizer.
 _MODULES = {
+    'skimage': {
+        'modules': ['skimage'],
+        'classes': {
+            'ImageResizer': 'ImageUtil'
+        }
+    },
+    'pil': {
+        'modules': ['PIL', 'numpy'],
+        'classes': {
+            'ImageResizer': 'ImageUtil'
+        }
+    },
     'imageio': {
         'modules': ['imageio', 'imageio_ffmpeg', 'numpy'],
         'classes': {
@@ -82,10 +98,10 @@ _MODULES = {
             'ImageDisplay': 'Display'
         }
     },
-    'skimage': {
-        'modules': ['skimage'],
+    'turbojpeg': {
+        'modules': ['turbojpeg', 'numpy'],
         'classes': {
-            'ImageResizer': 'ImageUtil'
+            'ImageReader': 'ImageReader'
         }
     },
     'sklearn': {
@@ -301,11 +317,20 @@ def available(module: str) -> bool:
     return found
 
 
+# classes resolved by `import_class`, keyed by (name, module)
+_class_cache: Dict[Tuple[str, Union[str, Tuple[str, ...]]], type] = {}
+
+
 def import_class(name: str, module: Union[str, List[str]] = None) -> type:
     """Import a class from a third-party module.  The class is specified
     as one of the abstract base classes of the deep learning toolbox,
     listed in the array `_BASE_CLASSES`.
 
+    The resolved class is cached, that is subsequent calls with the
+    same arguments will return the same class without probing the
+    third-party modules again (even if further modules get imported
+    in the meantime).
+
     Arguments
     ---------
     name: str
@@ -318,7 +343,19 @@ def import_class(name: str, module: Union[str, List[str]] = None) -> type:
         argument will be ignored if `name` is a fully qualified class
         name.
     """
-
+    key = (name, module if module is None or isinstance(module, str)
+           else tuple(module))
+    try:
+        return _class_cache[key]
+    except KeyError:
+        cls = _class_cache[key] = _import_class(name, module)
+        return cls
+
+
+def _import_class(name: str, module: Union[str, List[str]] = None) -> type:
+    """Resolve and import a third-party class (uncached implementation
+    of :py:func:`import_class`).
+    """
     # FIXME[hack]: integrate with the rest of the function
     if name not in _BASE_CLASSES and '.' in name:
         module_full_name, class_name = name.rsplit('.', maxsplit=1)
@@ -489,6 +526,8 @@ class ImportInterceptor(importlib.abc.MetaPathFinder):
             # now add the fullname again, as find_spec may be called
             # multiple times before the module actually gets loaded.
             self._post_imports[fullname] = args
+            if module_spec is None:
+                return None  # module is not installed
 
             # Adapt the Loader of the module_spec
             module_spec.loader = \
@@ -15,8 +15,6 @@
 
 # standard imports
 import os
-import re
-import random
 import logging
 
 # third party imports
@@ -30,6 +28,9 @@ from dltb.datasource import Imagesource, Sectioned, DataDirectory
 # logging
 LOG = logging.getLogger(__name__)
 
+# prefix of the filenames in the ILSVRC2012 validation set
+_VAL_PREFIX = 'ILSVRC2012_val_'
+
 
 class ImagenetScheme(ClassScheme):
     """The ImageNet classification scheme.
@@ -79,20 +80,11 @@ class ImagenetScheme(ClassScheme):
         """
         super().__init__(length=1000, *args, **kwargs)
 
-    @property
-    def prepared(self) -> bool:
-        """Check if the :py:class:`ImagenetScheme` has been initialized.
-        """
-        return 'synset' in self._labels
-
-    def prepare(self) -> None:
+    def _prepare(self) -> None:
         """Prepare the labels for the ImageNet dataset.
         The labels will be read in from the file 'imagenet_labels.txt'
         contained in the `assets` folder of the toolbox.
         """
-        if self.prepared:
-            return  # nothing to do ...
-
         imagenet_labels_filename = \
             os.path.join('assets', 'imagenet_labels.txt')
         ids = []
@@ -202,8 +194,13 @@ class ImageNet(DataDirectory, Imagesource, Sectioned,
         some metadata, allowing to map the (numeric) validation labels
         from 'val_labels.txt' to synsets.
 
-    _val_labels: list[int]
-        A list assigning labels to the images from the validation set.
+    _category_files: dict[str, list[str]]
+        A cache of the files in the category directories of the
+        'train' section (filled on demand when fetching random images
+        of a given category).
+
+    _val_labels: np.ndarray
+        An array assigning labels to the images from the validation set.
         This is only initialized for the 'val' section.  It is read
         in from the file ''ILSVRC2012_validation_ground_truth.txt'
         in the 'imagenet_data/ILSVRC2012_devkit_t12/data/' directory.
@@ -240,6 +237,7 @@ class ImageNet(DataDirectory, Imagesource, Sectioned,
                          label_from_directory='synset',
                          **kwargs)
         self._val_labels = None
+        self._category_files = {}
 
     def __str__(self):
         return f"ImageNet ({self._section})"
@@ -253,6 +251,7 @@ class ImageNet(DataDirectory, Imagesource, Sectioned,
         """Prepare the ImageNet data.
         """
         LOG.info("Preparing ImageNet (%s): %s", self._section, self.directory)
+        self._category_files = {}
 
         filenames_cache = f"imagenet_{self._section}_filelist.p"
         super()._prepare(filenames_cache=filenames_cache, **kwargs)
@@ -292,9 +291,9 @@ class ImageNet(DataDirectory, Imagesource, Sectioned,
                 val_labels = \
                     os.path.join(self._imagenet_data, 'val_labels.txt')
         try:
-            with open(val_labels) as file:
-                self._val_labels = [int(l.strip())-1 for l in file.readlines()]
-                LOG.info("val_labels: %d", len(self._val_labels))
+            # a compact array instead of 50,000 Python ints
+            self._val_labels = np.loadtxt(val_labels, dtype=np.int16) - 1
+            LOG.info("val_labels: %d", len(self._val_labels))
         except FileNotFoundError:
             LOG.warning("ImageNet validation labels not found, "
                         "will provide unlabeled data."
@@ -341,10 +340,15 @@ class ImageNet(DataDirectory, Imagesource, Sectioned,
         if self._section == 'train':
             super()._get_data_from_file(data, filename)
         elif self._section == 'val' and self._val_labels is not None:
-            match_object = re.search('ILSVRC2012_val_([0-9]*).JPEG', filename)
-            if match_object is not None:
-                label = self._val_labels[int(match_object.group(1))-1]
-                data.label = self._scheme.identifier(label)
+            # filenames have the form 'ILSVRC2012_val_NNNNNNNN.JPEG':
+            # plain string operations are much cheaper than a regex here
+            start = filename.rfind(_VAL_PREFIX)
+            if start >= 0:
+                start += len(_VAL_PREFIX)
+                number = filename[start:filename.find('.', start)]
+                if number.isdigit():
+                    label = int(self._val_labels[int(number)-1])
+                    data.label = self._scheme.identifier(label)
 
     def _get_random(self, data: Data, category: int = None, **kwargs) -> None:
         # pylint: disable=arguments-differ
@@ -355,8 +359,16 @@ class ImageNet(DataDirectory, Imagesource, Sectioned,
         """
         if category is not None and self._section == 'train':
             subdir = self._scheme.get_label(category, 'synset')
-            img_dir = os.path.join(self.directory, subdir)
-            filename = random.choice(os.listdir(img_dir))
+            filenames = self._category_files.get(subdir)
+            if filenames is None:
+                # list the category directory only once
+                img_dir = os.path.join(self.directory, subdir)
+                with os.scandir(img_dir) as entries:
+                    filenames = [entry.name for entry in entries
+                                 if entry.is_file()]
+                self._category_files[subdir] = filenames
+            # use the generator of this datasource (respecting its seed)
+            filename = filenames[self._rng.integers(len(filenames))]
             self._get_data_from_file(data, os.path.join(subdir, filename))
         else:
             super()._get_random(data, **kwargs)
@@ -32,20 +32,11 @@ class WiderfaceScheme(ClassScheme):
         # that only 61 are used - class '60' is missing).
         super().__init__(length=62, key='widerface')
 
-    @property
-    def prepared(self) -> bool:
-        """Check if the :py:class:`WiderfaceScheme` has been initialized.
-        """
-        return 'text' in self._labels
-
-    def prepare(self) -> None:
+    def _prepare(self) -> None:
         """Prepare the labels for the Widerface dataset.
         The labels will be read in from the directory names
         in the WIDERFACE_DATA directory.
         """
-        if self.prepared:
-            return  # nothing to do ...
-
         widerface_data = os.getenv('WIDERFACE_DATA')
         train_dir = os.path.join(widerface_data, 'WIDER_train', 'images')
         text = [''] * len(self)
@@ -4,6 +4,7 @@ classes mapping the toolbox API onto the opencv library.
 
 # standard imports
 from typing import Union, Tuple, List
+import sys
 import logging
 import threading
 
@@ -13,6 +14,7 @@ import numpy as np
 
 # toolbox imports
 from ...base import image, video
+from ...base.image import Image, Colorspace
 
 # logging
 LOG = logging.getLogger(__name__)
@@ -55,6 +57,20 @@ class OpenCV:
         pass
 
 
+def _rgb_to_bgr(array: np.ndarray) -> np.ndarray:
+    """Convert an RGB(A) array into BGR, using `cv2.cvtColor`.
+    Arrays of types not supported by OpenCV are left to the builtin
+    conversion of :py:meth:`image.Image.as_array`.
+    """
+    if array.dtype not in (np.uint8, np.uint16, np.float32):
+        return None
+    code = cv2.COLOR_RGB2BGR if array.shape[2] == 3 else cv2.COLOR_RGBA2BGR
+    return cv2.cvtColor(array, code)
+
+
+image.Image.add_colorspace_converter(image.Colorspace.BGR, _rgb_to_bgr)
+
+
 class ImageIO(image.ImageReader, image.ImageWriter):
 
     def read(self, filename: str, **kwargs) -> np.ndarray:
@@ -75,12 +91,12 @@ class ImageIO(image.ImageReader, image.ImageWriter):
         #    It specifies to load an image as such including alpha
         #    channel. Alternatively, we can pass integer value -1 for
         #    this flag.
-        return cv2.cvtColor(cv2.imread(filename), cv2.COLOR_BGR2RGB)
+        image = cv2.imread(filename)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
 
     def write(self, image: image.Imagelike, filename: str, **kwargs) -> None:
         cv2.imwrite(filename,
-                    cv2.cvtColor(image.Image.as_array(image),
-                                 cv2.COLOR_RGB2BGR))
+                    Image.as_array(image, colorspace=Colorspace.BGR))
 
 
 class ImageDisplay(image.ImageDisplay):
@@ -148,10 +164,22 @@ class ImageDisplay(image.ImageDisplay):
 
 class ImageUtils(image.ImageResizer):
 
-    def resize(self, image: np.ndarray, size=(640, 360)) -> np.ndarray:
+    _interpolations = {
+        'linear': cv2.INTER_LINEAR,
+        'nearest': cv2.INTER_NEAREST,
+        'cubic': cv2.INTER_CUBIC,
+        'area': cv2.INTER_AREA,
+    }
+
+    def resize(self, image: np.ndarray, size=(640, 360),
+               interpolation: str = 'linear') -> np.ndarray:
         """Resize the frame to a smaller resolution to save computation cost.
+        The data type of the image (e.g., `np.uint8` or `np.float32`)
+        is preserved.
         """
-        return cv2.resize(image, size, interpolation=cv2.INTER_LINEAR)
+        image = Image.as_array(image)
+        return cv2.resize(image, tuple(size),
+                          interpolation=self._interpolations[interpolation])
 
 
 class VideoReader(video.Reader):
@@ -214,7 +242,7 @@ class VideoReader(video.Reader):
         # frame: is the image (in BGR!)
         if not ok:
             raise RuntimeError("Error reading frame fom video.")
-        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
         
     #
     # FIXME[question]: when is this needed?
@@ -323,7 +351,9 @@ class VideoFileReader(VideoReader, video.FileReader):
             if not ret:
                 raise RuntimeError("Reading an image from video capture "
                                    f"at frame {index} failed!")
-        return image[:, :, ::-1]  # convert OpenCV BGR representation to RGB
+        # convert OpenCV BGR representation to RGB (in place, as the
+        # frame was freshly allocated by read())
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
 
     # FIXME[old]: opencv seems to have its own means to jump to
     # a specific time - is there any benefit compared to our
@@ -346,7 +376,8 @@ class VideoFileReader(VideoReader, video.FileReader):
                 raise RuntimeError("Reading an image from video capture "
                                    f"at {time_in_seconds:.4f}s "
                                    f"({time}) failed!")
-        return frame[:, :, ::-1]  # convert OpenCV BGR representation to RGB
+        # convert OpenCV BGR representation to RGB
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
 
 
 class VideoFileWriter(video.Writer):
@@ -371,6 +402,9 @@ class Webcam(video.Webcam, VideoReader):
     ----------
     _capture: cv2.VideoCapture
         A capture object
+    _frame_buffer: np.ndarray
+        The array holding the last frame.  It is reused for the next
+        frame if no one else holds a reference to it anymore.
     """
     # FIXME[problem]: it seems to be problematic to use two webcams
     # at the same time. It may help to reduce the resolution or
@@ -425,8 +459,42 @@ class Webcam(video.Webcam, VideoReader):
         """
         super().__init__(init=device, device=device, **kwargs)
         LOG.info("Camera device: %d", device)
+        self._frame_buffer = None
+        # Ask the driver to only keep the most recent frame, so that
+        # there is no need to skip outdated frames when reading.
+        # Not all backends honour this setting.
+        self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if self._capture.get(cv2.CAP_PROP_BUFFERSIZE) == 1:
+            self._buffer_size = 1
+        LOG.info("Buffer size: %s", self._buffer_size)
         LOG.info("Frames per second: %f",
                  self._capture.get(cv2.CAP_PROP_FPS))
 
     def __str__(self) -> str:
         return f"OpenCV Webcam ({self.device})"
+
+    def _frames_per_second(self) -> float:
+        """The frame rate reported by the webcam driver (0 if unknown).
+        """
+        return self._capture.get(cv2.CAP_PROP_FPS)
+
+    def _grab_frame(self) -> None:
+        """Grab the next frame, without decoding it.
+        """
+        if not self._capture.grab():
+            raise RuntimeError("Error grabbing frame from webcam.")
+
+    def _retrieve_frame(self) -> np.ndarray:
+        """Decode the frame last grabbed.
+        """
+        # Let OpenCV decode into the previous frame buffer, unless that
+        # frame is still in use (the only references being our
+        # attribute and the argument of getrefcount).
+        if (self._frame_buffer is not None and
+                sys.getrefcount(self._frame_buffer) > 2):
+            self._frame_buffer = None
+        ok, frame = self._capture.retrieve(self._frame_buffer)
+        if not ok:
+            raise RuntimeError("Error retrieving frame from webcam.")
+        self._frame_buffer = frame
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
@@ -30,7 +30,7 @@ import PIL.Image
 
 # toolbox imports
 from ..base.data import Data
-from ..base.image import Image, Imagelike
+from ..base.image import Image, Imagelike, ImageResizer
 from ..datasource import Imagesource
 
 # logging
@@ -70,3 +70,39 @@ Imagesource.add_loader('pil', PIL.Image.open)
 Image.add_converter(PIL.Image.Image,
                     lambda image, copy: (np.array(image), copy),
                     target='array')
+
+
+class ImageUtil(ImageResizer):
+    """An :py:class:`ImageResizer` based on pillow (which may be a
+    SIMD accelerated pillow-simd build).
+    """
+
+    _interpolations = {
+        'linear': PIL.Image.BILINEAR,
+        'nearest': PIL.Image.NEAREST,
+        'cubic': PIL.Image.BICUBIC,
+        'area': PIL.Image.BOX,
+    }
+
+    def resize(self, image: Imagelike, size=(640, 360),
+               interpolation: str = 'linear') -> np.ndarray:
+        """Resize an image to the given size (width, height).
+        The data type of the image is preserved.
+        """
+        image = Image.as_array(image)
+        size = tuple(size)
+        resample = self._interpolations[interpolation]
+        if image.dtype == np.uint8:
+            return np.asarray(PIL.Image.fromarray(image).
+                              resize(size, resample=resample))
+
+        # other data types are resized channelwise in 32-bit float mode
+        channels = image[..., np.newaxis] if image.ndim == 2 else image
+        result = np.empty((size[1], size[0], channels.shape[2]),
+                          dtype=image.dtype)
+        for channel in range(channels.shape[2]):
+            pil_image = PIL.Image.fromarray(
+                channels[..., channel].astype(np.float32, copy=False),
+                mode='F')
+            result[..., channel] = pil_image.resize(size, resample=resample)
+        return result[..., 0] if image.ndim == 2 else result
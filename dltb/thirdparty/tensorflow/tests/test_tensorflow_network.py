@@ -72,33 +72,23 @@ class TestTensorFlowNetwork(TestCase):
         # Test layer properties from layer dict.
 
     def test_layer_dict(self):
+        layer_dict = self.loaded_network.layer_dict
+        expected = {
+            'conv2d_1': network.tensorflow.Conv2D,
+            'max_pooling2d_1': network.tensorflow.MaxPooling2D,
+            'conv2d_2': network.tensorflow.Conv2D,
+            'dropout_1': network.tensorflow.Dropout,
+            'flatten_1': network.tensorflow.Flatten,
+            'dense_1': network.tensorflow.Dense,
+            'dropout_2': network.tensorflow.Dropout,
+            'dense_2': network.tensorflow.Dense,
+        }
         # Check the names.
-        self.assertEqual(list(self.loaded_network.layer_dict.keys()),
-                         ['conv2d_1',
-                          'max_pooling2d_1',
-                          'conv2d_2',
-                          'dropout_1',
-                          'flatten_1',
-                          'dense_1',
-                          'dropout_2',
-                          'dense_2'])
+        self.assertEqual(list(layer_dict.keys()), list(expected.keys()))
         # Check that the right types where selected.
-        self.assertIsInstance(self.loaded_network.layer_dict['conv2d_1'],
-                              network.tensorflow.Conv2D)
-        self.assertIsInstance(self.loaded_network.layer_dict['max_pooling2d_1'],
-                              network.tensorflow.MaxPooling2D)
-        self.assertIsInstance(self.loaded_network.layer_dict['conv2d_2'],
-                              network.tensorflow.Conv2D)
-        self.assertIsInstance(self.loaded_network.layer_dict['dropout_1'],
-                              network.tensorflow.Dropout)
-        self.assertIsInstance(self.loaded_network.layer_dict['flatten_1'],
-                              network.tensorflow.Flatten)
-        self.assertIsInstance(self.loaded_network.layer_dict['dense_1'],
-                              network.tensorflow.Dense)
-        self.assertIsInstance(self.loaded_network.layer_dict['dropout_2'],
-                              network.tensorflow.Dropout)
-        self.assertIsInstance(self.loaded_network.layer_dict['dense_2'],
-                              network.tensorflow.Dense)
+        for name, layer_class in expected.items():
+            with self.subTest(layer=name):
+                self.assertIsInstance(layer_dict[name], layer_class)
 
 
 
@@ -74,3 +74,8 @@ class ImageTest(TestCase):
     def test_resizer_opencv(self) -> None:
         ImageResizer = import_class('ImageResizer', 'opencv')
         self.image_resizer_test(ImageResizer)
+
+    @skipUnless(available('pil'), "Skip pil tests")
+    def test_resizer_pil(self) -> None:
+        ImageResizer = import_class('ImageResizer', 'pil')
+        self.image_resizer_test(ImageResizer)
@@ -1,6 +1,8 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
-from .. import import_class
+import numpy as np
+
+from .. import available, import_class
 
 
 class TestOpencv(TestCase):
@@ -12,3 +14,39 @@ class TestOpencv(TestCase):
     def test_imread1(self):
         image = self._image_reader.read('assets/logo.png')
         self.assertEqual(image.shape, (469, 469, 3))
+
+
+class FakeCapture:
+    """A fake `cv2.VideoCapture`, recording the buffers passed to
+    :py:meth:`retrieve`.
+    """
+
+    def __init__(self) -> None:
+        self.buffers = []
+
+    def retrieve(self, image=None):
+        self.buffers.append(image)
+        if image is None:
+            image = np.zeros((4, 6, 3), dtype=np.uint8)
+        return True, image
+
+
+@skipUnless(available('opencv'), "Skip opencv tests")
+class TestOpencvWebcam(TestCase):
+
+    def test_retrieve_frame_buffer(self):
+        """The frame buffer is reused once the previous frame was
+        released, but not while it is still in use.
+        """
+        from ..opencv import Webcam
+        webcam = Webcam.__new__(Webcam)
+        webcam._capture = FakeCapture()
+        webcam._frame_buffer = None
+        frame = webcam._retrieve_frame()
+        webcam._retrieve_frame()  # frame is still in use
+        self.assertIsNone(webcam._capture.buffers[1])
+        del frame
+        buffer_id = id(webcam._frame_buffer)  # no reference to the buffer
+        webcam._retrieve_frame()
+        self.assertIsNotNone(webcam._capture.buffers[2])
+        self.assertEqual(id(webcam._capture.buffers[2]), buffer_id)
@@ -19,3 +19,8 @@ class TestOpencv(TestCase):
         # cls = import_class('ImageIO', 'opencv')
         cls = import_class('ImageReader', 'opencv')
         self.assertIsInstance(cls, type)
+
+    def test_import_class_cached(self):
+        cls = import_class('dltb.base.image.Image')
+        self.assertIsInstance(cls, type)
+        self.assertIs(import_class('dltb.base.image.Image'), cls)
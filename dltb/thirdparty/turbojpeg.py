@@ -0,0 +1,64 @@
+"""Fast JPEG decoding using the libjpeg-turbo library (via the
+`PyTurboJPEG` package).
+
+Decoding JPEG files is usually the main cost when reading images
+from large datasets like ImageNet.  libjpeg-turbo decodes directly
+into RGB order, avoiding the extra conversion step required by
+OpenCV (which decodes to BGR).  Non-JPEG files are delegated to
+another available :py:class:`ImageReader`.
+"""
+
+# standard imports
+import logging
+
+# third party imports
+import numpy as np
+from turbojpeg import TurboJPEG, TJPF_RGB
+
+# toolbox imports
+from ..base import image
+from . import available
+
+# logging
+LOG = logging.getLogger(__name__)
+
+
+class ImageReader(image.ImageReader):
+    """An :py:class:`ImageReader` based on libjpeg-turbo.
+
+    Attributes
+    ----------
+    _turbojpeg: TurboJPEG
+        The TurboJPEG decoder (wraps the shared libjpeg-turbo library).
+    _fallback: image.ImageReader
+        An :py:class:`ImageReader` used for non-JPEG files. Will be
+        created upon first use.
+    """
+    _jpeg_suffixes = ('.jpg', '.jpeg', '.jpe')
+
+    def __init__(self, module=None, **kwargs) -> None:
+        # pylint: disable=unused-argument
+        # `module` is consumed by ImageReader.__new__
+        super().__init__(**kwargs)
+        self._turbojpeg = TurboJPEG()
+        self._fallback = None
+
+    def read(self, filename: str, **kwargs) -> np.ndarray:
+        if not filename.lower().endswith(self._jpeg_suffixes):
+            return self._fallback_reader().read(filename, **kwargs)
+        with open(filename, 'rb') as infile:
+            return self._turbojpeg.decode(infile.read(),
+                                          pixel_format=TJPF_RGB)
+
+    def _fallback_reader(self) -> image.ImageReader:
+        """The :py:class:`ImageReader` to use for non-JPEG files.
+        """
+        if self._fallback is None:
+            for module in ('opencv', 'imageio', 'matplotlib'):
+                if available(module):
+                    self._fallback = image.ImageReader(module=module)
+                    break
+            else:
+                raise ImportError("No ImageReader available for "
+                                  "non-JPEG images.")
+        return self._fallback
@@ -14,9 +14,11 @@ comprises:
 
 # standard imports
 from abc import ABC, abstractmethod
-from typing import Union, Sequence, List, Tuple, Iterable, Iterator, Set
+from typing import Union, Sequence, List, Tuple, Iterable, Iterator, Set, Dict
 from pathlib import Path
+from collections import OrderedDict
 import os
+import hashlib
 import logging
 
 # third party imports
@@ -980,13 +982,19 @@ class ActivationTool(Tool, Network.Observer):
     _network: Network = None
 
     def __init__(self, network: Network = None, data_format: str = None,
-                 **kwargs) -> None:
+                 cache_size: int = 0, **kwargs) -> None:
         """Create a new ``Engine`` instance.
 
         Parameters
         ----------
         network: Network
             Network providing activation values.
+        cache_size: int
+            The number of inputs for which activation values are
+            remembered.  The default (`0`) disables this cache, which
+            is only useful if the same inputs are queried repeatedly
+            (e.g., for different layers when browsing in a user
+            interface).  Batches always bypass the cache.
         """
         super().__init__(**kwargs)
 
@@ -996,6 +1004,11 @@ class ActivationTool(Tool, Network.Observer):
         self._channel_adaptor = ShapeAdaptor(ResizePolicy.Channels())
         self._data_format = data_format
 
+        # activations computed for the last inputs (least recently
+        # used first): (digest, data_format) -> {layer: activations}
+        self._activations_cache = OrderedDict()
+        self._activations_cache_size = cache_size
+
         # network related
         self.network = network
 
@@ -1024,6 +1037,7 @@ class ActivationTool(Tool, Network.Observer):
         """
         LOG.debug("Activation.network_changed(%s)", info)
         if info.state_changed:
+            self.clear_activations_cache()
             self.change('state_changed')
 
     @property
@@ -1045,6 +1059,7 @@ class ActivationTool(Tool, Network.Observer):
         if self._network is not None:
             self.unobserve(self._network)
         self._network = network
+        self.clear_activations_cache()
         if network is not None:
             interests = Network.Change('state_changed')
             self.observe(network, interests)
@@ -1054,34 +1069,59 @@ class ActivationTool(Tool, Network.Observer):
                 self._channel_adaptor.setNetwork(network)
         self.change('tool_changed')
 
+    def clear_activations_cache(self) -> None:
+        """Forget the activation values remembered for the last inputs.
+        """
+        self._activations_cache.clear()
+
+    @staticmethod
+    def _inputs_digest(inputs: np.ndarray) -> Tuple:
+        """A key identifying the content of an input array, used to
+        look up cached activation values.
+        """
+        inputs = np.ascontiguousarray(inputs)
+        digest = hashlib.blake2b(inputs.data, digest_size=16).digest()
+        return (digest, inputs.shape, inputs.dtype.str)
+
     #
     # Tool interface
     #
 
     external_result = ('activations', )
-    internal_arguments = ('inputs', 'layer_ids')
-    internal_result = ('activations_list', )
+    internal_arguments = ('inputs', 'layer_ids', 'use_cache')
+    internal_result = ('activations_dict', )
 
     def _preprocess(self, inputs: np.ndarray, layer_ids: List[Layer] = None,
-                    **kwargs) -> Data:
+                    use_cache: bool = True, **kwargs) -> Data:
         # pylint: disable=arguments-differ
         # FIXME[todo]: inputs should probably be Datalike
         """Preprocess the arguments and construct a Data object.
+
+        If a cache size was given, activation values are remembered
+        for the last inputs (identified by their content), so that
+        querying the same or further layers for these inputs will only
+        compute the missing layers.  Setting `use_cache` to `False`
+        enforces recomputation.  Batches are never cached.
         """
+        if not use_cache:
+            self.clear_activations_cache()
         context = super()._preprocess(**kwargs)
+        is_batch = (context.is_batch or
+                    (isinstance(inputs, Data) and inputs.is_batch))
+        use_cache = (use_cache and not is_batch and
+                     self._activations_cache_size > 0)
         array = inputs.array if isinstance(inputs, Data) else inputs
-        context.add_attribute('inputs', array)
         unlist = False
         if layer_ids is None:
             layer_ids = list(self._network.layer_dict.keys())
         elif not isinstance(layer_ids, list):
             layer_ids, unlist = [layer_ids], True
-        context.add_attribute('layer_ids', layer_ids)
-        context.add_attribute('unlist', unlist)
+        context.add_attributes(inputs=array, layer_ids=layer_ids,
+                               use_cache=use_cache, unlist=unlist)
         return context
 
-    def _process(self, inputs: np.ndarray,
-                 layers: List[Layer]) -> List[np.ndarray]:
+    def _process(self, inputs: np.ndarray, layers: List[Layer],
+                 use_cache: bool = False) -> Dict[str, np.ndarray]:
         # pylint: disable=arguments-differ
         """Perform the actual operation, that is the computation of
         activation values for given input values.
@@ -1092,9 +1132,16 @@ class ActivationTool(Tool, Network.Observer):
             Input data.
         layers:
             A list of layers for which to compute activations.
+        use_cache:
+            Look up (and store) activation values in the activations
+            cache.
+
+        Result
+        ------
+        activations_dict:
+            A dictionary mapping the layer ids to the activation values.
         """
 
-        print(f"ActivationTool._process({type(inputs)}, {type(layers)})")
         # LOG.info("ActivationTool: computing activations for data <%s>, "
         #          "layers=%s, activation format=%s",
         #          inputs.shape, layers, self.data_format)
@@ -1103,16 +1150,31 @@ class ActivationTool(Tool, Network.Observer):
             return None
 
         if not layers:
-            return layers
-
-        return self._network.get_activations(inputs, layers,
-                                             data_format=self.data_format)
+            return {}
+
+        data_format = self.data_format
+        if not use_cache:
+            return self._network.get_activations(
+                inputs, layers, data_format=data_format, as_dict=True)
+
+        cache = self._activations_cache
+        key = (self._inputs_digest(inputs), data_format)
+        known = cache.get(key)
+        if known is None:
+            known = cache[key] = {}
+            while len(cache) > self._activations_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        missing = [layer for layer in layers if layer not in known]
+        if missing:
+            known.update(self._network.get_activations(
+                inputs, missing, data_format=data_format, as_dict=True))
+        return {layer: known[layer] for layer in layers}
 
     def _postprocess(self, data: Data, what: str) -> None:
         if what == 'activations':
-            activations_dict = dict(zip(data.layer_ids, data.activations_list))
-            data.add_attribute(what, activations_dict)
-            data.add_attribute('activations_dict', activations_dict)
+            data.add_attribute(what, data.activations_dict)
         else:
             super()._postprocess(data, what)
 
@@ -1164,29 +1226,32 @@ class ActivationTool(Tool, Network.Observer):
                         "when querying unit activation", data_format)
 
         if layer is None:  # return the full dictionary
-            if data_format is self.data_format:
+            if data_format == self.data_format:
                 return activations  # no tranformation required
 
             # transform the data format of the activation values
-            return list(map(lambda activation:
-                            adapt_data_format(activation,
-                                              input_format=self._data_format,
-                                              output_format=data_format),
-                            activations))
+            # (into contiguous arrays, as they are accessed repeatedly)
+            return {key: adapt_data_format(values,
+                                           input_format=self.data_format,
+                                           output_format=data_format,
+                                           contiguous=True)
+                    for key, values in activations.items()}
         if isinstance(layer, Layer):
             layer = layer.key
         activations = activations[layer]
 
-        if data_format is not self.data_format:
+        if unit is not None:
+            # unit activations do not depend on the data format
+            return (activations[unit]
+                    if self.data_format == DATA_FORMAT_CHANNELS_FIRST
+                    else activations[..., unit])
+
+        if data_format != self.data_format:
             activations = adapt_data_format(activations,
                                             input_format=self.data_format,
-                                            output_format=data_format)
-
-        if unit is None:
-            return activations
-
-        return (activations[unit] if data_format == DATA_FORMAT_CHANNELS_FIRST
-                else activations[..., unit])
+                                            output_format=data_format,
+                                            contiguous=True)
+        return activations
 
     @staticmethod
     def top_indices(activations: np.ndarray, top: int = 1,
@@ -1237,11 +1302,17 @@ class ActivationWorker(Worker):
             tool = ActivationTool(network)
         super().__init__(tool=tool, **kwargs)
         self._layer_ids = []
-        self._fixed_layers = []
+        # _fixed_layers: the layers explicitly requested, mapping layer
+        # keys to Layer objects (in order of addition)
+        self._fixed_layers: Dict[str, Layer] = {}
         self._classification = False
 
         self._activations = None
 
+        # _batch_cache: batches kept by extract_activations (if asked to),
+        # as triple (datasource, batch_size, list of batches)
+        self._batch_cache = None
+
     #
     # Tool core functions
     #
@@ -1312,26 +1383,34 @@ class ActivationWorker(Worker):
         """Set the layers for which activations shall be computed.
 
         """
-        self._fixed_layers = \
-            layers if isinstance(layers, list) else list(layers)
+        self._fixed_layers = {}
+        for layer in layers or ():
+            layer = self._as_layer(layer)
+            self._fixed_layers.setdefault(layer.key, layer)
         self._update_layers()
 
     def add_layer(self, layer: Union[str, Layer]) -> None:
         """Add a layer to the list of activation layers.
         """
-        if isinstance(layer, str):
-            self._fixed_layers.append(self.network[layer])
-        elif isinstance(layer, Layer):
-            self._fixed_layers.append(layer)
-        else:
-            raise TypeError("Invalid type for argument layer: {type(layer)}")
+        layer = self._as_layer(layer)
+        self._fixed_layers.setdefault(layer.key, layer)
         self._update_layers()
 
-    def remove_layer(self, layer: Layer) -> None:
+    def remove_layer(self, layer: Union[str, Layer]) -> None:
         """Remove a layer from the list of activation layers.
         """
-        self._fixed_layers.remove(layer)
-        self._update_layers()
+        key = layer.key if isinstance(layer, Layer) else layer
+        if self._fixed_layers.pop(key, None) is not None:
+            self._update_layers()
+
+    def _as_layer(self, layer: Union[str, Layer]) -> Layer:
+        """Get the :py:class:`Layer` object for a layer specification.
+        """
+        if isinstance(layer, str):
+            return self.network[layer]
+        if isinstance(layer, Layer):
+            return layer
+        raise TypeError(f"Invalid type for argument layer: {type(layer)}")
 
     def set_classification(self, classification: bool = True) -> None:
         """Record the classification results.  This assumes that the network
@@ -1352,9 +1431,9 @@ class ActivationWorker(Worker):
         #   'QObserverHelper' object has no attribute 'layers_of_interest'
         # for observer in self._observers:
         #     layers |= observer.layers_of_interest(self)
-        layer_ids = set(map(lambda layer: layer.key, layers))
+        layer_ids = {layer.key for layer in layers}
 
-        layer_ids |= set(map(lambda layer: layer.key, self._fixed_layers))
+        layer_ids |= self._fixed_layers.keys()
         if self._classification and isinstance(network, Classifier):
             layer_ids |= {network.score_layer.key}
 
@@ -1362,7 +1441,8 @@ class ActivationWorker(Worker):
         layer_ids = [layer.key for layer in network.layers()
                      if layer.key in layer_ids]
 
-        got_new_layers = layer_ids > self._layer_ids and self._data is not None
+        got_new_layers = (self._data is not None and
+                          not set(layer_ids).issubset(self._layer_ids))
         self._layer_ids = layer_ids
         if got_new_layers:
             self.work(self._data)
@@ -1372,32 +1452,75 @@ class ActivationWorker(Worker):
     #
 
     def extract_activations(self, datasource: Datasource,
-                            batch_size: int = 128) -> None:
+                            batch_size: int = 128, directory: str = None,
+                            dtype=np.float16,
+                            cache_batches: bool = False
+                            ) -> Dict[str, np.ndarray]:
         """Compute network activation values for data from a
         :py:class:`Datasource`.
 
-        Activation values are stored in a variable called `result`.
+        Arguments
+        ---------
+        datasource:
+            The datasource providing the input data.
+        batch_size:
+            The number of data points processed at once.
+        directory:
+            If given, activation values are written to numpy memmaps
+            in that directory (one file `<layer>.dat` per layer),
+            allowing for datasets that do not fit into memory.
+        dtype:
+            The datatype in which activation values are stored.
+            The default (`float16`) halves the memory (and disk space)
+            required compared to `float32`.
+        cache_batches:
+            Keep the batches read from the datasource in memory, so
+            that subsequent calls for the same datasource (and batch
+            size), e.g. for other layers, do not have to read them
+            again.  Note that this requires memory for the complete
+            dataset (batches stacked into a batch buffer of the
+            datasource are copied).
+
+        Result
+        ------
+        results:
+            A dictionary mapping layer identifiers to arrays holding
+            the activation values for all data in the datasource.
         """
-        samples = len(datasource)
-        # Here we could:
-        #  np.memmap(filename, dtype='float32', mode='w+',
-        #            shape=(samples,) + network[layer].output_shape[1:])
-        results = {
-            layer: np.ndarray((samples,) +
-                              self.tool.network[layer].output_shape[1:])
-            for layer in self._layer_ids
-        }
+        results = self._open_results(self._layer_ids, len(datasource),
+                                     directory=directory, dtype=dtype)
 
-        fetcher = Datafetcher(datasource, batch_size=batch_size)
+        cache = self._batch_cache
+        if (cache_batches and cache is not None and
+                cache[0] is datasource and cache[1] == batch_size):
+            batches, new_cache = cache[2], None
+        else:
+            # fetch the next batch while processing the current one
+            fetcher = Datafetcher(datasource, batch_size=batch_size)
+            batches = fetcher.prefetched()
+            new_cache = [] if cache_batches else None
+
+        # batches stacked into the batch buffer of the datasource
+        # (see Datasource.prepare_batch) are overwritten by the next batch
+        buffer = getattr(datasource, '_batch_buffer', None)
 
+        # avoid formatting debug output in the loop if it is not shown
+        debug = LOG.isEnabledFor(logging.DEBUG)
         try:
-            index = 0
-            for batch in fetcher:
-                print("dl-activation: "
-                      f"processing batch of length {len(batch)} "
-                      f"with elements given as {type(batch.array)}, "
-                      f"first element having index {batch[0].index} and "
-                      f"shape {batch[0].array.shape} [{batch[0].array.dtype}]")
+            for batch in batches:
+                if new_cache is not None:
+                    if (buffer is not None and
+                            isinstance(batch.array, np.ndarray) and
+                            np.shares_memory(batch.array, buffer)):
+                        batch.array = batch.array.copy()
+                    new_cache.append(batch)
+                index = batch[0].index
+                if debug:
+                    LOG.debug("extract_activations: processing batch of "
+                              "length %d (%s), first element having index "
+                              "%d and shape %s [%s]", len(batch),
+                              type(batch.array).__name__, index,
+                              batch[0].array.shape, batch[0].array.dtype)
                 # self.work() will make `batch` the current data object
                 # of this Worker (self._data) and store activation values
                 # as attributes of that data object:
@@ -1405,36 +1528,56 @@ class ActivationWorker(Worker):
 
                 # obtain the activation values from the current data object
                 activations = self.activations()
-
-                # print(type(activations), len(activations))
-                print("dl-activation: activations are of type "
-                      f"{type(activations)} of length {len(activations)}")
                 if isinstance(activations, dict):
-                    for index, (layer, values) in \
-                            enumerate(activations.items()):
-                        print(f"dl-activation:  [{index}]: {values.shape}")
-                        results[layer][index:index+len(batch)] = values
+                    activations = activations.items()
                 elif isinstance(activations, list):
-                    print("dl-activation: "
-                          f"first element is {type(activations[0])} "
-                          f"with shape {activations[0].shape} "
-                          f"[{activations[0].dtype}]")
-                    for index, values in enumerate(activations):
-                        print(f"dl-activation:  [{index}]: {values.shape}")
-                        layer = self._layer_ids[index]
-                        results[layer][index:index+len(batch)] = values
-                print("dl-activation: batch finished in "
-                      f"{self.tool.duration(self._data)*1000:.0f} ms.")
+                    activations = zip(self._layer_ids, activations)
+                else:
+                    activations = ()
+                for layer, values in activations:
+                    if debug:
+                        LOG.debug("extract_activations: layer %s: %s [%s]",
+                                  layer, values.shape, values.dtype)
+                    results[layer][index:index+len(batch)] = values
+                if debug:
+                    LOG.debug("extract_activations: batch finished in "
+                              "%.0f ms.", self.tool.duration(self._data)*1000)
+            if new_cache is not None:  # only cache complete passes
+                self._batch_cache = (datasource, batch_size, new_cache)
         except KeyboardInterrupt:
             # print(f"error procesing {data.filename} {data.shape}")
-            print("Keyboard interrupt")
+            LOG.warning("extract_activations: keyboard interrupt")
             # self.output_status(top, end='\n')
         except InterruptedError:
-            print("Interrupted.")
+            LOG.warning("extract_activations: interrupted")
         finally:
-            print("dl-activation: finished processing")
+            LOG.info("extract_activations: finished processing")
+            for values in results.values():
+                if isinstance(values, np.memmap):
+                    values.flush()
             # signal.signal(signal.SIGINT, original_sigint_handler)
             # signal.signal(signal.SIGQUIT, original_sigquit_handler)
+        return results
+
+    def _open_results(self, layers: Sequence[str], samples: int,
+                      directory: str = None,
+                      dtype=np.float16) -> Dict[str, np.ndarray]:
+        """Allocate arrays for storing activation values of the given
+        layers for a number of samples, either in memory or as numpy
+        memmaps in a directory.
+        """
+        results = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        for layer in layers:
+            shape = (samples,) + self.tool.network[layer].output_shape[1:]
+            if directory is None:
+                results[layer] = np.empty(shape, dtype=dtype)
+            else:
+                filename = os.path.join(directory, layer + '.dat')
+                results[layer] = \
+                    np.memmap(filename, dtype=dtype, mode='w+', shape=shape)
+        return results
 
     def iterate_activations(self, datasource: Datasource,
                             batch_size: int = 128) -> Iterator:
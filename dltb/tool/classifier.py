@@ -26,6 +26,27 @@ LOG = logging.getLogger(__name__)
 LOG.setLevel(logging.DEBUG)
 
 
+class _SortedLookup:
+    """A reverse lookup table for sparse integer labels (where an
+    array indexed by the label values would be too large).  Lookup
+    is realized by binary search in the sorted label values, allowing
+    to look up a whole array of labels in one (vectorized) operation.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._order = np.argsort(values, kind='stable')
+        self._keys = values[self._order]
+
+    def __getitem__(self, key: Any) -> Any:
+        keys = np.asarray(key)
+        positions = np.searchsorted(self._keys, keys)
+        positions = np.minimum(positions, len(self._keys) - 1)
+        if not np.all(self._keys[positions] == keys):
+            raise KeyError(key)
+        result = self._order[positions]
+        return result if result.ndim else int(result)
+
+
 class ClassScheme(metaclass=RegisterClass):
     """A :py:class:`ClassScheme` represents a classification scheme.  This
     is essentially a collection of classes.  An actual class is
@@ -61,6 +82,14 @@ class ClassScheme(metaclass=RegisterClass):
     _no_class: ClassIdentifier
         The class representing the invalid class (no class)
         FIXME[todo]: currently not used!
+
+    _prepared: bool
+        A flag indicating that the :py:class:`ClassScheme` has been
+        prepared.  The flag is set once by :py:meth:`prepare`, so that
+        checking the preparation state is a simple attribute lookup.
+
+    _one_hot_cache: Dict[Tuple[int, np.dtype], np.ndarray]
+        Identity matrices used by :py:meth:`one_hot`, one per dtype.
     """
 
     def __init__(self, length: int = None, **kwargs) -> None:
@@ -69,10 +98,33 @@ class ClassScheme(metaclass=RegisterClass):
         self._labels = {}
         self._lookup = {}
         self._no_class = None
+        self._prepared = False
+        self._one_hot_cache = {}
 
     def __len__(self):
         return self._length
 
+    @property
+    def prepared(self) -> bool:
+        """Check if the :py:class:`ClassScheme` has been prepared.
+        """
+        return self._prepared
+
+    def prepare(self) -> None:
+        """Prepare this :py:class:`ClassScheme`, that is initialize
+        the label tables. Preparation is only done once.
+        """
+        if self._prepared:
+            return  # nothing to do ...
+        self._prepare()
+        self._prepared = True
+
+    def _prepare(self) -> None:
+        """Initialize the label tables of this :py:class:`ClassScheme`.
+        Subclasses that load their labels on demand should overwrite
+        this method.
+        """
+
     def identifier(self, index: Any, lookup: str = None) -> 'ClassIdentifier':
         """Get an :py:class:`ClassIdentifier` for the given index.
 
@@ -95,35 +147,44 @@ class ClassScheme(metaclass=RegisterClass):
         Attributes
         ----------
         index:
-            A single class index or a collection of indices (list or tuple).
-            The
+            A single class index or a collection of indices (list,
+            tuple, or array). The result will be of the same type.
         name:
             The name of the label format. If `None`, the default
             format (the integer value) is returned.
         
         """
-        # FIXME[todo]:
-        # 1) allow for more iterables than just lists
-        #    (e.g., tuples, ndarrays)
-        # 2) do it more efficently
-        if isinstance(index, list):
-            if lookup is not None:
-                index = [self._lookup[lookup][i] for i in index]
-            if name is None:
-                return index
-            return [self._labels[name][i] for i in index]
-
-        if isinstance(index, tuple):
+        if isinstance(index, (list, tuple, np.ndarray)):
+            indices = index
             if lookup is not None:
-                index = tuple(self._lookup[lookup][i] for i in index)
-            if name is None:
-                return index
-            return tuple(self._labels[name][i] for i in index)
+                indices = self._gather(self._lookup[lookup], indices)
+            if name is not None:
+                indices = self._gather(self._labels[name], indices)
+            if isinstance(index, np.ndarray):
+                return np.asarray(indices)
+            if isinstance(indices, np.ndarray):
+                indices = indices.tolist()
+            return indices if isinstance(index, list) else tuple(indices)
 
         if lookup is not None:
             index = self._lookup[lookup][index]
         return index if name is None else self._labels[name][index]
 
+    @staticmethod
+    def _gather(table: Any, indices: Iterable) -> Any:
+        """Apply a lookup table to a collection of indices.  Tables
+        stored as numpy arrays (numerical as well as textual labels)
+        allow to look up all indices in a single (vectorized) operation.
+        Other tables (like dictionaries used for reverse lookup)
+        are applied item by item.
+        """
+        if isinstance(table, np.ndarray):
+            # explicit dtype, as an empty list would result in float64
+            return table[np.asarray(indices, dtype=np.intp)]
+        if isinstance(table, _SortedLookup):
+            return table[np.asarray(indices)]
+        return [table[i] for i in indices]
+
     def has_label(self, name: str) -> bool:
         """Check if this :py:class:`ClassScheme` supports the given
         labeling format.
@@ -151,10 +212,16 @@ class ClassScheme(metaclass=RegisterClass):
             A flag indicating if a reverse lookup table shall be created
             for this label.
         """
-        if isinstance(values, np.ndarray):
-            pass  # take the given numpy array
-        else:
+        if not isinstance(values, np.ndarray):
             values = list(values)
+            if all(isinstance(value, (int, np.integer)) for value in values):
+                # numerical labels are stored as array to allow
+                # for vectorized lookup
+                values = np.asarray(values, dtype=np.int64)
+            elif all(isinstance(value, str) for value in values):
+                # textual labels are stored as object array: gathering
+                # a batch of labels then only copies object references
+                values = np.asarray(values, dtype=object)
         if self._length is None:
             self._length = len(values)
         elif self._length != len(values):
@@ -163,19 +230,61 @@ class ClassScheme(metaclass=RegisterClass):
 
         self._labels[name] = values
         if lookup:
-            if isinstance(values, np.ndarray) and values.max() < 2*len(self):
-                self._lookup[name] = np.zeros(values.max()+1, dtype=np.int)
+            if (isinstance(values, np.ndarray) and
+                    np.issubdtype(values.dtype, np.integer) and
+                    values.min() >= 0 and values.max() < 2*len(self)):
+                self._lookup[name] = \
+                    np.zeros(values.max()+1, dtype=np.int64)
                 self._lookup[name][values] = np.arange(0, values.size)
+            elif (isinstance(values, np.ndarray) and
+                  np.issubdtype(values.dtype, np.integer)):
+                self._lookup[name] = _SortedLookup(values)
             else:
                 self._lookup[name] = \
                     {val: idx for idx, val in enumerate(values)}
 
     def labels(self) -> Iterator[str]:
         """Enumerate the label names that are currently registered with
-        this :py:class:`ClassScheme`.
+        this :py:class:`ClassScheme`.  The result is a (read-only) view,
+        reflecting labels added later on, so there is no need to query
+        it repeatedly.
         """
         return self._labels.keys()
 
+    def one_hot(self, labels: Any, dtype=np.float32,
+                lookup: str = None) -> np.ndarray:
+        """Get a one-hot encoding for the given labels.
+
+        Arguments
+        ---------
+        labels:
+            A single class index or a (possibly nested) collection of
+            class indices (list, tuple or array).
+        dtype:
+            The data type of the one-hot array.
+        lookup: str
+            The name of a lookup table to translate the labels into
+            the canonical class indices of this :py:class:`ClassScheme`.
+
+        Result
+        ------
+        one_hot:
+            An array of shape `labels.shape + (len(self),)`, that is
+            a one-dimensional array for a single label and a
+            two-dimensional array for a list of labels.
+        """
+        if lookup is not None:
+            labels = self.get_label(labels, lookup=lookup)
+        # The one-hot vectors are gathered from a cached identity matrix,
+        # copying complete rows instead of scattering individual ones
+        # into a freshly zeroed array.
+        key = (len(self), np.dtype(dtype))
+        identity = self._one_hot_cache.get(key)
+        if identity is None:
+            identity = np.eye(len(self), dtype=dtype)
+            self._one_hot_cache[key] = identity
+        return identity[np.asarray(labels, dtype=np.intp)]
+
     def reindex(self, values: np.ndarray, axis: int = None,
                 source: str = None, target: str = None) -> np.ndarray:
         """Reindex the given
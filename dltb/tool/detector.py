@@ -1,8 +1,12 @@
 """Abstract base class for detectors.
 """
 # standard imports
-from typing import Union, Tuple, List, Any
+from typing import Union, Tuple, List, Any, Iterable, Iterator
+from collections import OrderedDict
+import copy as copy_module
 import logging
+import threading
+import queue
 
 # third party imports
 import numpy as np
@@ -10,7 +14,7 @@ import numpy as np
 # toolbox imports
 from ..base.data import Data
 from ..base.meta import Metadata
-from ..base.image import Image, Imagelike
+from ..base.image import Image, Imagelike, BoundingBox, Region
 from .tool import Tool
 from .image import ImageTool
 
@@ -22,6 +26,80 @@ LOG = logging.getLogger(__name__)
 Detections = Union[Metadata]
 
 
+def _difference_hash(array: np.ndarray) -> Tuple[int, float, np.ndarray]:
+    """Compute a 64-bit difference hash (dHash) of an image.  The image
+    is sampled on a coarse grid, which is reduced to 8x9 block means,
+    and each bit of the hash states if the brightness increases
+    between horizontally adjacent blocks.
+
+    Result
+    ------
+    hash:
+        The difference hash.
+    texture:
+        The variance of the Laplacian of the sampled image (in the
+        range of an uint8 image).  Low values indicate a blurred
+        or uniform image, for which the hash is not reliable.
+    samples:
+        The (32x36) brightness values sampled from the image (in the
+        range of an uint8 image), allowing for a cheap comparison
+        of images.
+    """
+    rows = np.linspace(0, array.shape[0]-1, 32).astype(np.intp)
+    columns = np.linspace(0, array.shape[1]-1, 36).astype(np.intp)
+    small = array[rows[:, np.newaxis], columns].astype(np.float32)
+    if small.ndim > 2:
+        small = small.mean(axis=2)
+    if array.dtype.kind == 'f':
+        small *= 255.
+    blocks = small.reshape(8, 4, 9, 4).mean(axis=(1, 3))
+    bits = np.packbits(blocks[:, 1:] > blocks[:, :-1])
+    laplacian = (4 * small[1:-1, 1:-1] - small[:-2, 1:-1] - small[2:, 1:-1]
+                 - small[1:-1, :-2] - small[1:-1, 2:])
+    return (int.from_bytes(bits.tobytes(), 'big'), float(laplacian.var()),
+            small)
+
+
+def non_maximum_suppression(boxes: np.ndarray, scores: np.ndarray,
+                            iou_threshold: float = .5) -> np.ndarray:
+    """Greedy non-maximum suppression: of boxes overlapping by more
+    than the given intersection over union (IoU), only the one with
+    the highest score is kept.  The IoU of all pairs of boxes is
+    computed at once.
+
+    Arguments
+    ---------
+    boxes:
+        An array of shape (N, 4), each row holding the coordinates
+        `(x1, y1, x2, y2)` of a box.
+    scores:
+        An array of shape (N,) holding the scores of the boxes.
+    iou_threshold:
+        The maximal IoU allowed for two boxes to be both kept.
+
+    Result
+    ------
+    indices:
+        The indices of the boxes to keep, sorted by decreasing score.
+    """
+    order = np.argsort(-np.asarray(scores), kind='stable')
+    boxes = np.asarray(boxes, dtype=np.float32)[order]
+    areas = ((boxes[:, 2] - boxes[:, 0]).clip(min=0) *
+             (boxes[:, 3] - boxes[:, 1]).clip(min=0))
+    top_left = np.maximum(boxes[:, np.newaxis, :2], boxes[np.newaxis, :, :2])
+    bottom_right = \
+        np.minimum(boxes[:, np.newaxis, 2:], boxes[np.newaxis, :, 2:])
+    intersection = (bottom_right - top_left).clip(min=0).prod(axis=2)
+    union = areas[:, np.newaxis] + areas[np.newaxis, :] - intersection
+    overlap = intersection > iou_threshold * union
+
+    keep = np.ones(len(order), dtype=bool)
+    for index in range(len(order)):
+        if keep[index]:
+            keep[index+1:] &= ~overlap[index, index+1:]
+    return order[keep]
+
+
 class Detector(Tool):
     # pylint: disable=too-many-ancestors
     """A general detector. A detector is intended to detect something
@@ -31,8 +109,101 @@ class Detector(Tool):
     data to detections.  What detections are and how they are represented
     will differ for specific subclasses (for example an ImageDetector
     typically returns a list of bounding boxes).
+
+    Batches of data are processed in chunks of at most `batch_size`
+    items, each chunk being passed to :py:meth:`_detect_batch`.
+    Subclasses that can run their model on a whole batch should
+    overwrite that method.
+
+    For (video) data in which subsequent inputs are often almost
+    identical, a detection cache can be enabled (`enable_cache`).
+    It keeps the detections for up to `cache_max` inputs, identified
+    by a perceptual (difference) hash.  The detections of an input
+    are reused for a new input whose hash differs in at most
+    `hamming_threshold` bits (provided that both have the same
+    shape and the new input is not blurred).  As the hash hardly
+    reflects small moving objects, the inputs are in addition compared
+    on a coarse (32x36) sampling grid: if more than a fraction of
+    `motion_threshold` of the grid points changed noticeably, the
+    input is considered to contain motion and the cached detections
+    are not used.  Motion of objects smaller than the grid spacing
+    may still go unnoticed, so a cache entry is in any case
+    refreshed after having been reused `cache_refresh` times.
     """
 
+    # minimal texture (variance of the Laplacian) required to rely
+    # on the hash of an input.
+    _cache_min_texture: float = 10.
+
+    # minimal difference of a sampled brightness value (in the range
+    # of an uint8 image) to count as change for motion detection.
+    _cache_motion_delta: float = 24.
+
+    def __init__(self, batch_size: int = 16, enable_cache: bool = False,
+                 cache_max: int = 8, hamming_threshold: int = 4,
+                 cache_refresh: int = 30, motion_threshold: float = .002,
+                 **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._batch_size = batch_size
+        self._cache = OrderedDict() if enable_cache else None
+        self._cache_max = cache_max
+        self._cache_lock = threading.Lock()
+        self._hamming_threshold = hamming_threshold
+        self._cache_refresh = cache_refresh
+        self._motion_threshold = motion_threshold
+
+    def _cache_lookup(self, array: np.ndarray) -> Tuple[Any, Detections]:
+        """Look up detections for an input in the detection cache.
+
+        Result
+        ------
+        key:
+            The cache key for the input (`None` if the input should
+            not be cached).
+        samples:
+            The brightness values sampled from the input, to be stored
+            along with the detections (see :py:meth:`_cache_store`).
+        detections:
+            A copy of the cached detections, `None` if no cached
+            detections are available.
+        """
+        hash_value, texture, samples = _difference_hash(array)
+        if texture < self._cache_min_texture:
+            return None, None, None
+        max_changes = self._motion_threshold * samples.size
+        with self._cache_lock:
+            for key, entry in self._cache.items():
+                if key[0] != array.shape or entry[1] >= self._cache_refresh:
+                    continue
+                if bin(key[1] ^ hash_value).count('1') > \
+                        self._hamming_threshold:
+                    continue
+                changes = np.count_nonzero(np.abs(samples - entry[2]) >
+                                           self._cache_motion_delta)
+                if changes > max_changes:
+                    continue  # motion
+                entry[1] += 1
+                self._cache.move_to_end(key)
+                return key, samples, copy_module.deepcopy(entry[0])
+        return (array.shape, hash_value), samples, None
+
+    def _cache_store(self, key: Any, samples: np.ndarray,
+                     detections: Detections) -> None:
+        """Store detections in the detection cache.
+        """
+        with self._cache_lock:
+            self._cache[key] = [copy_module.deepcopy(detections), 0, samples]
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Clear the detection cache.
+        """
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.clear()
+
     #
     # Detector
     #
@@ -42,17 +213,16 @@ class Detector(Tool):
         """
         return self._detect(data, **kwargs)
 
-    # FIXME[todo]: working on batches (data.is_batch). Here arises the
-    #   question what the result type should be for the functional API
-    #   (A): a list/tuple or some iterator, or even another structure
-    #   (a batch version of Metadata)
+    # FIXME[question]: for batches (data.is_batch) we currently return
+    #   a list of detections. Another structure (a batch version of
+    #   Metadata) may be more appropriate.
     def detect(self, data: Data, **kwargs) -> Detections:
         """Preprocess the given data and apply the detector.
 
         This method is intended for synchronous use - it dose neither
-        alter the `data` object, nor the detector itself. Depending
-        on the detector, it may be possible to run the method multiple
-        times in parallel.
+        alter the `data` object, nor the detector itself (except for
+        the detection cache, if enabled). Depending on the detector,
+        it may be possible to run the method multiple times in parallel.
 
         Arguments
         ---------
@@ -63,27 +233,38 @@ class Detector(Tool):
         Result
         ------
         detection: Detections
-            The dections.
+            The dections.  If `data` is a batch, a list holding the
+            detections for each batch item.
         """
         if not self.prepared:  # FIXME[todo]: decorator @assert_prepared...
             raise RuntimeError("Running unprepared detector.")
 
-        # FIXME[todo/hack]: the following will data batches
-        # currently we simply flatten the batch, taking the first item.
-        # The correct approach would be to really do detection on
-        # the whole batch
-        if data.is_batch:
-            raise ValueError("Detector currently does not support "
-                             "batch detection.")
-
         LOG.info("Running detector '%s' on data %r", self.key, data)
 
+        if data.is_batch:
+            preprocessed_data = [self._preprocess_item(item) for item in data]
+            detections = []
+            for start in range(0, len(data), self._batch_size):
+                end = start + self._batch_size
+                detections.extend(self._detect_batch(preprocessed_data
+                                                     [start:end], **kwargs))
+            return [self._adapt_detections(detection, item)
+                    for detection, item in zip(detections, data)]
+
         if not data:
             return None
 
+        cache_key = None
+        if self._cache is not None and isinstance(data.array, np.ndarray):
+            cache_key, samples, detections = \
+                self._cache_lookup(data.array)
+            if detections is not None:
+                LOG.debug("Detector '%s': using cached detections",
+                          self.key)
+                return detections
+
         # obtain the preprocessed input data
-        preprocessed_data = self.preprocess(data)
-        print("detect:", type(data), type(preprocessed_data))
+        preprocessed_data = self._preprocess_item(data)
 
         # do the actual processing
         detections = self._detect(preprocessed_data, **kwargs)
@@ -92,8 +273,113 @@ class Detector(Tool):
 
         detections = self._adapt_detections(detections, data)
 
+        if cache_key is not None:
+            self._cache_store(cache_key, samples, detections)
         return detections
 
+    def detect_stream(self, inputs: Iterable[Data], queue_size: int = 2,
+                      **kwargs) -> Iterator[Detections]:
+        """Apply the detector to a stream of data (e.g., the frames
+        of a video).  Processing is pipelined: while the detector
+        processes one datum, the next datum is preprocessed in a
+        background thread, and the detections of the previous datum
+        are postprocessed (and consumed) in the calling thread.
+
+        Arguments
+        ---------
+        inputs:
+            The data to be fed to the detector.
+        queue_size:
+            The maximal number of data waiting between two stages
+            of the pipeline.
+
+        Result
+        ------
+        detections:
+            The detections for each datum, in the order of the inputs.
+        """
+        if not self.prepared:
+            raise RuntimeError("Running unprepared detector.")
+
+        preprocessed = queue.Queue(maxsize=queue_size)
+        detected = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        end = object()  # sentinel marking the end of the stream
+
+        def put(target: queue.Queue, item) -> bool:
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def get(source: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            return end
+
+        def preprocessor() -> None:
+            try:
+                for data in inputs:
+                    item = (data,
+                            self._preprocess_item(data) if data else None)
+                    if not put(preprocessed, item):
+                        return
+            except BaseException as error:  # pylint: disable=broad-except
+                put(preprocessed, error)  # re-raised by the consumer
+            else:
+                put(preprocessed, end)
+
+        def detector() -> None:
+            while True:
+                item = get(preprocessed)
+                if item is end or isinstance(item, BaseException):
+                    put(detected, item)
+                    return
+                data, preprocessed_data = item
+                try:
+                    detections = (None if preprocessed_data is None else
+                                  self._detect(preprocessed_data, **kwargs))
+                except BaseException as error:  # pylint: disable=broad-except
+                    put(detected, error)  # re-raised by the consumer
+                    return
+                if not put(detected, (data, detections)):
+                    return
+
+        threads = [threading.Thread(target=preprocessor, daemon=True,
+                                    name='detector-preprocess'),
+                   threading.Thread(target=detector, daemon=True,
+                                    name='detector-detect')]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = detected.get()
+                if item is end:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                data, detections = item
+                yield (None if detections is None else
+                       self._adapt_detections(detections, data))
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _preprocess_item(self, data: Data) -> Any:
+        """Preprocess a single datum (not a batch), providing the
+        input for :py:meth:`_detect`.  The base implementation simply
+        provides the data array. Subclasses may overwrite this to
+        apply detector specific preprocessing.
+        """
+        return data.array
+
     def _detect(self, data: np.ndarray, **kwargs) -> Detections:
         """Do the actual detection.
 
@@ -105,11 +391,25 @@ class Detector(Tool):
                                   type(self).__name__ +
                                   "' is not implemented (yet).")
 
-    def _detect_batch(self, data: np.ndarray, **kwargs) -> Detections:
-        # FIXME[todo]: batch processing
-        raise NotImplementedError("Detector class '" +
-                                  type(self).__name__ +
-                                  "' is not implemented (yet).")
+    def _detect_batch(self, data: np.ndarray,
+                      **kwargs) -> List[Detections]:
+        """Do the actual detection on a batch of data.  The base
+        implementation just applies :py:meth:`_detect` to each batch
+        item individually. Subclasses may overwrite this to run
+        their model only once on the whole batch.
+
+        Arguments
+        ---------
+        data:
+            A sequence of preprocessed data items (at most `batch_size`),
+            as obtained by :py:meth:`_preprocess_item`.
+
+        Result
+        ------
+        detections:
+            A list containing the detections for each batch item.
+        """
+        return [self._detect(item, **kwargs) for item in data]
 
     def _adapt_detections(self, detections: Detections,
                           data: Data) -> Detections:
@@ -141,6 +441,16 @@ class Detector(Tool):
         self.set_data_attribute(data, 'detections', detections)
         LOG.debug("Detections found 2: %s, %s", self.detections(data), data)
 
+    def _process_batch(self, batch: Data, **kwargs) -> None:
+        """Process a batch of data. All batch items are passed to
+        the detector at once, and the detections of each item are
+        stored in its `'detections'` attribute.
+        """
+        LOG.debug("Processing batch %r with detector %s", batch, self)
+        for index, detections in enumerate(self.detect(batch)):
+            self.set_data_attribute(batch, 'detections', detections,
+                                    index=index)
+
     def detections(self, data) -> Metadata:
         """Provide the detections from a data object that was processed
         by this :py:class:`Detector`.
@@ -151,11 +461,18 @@ class Detector(Tool):
 class ImageDetector(Detector, ImageTool):
     # pylint: disable=too-many-ancestors
     """A detector to be applied to image data.
+
+    If an `nms_threshold` is given, non-maximum suppression is applied
+    to the detections: of bounding boxes overlapping by more than that
+    threshold (intersection over union), only the one with the highest
+    `'confidence'` is kept.
     """
 
-    def __init__(self, size: Tuple[int, int] = None, **kwargs) -> None:
+    def __init__(self, size: Tuple[int, int] = None,
+                 nms_threshold: float = None, **kwargs) -> None:
         super().__init__(**kwargs)
         self._size = size
+        self._nms_threshold = nms_threshold
 
     #
     # Implementation of the private API
@@ -198,6 +515,14 @@ class ImageDetector(Detector, ImageTool):
     # FIXME[old]:
     #
 
+    def _preprocess_item(self, data: Data) -> np.ndarray:
+        """Preprocess a single image, by applying the image
+        preprocessing of this tool (:py:meth:`_preprocess_image`)
+        to the image as `uint8` array.
+        """
+        return self._preprocess_image(Image.as_array(data.array,
+                                                     dtype=np.uint8))
+
     def _preprocess_old(self, array: np.ndarray, **kwargs) -> np.ndarray:
         """Preprocess the image. This will resize the image to the
         target size of this tool, if such a size is set.
@@ -218,6 +543,15 @@ class ImageDetector(Detector, ImageTool):
         if detections is None:
             return None
 
+        if self._nms_threshold is not None and detections:
+            boxes = detections.boxes
+            if boxes is not None:
+                scores = [getattr(region, 'confidence', 1.)
+                          for region in detections.regions]
+                detections.select_regions(
+                    non_maximum_suppression(boxes, scores,
+                                            self._nms_threshold))
+
         # if we have scaled the input data, then we have to apply reverse
         # scaling to the detections.
         if self._size is not None:
@@ -305,21 +639,69 @@ class ImageDetector(Detector, ImageTool):
         copy: bool
             A flag indicating if detections should be marked in
             a copy of the image (`True`) or into the original
-            image object (`False`).
+            image object (`False`).  If there are no detections,
+            no copy is made, as the image is not modified.
 
         Result
         ------
         marked_image: np.ndarray
             An image in which the given detections are visually marked.
         """
-        array = Image.as_array(image, copy=copy)
         if detections is None:
-            detections = self.detect(array)
-        if detections:
-            for index, region in enumerate(detections.regions):
+            detections = self.detect(Image.as_array(image))
+        array = Image.as_array(image, copy=copy and bool(detections))
+        if not detections:
+            return array
+
+        boxes = detections.boxes
+        if boxes is None:
+            for region in detections.regions:
                 region.mark_image(array)
+            return array
+
+        # colors: interpolated according to the confidence (if available)
+        colors = np.empty((len(boxes), 3), dtype=np.uint8)
+        colors[:] = (0, 255, 0)
+        confidences = np.asarray([getattr(region, 'confidence', np.nan)
+                                  for region in detections.regions],
+                                 dtype=np.float64)
+        valid = ~np.isnan(confidences)
+        confidences = confidences[valid, np.newaxis].clip(0., 1.)
+        colors[valid] = ((1-confidences) * Region.color_min_confidence +
+                         confidences * Region.color_max_confidence)
+        self.mark_boxes_in_image(array, boxes, colors)
         return array
 
+    @staticmethod
+    def mark_boxes_in_image(image: np.ndarray, boxes: np.ndarray,
+                            colors: np.ndarray) -> None:
+        """Draw bounding boxes into an image (in place).  The result
+        is the same as marking each :py:class:`BoundingBox`
+        individually, but each box is drawn by four slice assignments.
+
+        Arguments
+        ---------
+        image:
+            The image into which the boxes are drawn.
+        boxes:
+            An array of shape (N, 4), each row holding the coordinates
+            `(x1, y1, x2, y2)` of a box.
+        colors:
+            An array of shape (N, 3), holding the color for each box.
+        """
+        height, width = image.shape[:2]
+        thickness = max(1, max(width, height)//300)
+        inner, outer = thickness//2, (thickness+1)//2
+        boxes = boxes.astype(np.int64)
+        boxes[:, :2] = np.maximum(boxes[:, :2], outer)
+        boxes[:, 2] = np.minimum(boxes[:, 2], width - inner)
+        boxes[:, 3] = np.minimum(boxes[:, 3], height - inner)
+        for (x1, y1, x2, y2), color in zip(boxes, colors):
+            image[y1-outer:y1+inner, x1:x2] = color
+            image[y2-outer:y2+inner, x1:x2] = color
+            image[y1:y2, x1-outer:x1+inner] = color
+            image[y1:y2, x2-outer:x2+inner] = color
+
     def mark_data(self, data: Data, detections: Detections = None) -> None:
         """Extend the given `Data` image object by a tool specific attribute,
         called `marked`, holding a copy of the original image in which
@@ -380,10 +762,62 @@ class ImageDetector(Detector, ImageTool):
             An list of extracted image regions.
         """
         array = Image.as_array(image)
+        if not detections:
+            return []
+        boxes = detections.boxes
+        if boxes is None:
+            return [region.location.extract(array, copy=copy)
+                    for region in detections.regions]
+        return list(self.extract_boxes_from_image(array, boxes, copy=copy))
+
+    @staticmethod
+    def extract_boxes_from_image(image: np.ndarray, boxes: np.ndarray,
+                                 copy: bool = True
+                                 ) -> Union[np.ndarray, List[np.ndarray]]:
+        """Extract a collection of bounding boxes from an image.
+
+        Arguments
+        ---------
+        image:
+            The image from which the boxes are to be extracted.
+        boxes:
+            An array of shape (N, 4), each row holding the coordinates
+            `(x1, y1, x2, y2)` of a bounding box.
+        copy:
+            A flag indicating if the extracted patches should be copies
+            (`True`) or views into the original image (`False`).
+            Boxes extending beyond the image are always copied
+            (and padded with zeros).
+
+        Result
+        ------
+        extractions:
+            If all boxes lie inside the image, have the same size,
+            and `copy` is `True`, a single contiguous array of shape
+            (N, height, width[, channels]), obtained by one indexing
+            operation.  Otherwise a list of extracted patches.
+        """
+        boxes = np.asarray(boxes).astype(np.int64)
+        height, width = image.shape[:2]
+        sizes = boxes[:, 2:] - boxes[:, :2]
+        inside = ((boxes[:, :2] >= 0).all(axis=1) &
+                  (boxes[:, 2] <= width) & (boxes[:, 3] <= height))
+
+        if copy and len(boxes) > 0 and inside.all() and \
+                (sizes == sizes[0]).all():
+            box_width, box_height = sizes[0]
+            rows = boxes[:, 1, np.newaxis] + np.arange(box_height)
+            columns = boxes[:, 0, np.newaxis] + np.arange(box_width)
+            return image[rows[:, :, np.newaxis], columns[:, np.newaxis, :]]
+
         extractions = []
-        if detections:
-            for region in detections.regions:
-                extractions.append(region.location.extract(array, copy=copy))
+        for (x1, y1, x2, y2), valid in zip(boxes, inside):
+            if valid:
+                patch = image[y1:y2, x1:x2]
+                extractions.append(patch.copy() if copy else patch)
+            else:
+                extractions.append(BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2).
+                                   extract(image, copy=copy))
         return extractions
 
     def extract_data(self, data: Data,
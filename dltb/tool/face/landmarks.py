@@ -8,6 +8,7 @@ from ...base.image import Landmarks
 
 
 class FacialLandmarks(Landmarks):
+    __slots__ = ()
 
     def eyes(self):
         raise NotImplementedError()
@@ -17,8 +18,7 @@ class FacialLandmarks(Landmarks):
 
 
 class FacialLandmarks68(FacialLandmarks):
-
-    pass
+    __slots__ = ()
 
 
 class Detector(BaseDetector):
@@ -169,13 +169,20 @@ class HighscoreGroupNumpy(HighscoreGroup):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
+        # The highscores are stored in the first half of buffers of
+        # twice the highscore length, the second half is used for
+        # merging new values (see :py:meth:`update`).
         # owners: (size, top) or (size, top, owner_dimensions)
-        owners_shape = (self.size, len(self))
+        owners_shape = (self.size, 2 * len(self))
         if self.owner_dimensions is not None:
             owners_shape += (self.owner_dimensions, )
-        self._owners = np.full(owners_shape, -1, np.int)
+        # int32 owners halve the memory traffic when merging highscores
+        self._joint_owners = np.full(owners_shape, -1, np.int32)
+        self._owners = self._joint_owners[:, :len(self)]
         # scores: (size, top)
-        self._scores = np.full((self.size, len(self)), np.NINF, np.float32)
+        self._joint_scores = \
+            np.full((self.size, 2 * len(self)), np.NINF, np.float32)
+        self._scores = self._joint_scores[:, :len(self)]
 
     def scores(self, index: int) -> Sequence[Score]:
         """The score values of the group member with the given `index`.
@@ -258,7 +265,7 @@ class HighscoreGroupNumpy(HighscoreGroup):
             if owners is not None and owners.shape[1] == 1:
                 top_owners[:, :, 0] = owners[top_owners[:, :, 0]]
 
-        elif top > len(self):  # consider only new top scores
+        elif len(scores) > len(self):  # consider only new top scores
             # top_indices: (group_size, top)
             top_indices = nphelper.argmultimax(scores, num=top, axis=0).T
 
@@ -273,13 +280,17 @@ class HighscoreGroupNumpy(HighscoreGroup):
             top_scores = scores.T
             # top_owners:
             #   (top, owner_dimensions) -> (size, top, owner_dimensions)
-            top_owners = owners[np.newaxis].repeat(self.size, axis=0)
+            top_owners = np.broadcast_to(owners, (self.size,) + owners.shape)
 
         #
-        # 2. join current and new scores
+        # 2. join current and new scores (by writing the new scores
+        #    behind the current ones - at most len(self) new scores)
         #
-        joint_owners = np.append(self._owners, top_owners, axis=1)
-        joint_scores = np.append(self._scores, top_scores, axis=1)
+        end = len(self) + top_scores.shape[1]
+        joint_owners = self._joint_owners[:, :end]
+        joint_scores = self._joint_scores[:, :end]
+        joint_owners[:, len(self):] = top_owners
+        joint_scores[:, len(self):] = top_scores
 
         #
         # 3. get new top elements from joint scores
@@ -287,8 +298,9 @@ class HighscoreGroupNumpy(HighscoreGroup):
         indices = \
             nphelper.argmultimax(joint_scores, len(self), axis=1, sort=True)
         self._scores[:] = np.take_along_axis(joint_scores, indices, axis=1)
-        for member in range(self.size):
-            self._owners[member] = joint_owners[member, indices[member]]
+        if joint_owners.ndim > 2:  # (size, top) -> (size, top, 1)
+            indices = indices[:, :, np.newaxis]
+        self._owners[:] = np.take_along_axis(joint_owners, indices, axis=1)
 
     def store(self, outfile: BinaryIO) -> None:
         """Store the current state of this :py:class:`HighscoreGroup`.
@@ -300,5 +312,5 @@ class HighscoreGroupNumpy(HighscoreGroup):
         """Restore the state of this :py:class:`HighscoreGroup` from
         a file like object.
         """
-        self._owners = np.load(infile)
-        self._scores = np.load(infile)
+        self._owners[:] = np.load(infile)
+        self._scores[:] = np.load(infile)
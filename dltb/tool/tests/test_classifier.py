@@ -0,0 +1,91 @@
+"""Tests for the :py:class:`ClassScheme` class.
+"""
+
+# standard imports
+from unittest import TestCase
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from dltb.tool.classifier import ClassScheme
+
+
+class TestClassScheme(TestCase):
+    """Tests for the :py:class:`ClassScheme` class.
+    """
+
+    def setUp(self):
+        self.scheme = ClassScheme(5)
+
+    def test_one_hot_single(self):
+        """One-hot encoding of a single label.
+        """
+        one_hot = self.scheme.one_hot(2)
+        self.assertEqual(one_hot.shape, (5,))
+        self.assertEqual(one_hot.tolist(), [0, 0, 1, 0, 0])
+
+    def test_one_hot_batch(self):
+        """One-hot encoding of a batch of labels, including repeated
+        labels.
+        """
+        one_hot = self.scheme.one_hot([1, 3, 1], dtype=np.uint8)
+        self.assertEqual(one_hot.shape, (3, 5))
+        self.assertEqual(one_hot.dtype, np.uint8)
+        self.assertEqual(one_hot.argmax(axis=1).tolist(), [1, 3, 1])
+        self.assertEqual(one_hot.sum(), 3)
+
+    def test_one_hot_empty(self):
+        """An empty list of labels results in an empty array of
+        one-hot vectors.
+        """
+        one_hot = self.scheme.one_hot([])
+        self.assertEqual(one_hot.shape, (0, 5))
+
+    def test_lookup(self):
+        """Numerical labels and their reverse lookup for different
+        collection types.
+        """
+        self.scheme.add_labels([3, 1, 4, 0, 2], 'shuffled', lookup=True)
+        self.assertEqual(self.scheme.get_label([0, 2], name='shuffled'),
+                         [3, 4])
+        self.assertEqual(self.scheme.get_label((3, 4), lookup='shuffled'),
+                         (0, 2))
+        indices = self.scheme.get_label(np.asarray([1, 2]), name='shuffled')
+        self.assertIsInstance(indices, np.ndarray)
+        self.assertEqual(indices.tolist(), [1, 4])
+
+    def test_text_labels(self):
+        """Textual labels should be gathered for a batch of indices.
+        """
+        self.scheme.add_labels(['a', 'b', 'c', 'd', 'e'], 'text',
+                               lookup=True)
+        self.assertEqual(self.scheme.get_label(3, name='text'), 'd')
+        self.assertEqual(self.scheme.get_label([4, 0], name='text'),
+                         ['e', 'a'])
+        texts = self.scheme.get_label(np.asarray([1, 1]), name='text')
+        self.assertEqual(texts.tolist(), ['b', 'b'])
+        self.assertEqual(self.scheme.get_label(['c', 'e'], lookup='text'),
+                         [2, 4])
+
+    def test_sparse_lookup(self):
+        """Reverse lookup for sparse numerical labels.
+        """
+        self.scheme.add_labels([100, 7, 3000, 42, 5], 'sparse', lookup=True)
+        self.assertEqual(self.scheme.get_label(3000, lookup='sparse'), 2)
+        self.assertEqual(self.scheme.get_label([5, 100], lookup='sparse'),
+                         [4, 0])
+        indices = self.scheme.get_label(np.asarray([42, 7]), lookup='sparse')
+        self.assertEqual(indices.tolist(), [3, 1])
+        self.assertRaises(KeyError, self.scheme.get_label, 8,
+                          lookup='sparse')
+
+    def test_empty_labels(self):
+        """Looking up an empty collection of labels.
+        """
+        self.scheme.add_labels(['a', 'b', 'c', 'd', 'e'], 'text')
+        self.assertEqual(self.scheme.get_label([], name='text'), [])
+        texts = self.scheme.get_label(np.asarray([], dtype=int), name='text')
+        self.assertEqual(texts.shape, (0,))
+        self.scheme.add_labels([100, 7, 3000, 42, 5], 'sparse', lookup=True)
+        self.assertEqual(self.scheme.get_label([], lookup='sparse'), [])
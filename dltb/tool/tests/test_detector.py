@@ -0,0 +1,214 @@
+"""Tests for the :py:class:`Detector` and :py:class:`ImageDetector`.
+"""
+
+# standard imports
+from unittest import TestCase
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from dltb.base.data import Data
+from dltb.base.meta import Metadata
+from dltb.base.image import BoundingBox
+from dltb.tool.detector import Detector, ImageDetector
+from dltb.tool.detector import non_maximum_suppression, _difference_hash
+
+
+class TestImageDetector(TestCase):
+    """Tests for the :py:class:`ImageDetector`.
+    """
+
+    image = np.arange(10 * 12 * 3, dtype=np.uint8).reshape(10, 12, 3)
+
+    def test_extract_boxes_01(self):
+        """Boxes of equal size inside the image are extracted
+        into a single array.
+        """
+        boxes = np.asarray([[0, 0, 4, 3], [5, 2, 9, 5], [8, 7, 12, 10]])
+        extractions = \
+            ImageDetector.extract_boxes_from_image(self.image, boxes)
+        self.assertEqual(extractions.shape, (3, 3, 4, 3))
+        for (x1, y1, x2, y2), patch in zip(boxes, extractions):
+            self.assertTrue(np.array_equal(patch, self.image[y1:y2, x1:x2]))
+
+    def test_extract_boxes_02(self):
+        """Boxes extending beyond the image are padded.
+        """
+        boxes = np.asarray([[2, 2, 5, 4], [-1, 8, 3, 12]])
+        extractions = \
+            ImageDetector.extract_boxes_from_image(self.image, boxes)
+        self.assertEqual(len(extractions), 2)
+        self.assertTrue(np.array_equal(extractions[0],
+                                       self.image[2:4, 2:5]))
+        expected = BoundingBox(x1=-1, y1=8, x2=3, y2=12).extract(self.image)
+        self.assertEqual(extractions[1].shape, (4, 4, 3))
+        self.assertTrue(np.array_equal(extractions[1], expected))
+
+    def test_non_maximum_suppression(self):
+        """Overlapping boxes with lower scores should be suppressed.
+        """
+        boxes = np.asarray([[0, 0, 10, 10], [1, 1, 11, 11],
+                            [20, 20, 30, 30], [0, 0, 10, 5]])
+        scores = np.asarray([.8, .9, .7, .6])
+        keep = non_maximum_suppression(boxes, scores, iou_threshold=.5)
+        self.assertEqual(list(keep), [1, 2, 3])
+        keep = non_maximum_suppression(boxes, scores, iou_threshold=.3)
+        self.assertEqual(list(keep), [1, 2])
+
+    def test_mark_image(self):
+        """Marking all boxes at once should give the same result
+        as marking the regions individually.
+        """
+        image = np.zeros((600, 700, 3), dtype=np.uint8)
+        detections = Metadata()
+        detections.add_region(BoundingBox(x1=-5, y1=10, x2=50, y2=80),
+                              confidence=.3)
+        detections.add_region(BoundingBox(x1=100, y1=200, x2=699, y2=599))
+        expected = image.copy()
+        for region in detections.regions:
+            region.mark_image(expected)
+        detector = ImageDetector()
+        marked = detector.mark_image(image, detections)
+        self.assertFalse(marked is image)
+        self.assertTrue(np.array_equal(marked, expected))
+        self.assertIs(detector.mark_image(image, Metadata()), image)
+
+    def test_extract_boxes_03(self):
+        """Without copying, views into the image are returned.
+        """
+        boxes = np.asarray([[1, 1, 3, 3], [4, 4, 6, 6]])
+        extractions = ImageDetector.\
+            extract_boxes_from_image(self.image, boxes, copy=False)
+        for patch in extractions:
+            self.assertTrue(np.shares_memory(patch, self.image))
+
+
+class CountingDetector(Detector):
+    """A dummy detector counting its invocations.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.calls = 0
+
+    def _detect(self, data: np.ndarray, **kwargs) -> Metadata:
+        self.calls += 1
+        detections = Metadata()
+        detections.add_region(BoundingBox(x1=1, y1=2, x2=3, y2=4))
+        return detections
+
+    def _adapt_detections(self, detections: Metadata,
+                          data: Data) -> Metadata:
+        return detections
+
+
+class TestDetectorCache(TestCase):
+    """Tests for the detection cache of the :py:class:`Detector`.
+    """
+
+    image = (np.random.RandomState(0).rand(64, 72, 3) * 255).astype(np.uint8)
+
+    def test_cache_01(self):
+        """Detections for (almost) identical inputs should be reused.
+        """
+        detector = CountingDetector(enable_cache=True, cache_refresh=2)
+        detector.detect(Data(self.image))
+        detections = detector.detect(Data(self.image))
+        self.assertEqual(detector.calls, 1)
+        self.assertTrue(np.array_equal(detections.boxes, [[1, 2, 3, 4]]))
+        detector.detect(Data(self.image))
+        detector.detect(Data(self.image))
+        self.assertEqual(detector.calls, 2)  # refreshed
+
+    def test_cache_02(self):
+        """Different inputs should not use the cache.
+        """
+        detector = CountingDetector(enable_cache=True)
+        detector.detect(Data(self.image))
+        detector.detect(Data(self.image[::-1]))
+        detector.detect(Data(np.zeros_like(self.image)))
+        detector.detect(Data(np.zeros_like(self.image)))
+        self.assertEqual(detector.calls, 4)
+
+    def test_cache_03(self):
+        """A small moving object should invalidate the cached detections,
+        even if the hash of the input is (almost) unchanged.
+        """
+        moved = self.image.copy()
+        moved[20:26, 30:36] = 255
+        distance = bin(_difference_hash(self.image)[0] ^
+                       _difference_hash(moved)[0]).count('1')
+        self.assertLessEqual(distance, 4)
+        detector = CountingDetector(enable_cache=True)
+        detector.detect(Data(self.image))
+        detector.detect(Data(moved))
+        self.assertEqual(detector.calls, 2)
+        detector.detect(Data(moved))
+        self.assertEqual(detector.calls, 2)
+
+
+class TestDetectorStream(TestCase):
+    """Tests for the pipelined :py:meth:`Detector.detect_stream`.
+    """
+
+    @staticmethod
+    def frames(count: int, fail: int = None):
+        """Generate (uniform) frames, frame `i` having value `i`.
+        """
+        for index in range(count):
+            if index == fail:
+                raise ValueError("Broken frame")
+            yield Data(np.full((4, 4), index, dtype=np.uint8))
+
+    def test_stream_01(self):
+        """Detections should be provided in order.
+        """
+        detector = CountingDetector()
+        detector._detect = lambda data: Metadata(label=int(data[0, 0]))
+        labels = [detections.label for detections
+                  in detector.detect_stream(self.frames(10))]
+        self.assertEqual(labels, list(range(10)))
+
+    def test_stream_02(self):
+        """Errors in the input stream should be passed to the consumer.
+        """
+        detector = CountingDetector()
+        detections = detector.detect_stream(self.frames(10, fail=5))
+        with self.assertRaises(ValueError):
+            for _ in detections:
+                pass
+        self.assertEqual(detector.calls, 5)
+
+
+class TestDetectorBatch(TestCase):
+    """Tests for batch detection with :py:meth:`Detector.detect`.
+    """
+
+    def test_batch_01(self):
+        """Batches are processed in chunks of at most `batch_size`
+        items, providing detections for each item.
+        """
+        batch = Data(np.zeros((5, 4, 4), dtype=np.uint8), batch=True)
+        detector = CountingDetector(batch_size=2)
+        detections = detector.detect(batch)
+        self.assertEqual(len(detections), 5)
+        self.assertEqual(detector.calls, 5)
+
+    def test_image_detector_01(self):
+        """An :py:class:`ImageDetector` receives the preprocessed image.
+        """
+        class ShapeDetector(ImageDetector):
+            """Report the shape of the detector input as label.
+            """
+            def _detect(self, image: np.ndarray, **kwargs) -> Metadata:
+                return Metadata(label=(image.shape, image.dtype))
+
+        image = np.zeros((6, 8, 3), dtype=np.float32)
+        detector = ShapeDetector()
+        self.assertEqual(detector.detect(Data(image)).label,
+                         ((6, 8, 3), np.uint8))
+        batch = Data(np.stack((image, image)), batch=True)
+        self.assertEqual([detections.label for detections
+                          in detector.detect(batch)],
+                         [((6, 8, 3), np.uint8)] * 2)
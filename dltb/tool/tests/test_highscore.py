@@ -3,6 +3,7 @@
 
 # standard imports
 from unittest import TestCase
+import io
 
 # third party imports
 import numpy as np
@@ -87,3 +88,37 @@ class TestHighscore(TestCase):
         self.assertEqual(highscore_group[0].scores[0], scores2[2, 0])
         self.assertEqual(highscore_group[2].scores.tolist(),
                          [37, 36, 35, 34, 33])
+
+    def test_highscore_group_numpy_update3(self):
+        """Test updating a :py:class:`HighscoreGroupNumpy` with more
+        new scores than fit into the highscore.
+        """
+        highscore_group = HighscoreGroupNumpy(top=3, size=2)
+        owners = np.arange(7)
+        scores = np.asarray([(5, 1), (3, 9), (7, 2), (1, 8),
+                             (6, 4), (2, 7), (4, 3)], np.float32)
+        highscore_group.update(owners, scores)
+        self.assertEqual(highscore_group[0].scores.tolist(), [7, 6, 5])
+        self.assertEqual(highscore_group[0].owners.tolist(), [2, 4, 0])
+        self.assertEqual(highscore_group[1].scores.tolist(), [9, 8, 7])
+        self.assertEqual(highscore_group[1].owners.tolist(), [1, 3, 5])
+
+    def test_highscore_group_numpy_store(self):
+        """Test storing and restoring a :py:class:`HighscoreGroupNumpy`.
+        """
+        highscore_group = HighscoreGroupNumpy(top=3, size=2)
+        highscore_group.update(np.arange(4),
+                               np.asarray([(5, 1), (3, 9), (7, 2), (1, 8)],
+                                          np.float32))
+        outfile = io.BytesIO()
+        highscore_group.store(outfile)
+        outfile.seek(0)
+        restored = HighscoreGroupNumpy(top=3, size=2)
+        restored.restore(outfile)
+        self.assertEqual(restored[1].scores.tolist(), [9, 8, 2])
+        self.assertEqual(restored[1].owners.tolist(), [1, 3, 2])
+
+        # further updates work on the restored highscores
+        restored.update(np.asarray([4]), np.asarray([(6, 0)], np.float32))
+        self.assertEqual(restored[0].scores.tolist(), [7, 6, 5])
+        self.assertEqual(restored[0].owners.tolist(), [2, 4, 0])
@@ -33,7 +33,9 @@ DATA_FORMAT_CHANNELS_LAST = 'NHWC'
 def adapt_data_format(array_or_shape: Union[np.ndarray, Tuple[int]],
                       input_format: str = None, output_format: str = None,
                       add_batch: bool = False, remove_batch: bool = False,
-                      batch: bool = None) -> Union[np.ndarray, Tuple[int]]:
+                      batch: bool = None,
+                      contiguous: bool = False
+                      ) -> Union[np.ndarray, Tuple[int]]:
     """Convert channel first to channel last format or vice versa.
 
 
@@ -62,6 +64,12 @@ def adapt_data_format(array_or_shape: Union[np.ndarray, Tuple[int]],
         no value is given, it is assumed that a batch dimension
         is present.
 
+    contiguous: bool
+        A flag indicating that a converted array should be returned
+        as C-contiguous array (obtained by a single copy), instead of
+        a view with permuted strides.  This is advisable if the result
+        is accessed repeatedly.
+
     Returns
     -------
     The converted numpy array.
@@ -135,4 +143,7 @@ def adapt_data_format(array_or_shape: Union[np.ndarray, Tuple[int]],
         else: # isinstance(array_or_shape, tuple):
             array_or_shape = array_or_shape[1:]
 
+    if contiguous and isinstance(array_or_shape, np.ndarray):
+        array_or_shape = np.ascontiguousarray(array_or_shape)
+
     return array_or_shape
@@ -20,6 +20,9 @@ _writer: ImageWriter = None
 _display: ImageDisplay = None
 _resizer: ImageResizer = None
 
+# random number generator for creating random images
+_rng = np.random.default_rng()
+
 
 def imread(filename: str, module: Union[str, List[str]] = None,
            **kwargs) -> np.ndarray:
@@ -170,7 +173,7 @@ def imimport(img: Union[np.ndarray, str], dtype=np.uint8,
         if size is None:
             raise ValueError("No size was specified when importing None image")
         if none == 'random':
-            img = np.random.randint(0, 256, size, dtype=np.uint8)
+            img = _rng.integers(0, 256, size, dtype=np.uint8)
     raise TypeError(f"Cannot import image of type {type(img)}")
 
 
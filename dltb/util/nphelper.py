@@ -30,9 +30,11 @@ def multimin(array: np.ndarray, num: int = 1, axis: int = None,
     values:
         The `num` smallest values in this array.
     """
-    num = min(num, array.size if axis is None else array.shape[axis])
-    min_unsorted = np.partition(array, num, axis=axis) \
-        if num < array.shape[axis] else array
+    size = array.size if axis is None else array.shape[axis]
+    num = min(num, size)
+    # partitioning at kth=num-1 puts the num smallest values first
+    min_unsorted = np.partition(array, num-1, axis=axis) \
+        if num < size else array
     # FIXME[hack]: special treatment in case of axis == 1 should be
     # avoided or should be made more general; currently does not covers
     # axis is None and axis == 0!
@@ -78,11 +80,12 @@ def argmultimin(array: np.ndarray, num: int = 1, axis: int = None,
     if size == 1:
         return np.zeros(array.shape, dtype=np.int)
     num = min(num, size)
-    if num < size:  # np.arpartition requires num < array.shape[axis]
-        min_indices_unsorted = np.argpartition(array, num, axis=axis)
-    else:  # hack: artificially create full index array
-        min_indices_unsorted = \
-            np.meshgrid(*[np.arange(x) for x in array.shape])[axis].T
+    if num == 1:  # no partitioning (and sorting) required
+        return np.expand_dims(np.argmin(array, axis=axis),
+                              0 if axis is None else axis)
+    # partitioning at kth=num-1 puts the indices of the num smallest
+    # values first (this also works for num == size)
+    min_indices_unsorted = np.argpartition(array, num-1, axis=axis)
     # FIXME[hack]: special treatment in case of axis == 1 should be
     # avoided or should be made more general; not axis covers
     # axis is None and axis == 0
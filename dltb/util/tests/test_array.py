@@ -0,0 +1,40 @@
+"""Tests for the :py:mod:`dltb.util.array` module.
+"""
+
+# standard imports
+from unittest import TestCase
+
+# third party imports
+import numpy as np
+
+# toolbox imports
+from dltb.util.array import adapt_data_format
+from dltb.util.array import DATA_FORMAT_CHANNELS_FIRST
+from dltb.util.array import DATA_FORMAT_CHANNELS_LAST
+
+
+class ArrayTest(TestCase):
+    """Tests for the :py:mod:`dltb.util.array` module.
+    """
+
+    def test_adapt_data_format(self) -> None:
+        array = np.arange(2 * 3 * 4 * 5).reshape(2, 3, 4, 5)
+        result = adapt_data_format(array,
+                                   input_format=DATA_FORMAT_CHANNELS_FIRST,
+                                   output_format=DATA_FORMAT_CHANNELS_LAST)
+        self.assertEqual(result.shape, (2, 4, 5, 3))
+        self.assertFalse(result.flags.c_contiguous)
+        self.assertTrue(np.shares_memory(result, array))
+
+        contiguous = \
+            adapt_data_format(array, input_format=DATA_FORMAT_CHANNELS_FIRST,
+                              output_format=DATA_FORMAT_CHANNELS_LAST,
+                              contiguous=True)
+        self.assertTrue(contiguous.flags.c_contiguous)
+        self.assertTrue(np.array_equal(contiguous, result))
+
+        shape = adapt_data_format((2, 3, 4, 5),
+                                  input_format=DATA_FORMAT_CHANNELS_FIRST,
+                                  output_format=DATA_FORMAT_CHANNELS_LAST,
+                                  contiguous=True)
+        self.assertEqual(shape, (2, 4, 5, 3))
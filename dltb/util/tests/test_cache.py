@@ -0,0 +1,38 @@
+# standard imports
+from unittest import TestCase
+import os
+import tempfile
+
+# toolbox imports
+from dltb.util import (read_cache, write_cache,
+                       read_cache_lines, write_cache_lines)
+
+
+class CacheTest(TestCase):
+    """Tests for the cache functions of the :py:mod:`dltb.util` module.
+    """
+
+    def setUp(self) -> None:
+        self._directory = tempfile.TemporaryDirectory()
+        self._cache = os.path.join(self._directory.name, 'cache.p')
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+
+    def test_lines(self) -> None:
+        lines = ['n01440764/n01440764_3421.JPEG', 'a/b.png', 'ä.jpg']
+        write_cache_lines(self._cache, lines)
+        self.assertEqual(read_cache_lines(self._cache), lines)
+
+    def test_empty_lines(self) -> None:
+        write_cache_lines(self._cache, [])
+        self.assertEqual(read_cache_lines(self._cache), [])
+
+    def test_pickled_lines(self) -> None:
+        lines = ['a.jpg', 'b.jpg']
+        write_cache(self._cache, lines)
+        self.assertEqual(read_cache(self._cache), lines)
+        self.assertEqual(read_cache_lines(self._cache), lines)
+
+    def test_missing(self) -> None:
+        self.assertIsNone(read_cache_lines(self._cache))
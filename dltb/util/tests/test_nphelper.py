@@ -72,3 +72,27 @@ class TestNPHelper(TestCase):
         top = -np.sort(-values, axis=1)
         top2 = nphelper.multimax(values, num=2, axis=1, sort=True)
         self.assertTrue(np.array_equal(top2, top[:, :2]))
+
+    def test_argmultimax_03(self):
+        """Test `nphelper.argmultimax` for top-1 and for all values.
+        """
+        values = np.asarray([
+            [4, 7, 3],
+            [2, 5, 1],
+            [8, 0, 7]
+        ], dtype=np.float32)
+
+        top1_indices = nphelper.argmultimax(values, num=1, axis=0)
+        self.assertEqual(top1_indices.tolist(), [[2, 0, 2]])
+        top1_indices = nphelper.argmultimax(values, num=1, axis=1)
+        self.assertEqual(top1_indices.tolist(), [[1], [1], [0]])
+        top1_indices = nphelper.argmultimax(values, num=1)
+        self.assertEqual(top1_indices.tolist(), [6])
+
+        top_indices = np.argsort(-values, axis=0)
+        all_indices = \
+            nphelper.argmultimax(values, num=3, axis=0, sort=True)
+        self.assertTrue(np.array_equal(all_indices, top_indices))
+        all_values = nphelper.multimax(values, num=3, axis=0, sort=True)
+        self.assertTrue(np.array_equal(all_values,
+                                       -np.sort(-values, axis=0)))
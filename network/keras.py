@@ -145,6 +145,8 @@ class Network(BaseNetwork):
         super().__init__(*args, **kwargs)
         self._model_file = model_file
         self._model = model
+        # activation functions for a tuple of layer ids
+        self._activation_functions = {}
 
     def _prepare(self) -> None:
         # Set learning phase to train in case setting to test would
@@ -168,6 +170,7 @@ class Network(BaseNetwork):
             self._model = keras.models.load_model(self._model_file)
 
     def _unprepare(self) -> None:
+        self._activation_functions.clear()
         if self._model_file is not None:
             self._model = None
         super()._unprepare()
@@ -361,15 +364,19 @@ class Network(BaseNetwork):
         Computes a list of activations from a list of layer ids.
         """
 
-        # input placeholder
-        inputs = [self._model.input, K.learning_phase()]
+        # activations function (built once for each list of layers)
+        key = tuple(layer_ids)
+        activations_functor = self._activation_functions.get(key)
+        if activations_functor is None:
+            # input placeholder
+            inputs = [self._model.input, K.learning_phase()]
 
-        # all layer outputs except first (input) layer
-        outputs = [self[layer]._keras_layer_objs[-1].output
-                   for layer in layer_ids]
+            # all layer outputs except first (input) layer
+            outputs = [self[layer]._keras_layer_objs[-1].output
+                       for layer in layer_ids]
 
-        # activations function
-        activations_functor = K.function(inputs, outputs)
+            activations_functor = K.function(inputs, outputs)
+            self._activation_functions[key] = activations_functor
 
         # do the actual computation (0.=training, 1.=predict)
         activations = activations_functor([input_samples, 1.])
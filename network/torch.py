@@ -960,9 +960,56 @@ class ImageNetwork(BaseImageNetwork, Network):
                                  std=[0.229, 0.224, 0.225]),
         ])
 
+        # Normalization constants for preprocessing on the device
+        # (including the scaling from [0, 255] to [0, 1]).
+        self._image_mean = torch.tensor([0.485, 0.456, 0.406],
+                                        device=self._device) * 255.
+        self._image_std = torch.tensor([0.229, 0.224, 0.225],
+                                       device=self._device) * 255.
+
+    def _image_to_device(self, image: Imagelike) -> torch.Tensor:
+        """Preprocess an image on the (CUDA) device.  The same steps
+        as in the `_preprocess_image` transformation (resize, center crop,
+        normalization) are performed, but only the raw (uint8) image
+        is copied to the device, instead of the preprocessed float
+        tensor.
+
+        The resizing does not apply antialiasing, and hence results may
+        slightly differ from the pillow based transformation.
+        """
+        array = Image.as_array(image, dtype=np.uint8)
+        if array.ndim == 2:
+            array = np.repeat(array[:, :, np.newaxis], 3, axis=2)
+        tensor = torch.from_numpy(np.ascontiguousarray(array))
+        # copying from pinned memory allows for asynchronous transfer
+        tensor = tensor.pin_memory().to(self._device, non_blocking=True)
+        tensor = tensor.permute(2, 0, 1).unsqueeze(0).float()
+
+        # resize (the shorter side to 256 pixels)
+        height, width = tensor.shape[-2:]
+        if height <= width:
+            size = (256, int(256 * width / height))
+        else:
+            size = (int(256 * height / width), 256)
+        tensor = torch.nn.functional.interpolate(tensor, size=size,
+                                                 mode='bilinear',
+                                                 align_corners=False)
+        # center crop (224x224)
+        top = int(round((size[0] - 224) / 2.))
+        left = int(round((size[1] - 224) / 2.))
+        tensor = tensor[:, :, top:top+224, left:left+224]
+
+        # normalize
+        tensor -= self._image_mean.view(1, 3, 1, 1)
+        tensor /= self._image_std.view(1, 3, 1, 1)
+        return tensor
+
     def image_to_internal(self, image: Imagelike) -> torch.Tensor:
         """Transform an image into a torch Tensor.
         """
+        if self._device.type == 'cuda':
+            return self._image_to_device(image)
+
         # the _preprocess_image function expects as input a PIL image!
         image = Image.as_pil(image)
 
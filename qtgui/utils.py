@@ -2,6 +2,7 @@
 from typing import Callable, Iterable, Dict
 import os
 import logging
+import threading
 
 # Qt imports
 from PyQt5.QtCore import Qt, QObject, QEvent, QThread, QThreadPool, QRunnable
@@ -726,7 +727,13 @@ class QObserver(QAttribute):
             of `None` means that the :py:class:`Observer` is interested
             in all changes.
         _change: Change
-            The unprocessed changes accumulated so far.
+            The unprocessed changes accumulated so far. This acts as
+            a dirty flag: as long as it is not `None`, an invocation
+            of :py:meth:`_qAsyncNotify` is pending and further
+            changes are merged instead of queuing new Qt events.
+        _change_lock: threading.Lock
+            A lock guarding `_change` and `_kwargs`, which are set by
+            the notifying thread and consumed by the Qt main thread.
         _notify: Callable[[Observable, Change], None]
             The method to call upon notification. This will
             usually be the specific notification method of the
@@ -745,6 +752,7 @@ class QObserver(QAttribute):
             self._interests = interests
             self._change = None  # accumulated changes
             self._kwargs = {}  # additional arguments provided on notification
+            self._change_lock = threading.Lock()
             self._notify = (observable.notify_method(observer)
                             if notify is None else notify)
 
@@ -807,12 +815,23 @@ class QObserver(QAttribute):
             """
             # LOG.debug("%s._qNotify: change=%s [%s]",
             #           self._observer, change, self._change)
-            if self._change is None:
-                # Currently, there is no change event pending for this
-                # object. So we will queue a new one and remember the
-                # change:
-                self._change = change
-                self._kwargs = kwargs
+            with self._change_lock:
+                pending = self._change is not None
+                if pending:
+                    # There is already one change pending in the event
+                    # loop. We will just update the change, but not
+                    # queue another event.
+                    self._change |= change
+                else:
+                    # Currently, there is no change event pending for
+                    # this object. So we will queue a new one and
+                    # remember the change (as a copy, as the change
+                    # object is shared with other observers and we
+                    # may add further changes to it):
+                    self._change = \
+                        None if change is None else type(change)(change)
+                    self._kwargs = kwargs
+            if not pending:
                 # This will use Qt.AutoConnection: the member is invoked
                 # synchronously if obj lives in the same thread as the caller;
                 # otherwise it will invoke the member asynchronously.
@@ -826,11 +845,6 @@ class QObserver(QAttribute):
                     #   RuntimeError: QMetaObject.invokeMethod() call failed
                 except Exception as ex:
                     handle_exception(ex)
-            else:
-                # There is already one change pending in the event loop.
-                # We will just update the change, but not queue another
-                # event.
-                self._change |= change
 
         @pyqtSlot(object)
         def _qAsyncNotify(self, observable: Observable):
@@ -845,12 +859,11 @@ class QObserver(QAttribute):
             """
             # print(f"%s._qAsyncNotify: notify=%s change=%s in thread %s",
             #       self._observer, self._notify, self._change, self.thread())
-            change = self._change
-            kwargs = self._kwargs
+            with self._change_lock:
+                change, kwargs = self._change, self._kwargs
+                self._change, self._kwargs = None, {}
             if change is not None:
                 try:
-                    self._change = None
-                    self._kwargs = {}
                     self._notify(observable, change, **kwargs)
                 except Exception as ex:
                     handle_exception(ex)
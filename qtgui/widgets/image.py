@@ -59,12 +59,17 @@ def imageToQImage(image: Imagelike) -> QImage:
         else:
             image = image[:, :, 0]
 
+    # QImage works on the memory buffer of the array, which hence has
+    # to be a contiguous array, not shared with other parties. A
+    # conversion to uint8 already provides such an array, otherwise
+    # we make a copy (but not both).
     if image.dtype != np.uint8:
         if image.max() < 2:
-            image = (image * 255).astype(np.uint8)
+            image = (image * 255).astype(np.uint8, order='C')
         else:
-            image = image.astype(np.uint8)
-    image = image.copy()
+            image = image.astype(np.uint8, order='C')
+    else:
+        image = image.copy()
 
     return QImage(image, image.shape[1], image.shape[0],
                   bytes_per_line, img_format)
@@ -371,18 +371,34 @@ class OldEngine(Worker, Toolbox.Observer, method='activation_changed',
         values = self._channel_adaptor(values)
         data.add_attribute(prefix + 'reshaped', values)
 
-        if values.shape[-1] == 3:  # RGB image
-            if issubclass(values.dtype.type, np.integer):
-                values = values.astype(np.float32) / 256.0
-
+        input_dtype = self._network.input_dtype
+        if (issubclass(input_dtype.type, np.integer) and
+                np.can_cast(values.dtype, input_dtype)):
+            # quantized network: normalization is part of the network
+            # (input quantization), so values are kept in the compact
+            # integer type
+            values = values.astype(input_dtype, copy=False)
+        elif values.shape[-1] == 3:  # RGB image
             # FIXME[hack]: all pretrained torch models use this
             # mean = [0.485, 0.456, 0.406]
             # std=[0.229, 0.224, 0.225]
             # normalize = transforms.Normalize(mean=mean, std=std),
             # this does: data |--> (data - mean) / std
-            mean = np.asarray([0.485, 0.456, 0.406])
-            std = np.asarray([0.229, 0.224, 0.225])
-            values = (values - mean) / std
+            mean = np.asarray([0.485, 0.456, 0.406], dtype=np.float32)
+            std = np.asarray([0.229, 0.224, 0.225], dtype=np.float32)
+            if issubclass(values.dtype.type, np.integer):
+                # integer values are scaled to [0,1) by dividing
+                # by 256, which is folded into mean and std
+                dtype = np.float32
+                mean *= 256.
+                std *= 256.
+            else:
+                dtype = np.result_type(values.dtype, np.float32)
+            # normalize in a single buffer: the (resized) input
+            # is read once and no further temporaries are created
+            normalized = np.subtract(values, mean, dtype=dtype)
+            normalized *= 1. / std
+            values = normalized
             # FIXME[todo]: this may be integrated into the Network ...
 
         data.add_attribute(prefix + 'preprocessed', values)